@@ -0,0 +1,80 @@
+"""
+Overhead of crash-safe saves.
+Compares the old in-place json.dump with the atomic temp-file + fsync +
+rename path (with and without a backup), and a single log append.
+
+Usage: python benchmarks/bench_atomic_save.py [--tasks N] [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_journal
+from core.fsutil import atomic_write, backup_file
+from core.oplog import append_log
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = synthetic_journal(args.tasks, n_notebooks=50, years=0, n_goals=0)
+    op = {"op": "task_set", "id": 1, "field": "status", "value": "X", "seq": 1}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal_data.json")
+        log = os.path.join(tmp, "journal_data.log")
+        backups = os.path.join(tmp, "backups")
+
+        def in_place():
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        def atomic(fsync: bool, keep: int):
+            def run():
+                content = json.dumps(data, indent=2, ensure_ascii=False)
+                backup_file(path, backups, keep)
+                atomic_write(path, content, fsync=fsync)
+
+            return run
+
+        in_place()
+        results = [
+            ("json.dump in place (old)", _time(in_place, args.repeat)),
+            ("atomic, no fsync", _time(atomic(False, 0), args.repeat)),
+            ("atomic + fsync", _time(atomic(True, 0), args.repeat)),
+            ("atomic + fsync + backup", _time(atomic(True, 5), args.repeat)),
+            ("log append", _time(lambda: append_log(log, [op]), args.repeat * 20)),
+            (
+                "log append + fsync",
+                _time(lambda: append_log(log, [op], fsync=True), args.repeat * 20),
+            ),
+        ]
+        size_mb = os.path.getsize(path) / 1_000_000
+
+    print(f"Snapshot: {args.tasks:,} tasks, {size_mb:.1f} MB")
+    for label, ms in results:
+        print(f"  {label:<28} {ms:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Snapshot codec throughput.
+Encodes and decodes a synthetic journal with every installed codec, indented
+and compact, through real files, and checks that each decodes to exactly the
+journal it was given.
+
+Usage: python benchmarks/bench_codec.py [--tasks N] [--repeat R]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_journal
+from core.codec import CODECS
+from core.fsutil import atomic_write
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = synthetic_journal(args.tasks)
+    print(f"Journal: {args.tasks:,} tasks (codecs installed: {', '.join(CODECS)})")
+    print(
+        f"  {'codec':<18} {'size MB':>8} {'save ms':>10} {'load ms':>10} {'load MB/s':>10}"
+    )
+
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal_data.json")
+        for name, (encode, decode) in CODECS.items():
+            for compact in (False, True):
+
+                def save():
+                    atomic_write(path, encode(data, compact, None), fsync=False)
+
+                def load():
+                    with open(path, "rb") as f:
+                        decode(f.read())
+
+                save_ms = _time(save, args.repeat)
+                load_ms = _time(load, args.repeat)
+                size_mb = os.path.getsize(path) / 1_000_000
+                label = f"{name}{' compact' if compact else ''}"
+                print(
+                    f"  {label:<18} {size_mb:>8.1f} {save_ms:>10.1f} {load_ms:>10.1f}"
+                    f" {size_mb / (load_ms / 1000):>10.1f}"
+                )
+                with open(path, "rb") as f:
+                    if decode(f.read()) != data:
+                        failed.append(label)
+
+    if failed:
+        sys.exit(f"Round trip changed the journal: {', '.join(failed)}")
+    print("Round trip: every codec returned the journal unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Heatmap benchmark.
+Times per-day level lookups (one formatted key and dict probe per day, as the
+weekly heatmap did) against the date index with vectorized thresholding, and
+renders the multi-year heatmap screen headlessly.
+
+Usage: python benchmarks/bench_heatmap.py [--years 10] [--repeat R]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_journal import headless
+from benchmarks.synthetic import synthetic_journal
+from core.activity_store import ActivityStore, level_of, levels_of
+from core.records import from_persisted
+from features.heatmap import MAX_YEARS, show_yearly_heatmap
+
+
+def _median_ms(fn, setup, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = synthetic_journal(0, n_notebooks=1, years=args.years, n_goals=0)
+    data = from_persisted(raw)
+    entries = data["daily_activities"].entries
+    end = date.today()
+    start = date(end.year - args.years + 1, 1, 1)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+    def per_day(_):
+        levels = []
+        for day in days:
+            record = entries.get(day.strftime("%Y-%m-%d"))
+            levels.append(level_of(record.total) if record else 0)
+        return levels
+
+    def indexed(store):
+        return levels_of(store.totals(start, end))
+
+    warm = ActivityStore(entries)
+    indexed(warm)
+    # Whole screen: every year shown at once ("+" until MAX_YEARS), then leave
+    script = ["+"] * (min(args.years, MAX_YEARS) - 1) + ["v"]
+
+    def screen(d):
+        with headless(list(script)):
+            show_yearly_heatmap(d)
+
+    steps = [
+        ("per-day key probes", per_day, lambda: None),
+        ("index build + levels", indexed, lambda: ActivityStore(entries)),
+        ("levels (indexed)", indexed, lambda: warm),
+        ("yearly heatmap screen", screen, lambda: data),
+    ]
+    print(f"\n{len(days):,} days ({args.years} years), {len(entries):,} active")
+    print(f"  {'step':<28} {'median ms':>12}")
+    for label, fn, setup in steps:
+        print(f"  {label:<28} {_median_ms(fn, setup, args.repeat):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Large-journal benchmark.
+Generates synthetic journals and times persistence, migrations, stats and
+every screen headlessly (stdout captured, input stubbed), reporting median
+wall time and peak traced memory per step.
+
+Usage: python benchmarks/bench_journal.py [--sizes 1000,100000,1000000]
+       [--notebooks N] [--years Y] [--goals G] [--repeat R]
+       [--backend json|sqlite] [--no-memory]
+"""
+
+import argparse
+import builtins
+import copy
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_journal
+from core import storage
+from core.search_index import SearchIndex, search_index
+from features.goals import manage_goals
+from features.stats import show_general_stats
+from ui.dashboard import show_interface
+from ui.notebooks import show_notebook_selection
+from ui.utils import calculate_stats
+
+# Keys pressed in the goals screen: visit every tab, then leave
+GOALS_SCRIPT = ["1", "2", "<", ">", "3", "4", "v"]
+
+
+@contextmanager
+def headless(answers: list | None = None):
+    """Discards screen output and answers input() from `answers` (then Enter)."""
+    answers = list(answers or [])
+    original = builtins.input
+    builtins.input = lambda prompt="": answers.pop(0) if answers else ""
+    try:
+        with redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+
+def _measure(fn, setup, repeat: int, memory: bool) -> tuple[float, float | None]:
+    """
+    Median wall time (ms) over `repeat` runs and peak traced memory (MB) of
+    one extra run. `setup` builds a fresh argument outside the timed region.
+    """
+    samples = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    peak = None
+    if memory:
+        arg = setup()
+        tracemalloc.start()
+        fn(arg)
+        peak = tracemalloc.get_traced_memory()[1] / 1_000_000
+        tracemalloc.stop()
+    return statistics.median(samples), peak
+
+
+def _load(_):
+    storage.close_storage()
+    return storage.load_data()
+
+
+def _all_stats(data: dict) -> None:
+    for nb in data["notebooks"]:
+        calculate_stats(data["tasks"], nb)
+
+
+def _journal_aggregates(data: dict) -> None:
+    data["tasks"].completed()
+    data["tasks"].pending_by_priority()
+
+
+def run(args, n_tasks: int) -> list:
+    raw = synthetic_journal(n_tasks, args.notebooks, args.years, args.goals)
+    legacy = {k: v for k, v in raw.items() if k != "schema_version"}
+
+    storage.save_data(storage._prepare(copy.deepcopy(raw), []))
+    storage.close_storage()
+    data = storage.load_data()
+    nb = data["active_notebook"]
+
+    def screen(fn, answers=None):
+        def run_screen(d):
+            with headless(answers):
+                fn(d)
+
+        return run_screen
+
+    steps = [
+        ("save_data (snapshot)", lambda d: storage.save_data(d), lambda: data),
+        ("load_data", _load, lambda: None),
+        (
+            "_migrate_data (v0 file)",
+            storage._migrate_data,
+            lambda: copy.deepcopy(legacy),
+        ),
+        ("_migrate_data (current)", storage._migrate_data, lambda: copy.deepcopy(raw)),
+        (
+            "calculate_stats (1 nb)",
+            lambda d: calculate_stats(d["tasks"], nb),
+            lambda: data,
+        ),
+        ("calculate_stats (all nbs)", _all_stats, lambda: data),
+        ("journal aggregates", _journal_aggregates, lambda: data),
+        ("search index build", SearchIndex, lambda: data),
+        (
+            "search (2 prefix terms)",
+            lambda d: search_index(d).search(d, "synth 12", 20),
+            lambda: search_index(data) and data,  # built outside the timing
+        ),
+        ("show_interface", screen(show_interface), lambda: data),
+        ("show_notebook_selection", screen(show_notebook_selection), lambda: data),
+        ("show_general_stats", screen(show_general_stats), lambda: data),
+        ("goals screens", screen(manage_goals, GOALS_SCRIPT), lambda: data),
+    ]
+    return [
+        (label, *_measure(fn, setup, args.repeat, not args.no_memory))
+        for label, fn, setup in steps
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,100000")
+    parser.add_argument("--notebooks", type=int, default=200)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--goals", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", choices=sorted(storage.BACKENDS), default="json")
+    parser.add_argument("--no-memory", action="store_true")
+    args = parser.parse_args()
+
+    storage.STORAGE_BACKEND = args.backend
+    for n_tasks in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                results = run(args, n_tasks)
+            finally:
+                storage.close_storage()
+                os.chdir(cwd)
+
+        print(
+            f"\n{n_tasks:,} tasks, {args.notebooks} notebooks, {args.years} years, "
+            f"{args.goals:,} goals ({args.backend})"
+        )
+        print(f"  {'step':<28} {'median ms':>12} {'peak MB':>10}")
+        for label, ms, peak in results:
+            mem = f"{peak:>10.1f}" if peak is not None else f"{'-':>10}"
+            print(f"  {label:<28} {ms:>12.2f} {mem}")
+
+
+if __name__ == "__main__":
+    main()
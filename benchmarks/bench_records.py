@@ -0,0 +1,47 @@
+"""
+Memory held by in-memory tasks, goals and activities.
+Compares the dicts a decoded snapshot holds with the records built by
+core.records.from_persisted, measured with tracemalloc.
+
+Usage: python benchmarks/bench_records.py [--tasks N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_journal
+from core.records import from_persisted
+
+
+def _retained(build) -> tuple[object, float]:
+    """Builds an object and returns it with the memory it retains, in MB."""
+    tracemalloc.start()
+    obj = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, current / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raw = json.dumps(synthetic_journal(args.tasks))
+    dicts, dicts_mb = _retained(lambda: json.loads(raw))
+    del dicts
+    records, records_mb = _retained(lambda: from_persisted(json.loads(raw)))
+
+    print(f"Journal: {args.tasks:,} tasks, {len(records['notebooks'])} notebooks")
+    print(f"  {'dicts (decoded JSON)':<24} {dicts_mb:>10.1f} MB")
+    print(f"  {'records':<24} {records_mb:>10.1f} MB")
+    print(f"  {'saved':<24} {1 - records_mb / dicts_mb:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
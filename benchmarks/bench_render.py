@@ -0,0 +1,115 @@
+"""
+Render-width benchmark.
+Times ui.utils.visual_len on the lines of real dashboard frames (the old
+uncompiled re.sub against the width engine, cold and warm cache), then the
+dashboard and notebook screens rendered headlessly with each implementation.
+
+Usage: python benchmarks/bench_render.py [--tasks N] [--notebooks N] [--repeat R]
+"""
+
+import argparse
+import io
+import os
+import re
+import statistics
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ui.dashboard
+import ui.notebooks
+import ui.utils
+from benchmarks.bench_journal import headless
+from benchmarks.synthetic import synthetic_journal
+from core.records import from_persisted
+from ui.dashboard import show_interface
+from ui.notebooks import show_notebook_selection
+
+_MODULES = (ui.utils, ui.dashboard, ui.notebooks)
+
+
+def _legacy_visual_len(text: str) -> int:
+    return len(re.sub(r"\033\[[0-9;]+m", "", text))
+
+
+def _legacy_truncate_text(text: str, limit: int) -> str:
+    if _legacy_visual_len(text) > limit:
+        return text[: limit - 3] + "..."
+    return text
+
+
+@contextmanager
+def legacy_widths():
+    """Swaps the previous visual_len / truncate_text into the UI modules."""
+    saved = [
+        (m, m.__dict__.get("visual_len"), m.__dict__.get("truncate_text"))
+        for m in _MODULES
+    ]
+    for module, _, _ in saved:
+        module.visual_len = _legacy_visual_len
+        module.truncate_text = _legacy_truncate_text
+    try:
+        yield
+    finally:
+        for module, visual_len, truncate_text in saved:
+            module.visual_len = visual_len
+            module.truncate_text = truncate_text
+
+
+def _median_ms(fn, setup, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--notebooks", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = from_persisted(
+        synthetic_journal(args.tasks, args.notebooks, years=1, n_goals=60)
+    )
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        show_interface(data)
+        with headless():
+            show_notebook_selection(data)
+    lines = buffer.getvalue().split("\n")
+
+    def widths(measure):
+        return lambda: [measure(line) for line in lines]
+
+    def screens():
+        with headless():
+            show_interface(data)
+            show_notebook_selection(data)
+
+    def legacy_screens():
+        with legacy_widths():
+            screens()
+
+    clear = ui.utils.visual_len.cache_clear
+    steps = [
+        ("visual_len (re.sub)", widths(_legacy_visual_len), lambda: None),
+        ("visual_len (cold cache)", widths(ui.utils.visual_len), clear),
+        ("visual_len (warm cache)", widths(ui.utils.visual_len), lambda: None),
+        ("screens (re.sub)", legacy_screens, lambda: None),
+        ("screens (width engine)", screens, lambda: None),
+    ]
+    print(f"\n{len(lines):,} frame lines, {args.notebooks} notebooks")
+    print(f"  {'step':<28} {'median ms':>12}")
+    for label, fn, setup in steps:
+        print(f"  {label:<28} {_median_ms(fn, setup, args.repeat):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Synthetic journals for benchmarks.
+Deterministic (seeded) so runs are comparable across commits.
+"""
+
+import random
+from calendar import monthrange
+from datetime import date, timedelta
+
+from core.activity_store import level_of
+from core.constants import MONTHS_LIST, SUGGESTED_ACTIVITIES
+from core.migrations import SCHEMA_VERSION
+
+
+def synthetic_journal(
+    n_tasks: int,
+    n_notebooks: int = 200,
+    years: int = 10,
+    n_goals: int = 3000,
+    seed: int = 42,
+) -> dict:
+    """
+    A persisted-format journal (plain lists/dicts, as read from disk) with
+    `n_tasks` tasks spread over `n_notebooks`, `years` of daily activities and
+    calendar marks ending today, and `n_goals` goals split across the kinds.
+    """
+    rng = random.Random(seed)
+    notebooks = [f"Notebook {i}" for i in range(n_notebooks)]
+
+    tasks = []
+    for i in range(1, n_tasks + 1):
+        home = notebooks[i % n_notebooks]
+        extra = [notebooks[rng.randrange(n_notebooks)]] if i % 10 == 0 else []
+        tasks.append(
+            {
+                "id": i,
+                "text": f"Synthetic task number {i}",
+                "status": "X" if i % 3 == 0 else "•",
+                "notebook": home,
+                "notebooks": [home] + [n for n in extra if n != home],
+                "priority": i % 3 + 1,
+            }
+        )
+
+    today = date.today()
+    daily_activities = {}
+    calendar = {}
+    day = today - timedelta(days=365 * years)
+    while day <= today:
+        if rng.random() < 0.7:
+            activities = {
+                name: rng.randint(1, 3)
+                for name in rng.sample(SUGGESTED_ACTIVITIES, rng.randint(1, 4))
+            }
+            daily_activities[day.isoformat()] = {
+                "activities": activities,
+                "level": level_of(sum(activities.values())),
+            }
+        if rng.random() < 0.5:
+            month = calendar.setdefault(f"{day.year}-{day.month:02d}", {})
+            month[str(day.day)] = rng.choice(["complete", "partial", "failed"])
+        day += timedelta(days=1)
+
+    goals = {"weekly": [], "monthly": [], "yearly": []}
+    for i in range(n_goals):
+        kind = ("weekly", "monthly", "yearly")[i % 3]
+        goal = {"text": f"Goal {i}", "progress": rng.randrange(0, 101, 5)}
+        if kind == "monthly":
+            goal["text"] = f"{MONTHS_LIST[i % 12]}: {goal['text']}"
+            goal["year"], goal["month"] = today.year, i % 12 + 1
+            goal["total_days"] = monthrange(today.year, goal["month"])[1]
+        goals[kind].append(goal)
+
+    return {
+        "notebooks": notebooks,
+        "active_notebook": notebooks[0],
+        "tasks": tasks,
+        "goals": goals,
+        "notes": {nb: f"Notes for {nb}\n" * 5 for nb in notebooks[::2]},
+        "calendar": calendar,
+        "daily_activities": daily_activities,
+        "next_id": n_tasks + 1,
+        "schema_version": SCHEMA_VERSION,
+    }
@@ -0,0 +1,241 @@
+"""
+Date-indexed daily activities.
+Wraps the `daily_activities` section (a dict or a core.sections.LazySection)
+and keeps, per year, the active days as a sorted ordinal-day array with level
+and total columns, prefix sums and week/month rollups. Range queries, rollups
+and streaks then cost a bisect or a lookup rather than a scan of string keys,
+and only touch the years they cover. Indexes are rebuilt on first use after
+a year changes. Dense per-day totals and their levels are computed with NumPy
+when it is installed.
+"""
+
+import copy
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import MutableMapping
+from datetime import date, timedelta
+
+from core.sections import LazySection, year_part
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Highest daily total of levels 0-3; anything above the last is level 4
+LEVEL_BOUNDS = (0, 2, 4, 6)
+
+
+def level_of(total: int) -> int:
+    """Heatmap level (0-4) of a daily total."""
+    return bisect_left(LEVEL_BOUNDS, total)
+
+
+def levels_of(totals) -> list[int]:
+    """Levels of a run of daily totals, thresholded in one vectorized pass."""
+    if np is not None:
+        return np.searchsorted(LEVEL_BOUNDS, totals, side="left").tolist()
+    return [bisect_left(LEVEL_BOUNDS, total) for total in totals]
+
+
+class YearIndex:
+    """Active days of one year, in date order."""
+
+    def __init__(self, entries: dict):
+        days = []
+        for key, record in entries.items():
+            try:
+                day = date.fromisoformat(key)
+            except ValueError:
+                continue
+            if record.total > 0 or record.level > 0:
+                days.append((day.toordinal(), record.level, record.total))
+        days.sort()
+
+        self.ordinals = array("i", (d[0] for d in days))
+        self.levels = array("b", (min(d[1], 127) for d in days))
+        self.totals = array("i", (d[2] for d in days))
+        self._prefix = array("q", [0])  # _prefix[i] = sum of totals[:i]
+        self.weeks: dict[int, int] = {}  # Monday's ordinal → total
+        self.months = [0] * 13  # month (1-12) → total
+        self._runs = array("i")  # length of the streak ending at each day
+        previous, run = None, 0
+        for ordinal, total in zip(self.ordinals, self.totals):
+            self._prefix.append(self._prefix[-1] + total)
+            day = date.fromordinal(ordinal)
+            monday = ordinal - day.weekday()
+            self.weeks[monday] = self.weeks.get(monday, 0) + total
+            self.months[day.month] += total
+            run = run + 1 if previous == ordinal - 1 else 1
+            self._runs.append(run)
+            previous = ordinal
+        self.longest = max(self._runs, default=0)
+        # Streak starting on January 1st, which may continue last year's
+        self.leading = 0
+        if days and date.fromordinal(days[0][0]).timetuple().tm_yday == 1:
+            while (
+                self.leading < len(self._runs)
+                and self._runs[self.leading] == self.leading + 1
+            ):
+                self.leading += 1
+
+    def level(self, ordinal: int) -> int:
+        i = bisect_left(self.ordinals, ordinal)
+        if i < len(self.ordinals) and self.ordinals[i] == ordinal:
+            return self.levels[i]
+        return 0
+
+    def total(self, first: int, last: int) -> int:
+        """Sum of totals for ordinals in [first, last]."""
+        lo = bisect_left(self.ordinals, first)
+        hi = bisect_right(self.ordinals, last)
+        return self._prefix[hi] - self._prefix[lo]
+
+    def active(self, first: int, last: int) -> range:
+        """Positions of the active days in [first, last]."""
+        return range(
+            bisect_left(self.ordinals, first), bisect_right(self.ordinals, last)
+        )
+
+    def run_ending(self, ordinal: int) -> int:
+        """Length of the streak of active days ending at `ordinal` (0 if inactive)."""
+        i = bisect_left(self.ordinals, ordinal)
+        if i < len(self.ordinals) and self.ordinals[i] == ordinal:
+            return self._runs[i]
+        return 0
+
+
+class ActivityStore(MutableMapping):
+    """Daily activity records by "YYYY-MM-DD" key, with date-range queries."""
+
+    def __init__(self, entries=None):
+        self.entries = {} if entries is None else entries
+        self._years: dict[int, YearIndex] = {}
+
+    # ─── MutableMapping ──────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        return self.entries[key]
+
+    def __setitem__(self, key, value) -> None:
+        self.entries[key] = value
+        self._invalidate(key)
+
+    def __delitem__(self, key) -> None:
+        del self.entries[key]
+        self._invalidate(key)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __deepcopy__(self, memo):
+        # Indexes are derived; the copy rebuilds them if it is ever queried
+        return ActivityStore(copy.deepcopy(self.entries, memo))
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    def levels(self, start: date, end: date) -> list[int]:
+        """Level of every day from start to end inclusive (0 when nothing was logged)."""
+        first, last = start.toordinal(), end.toordinal()
+        levels = [0] * max(last - first + 1, 0)
+        for year in range(start.year, end.year + 1):
+            index = self.year(year)
+            for i in index.active(first, last):
+                levels[index.ordinals[i] - first] = index.levels[i]
+        return levels
+
+    def totals(self, start: date, end: date):
+        """Daily totals from start to end inclusive, one per day (a NumPy array if available)."""
+        first, last = start.toordinal(), end.toordinal()
+        days = max(last - first + 1, 0)
+        if np is not None:
+            totals = np.zeros(days, dtype=np.int32)
+            for year in range(start.year, end.year + 1):
+                index = self.year(year)
+                active = index.active(first, last)
+                if active:
+                    rows = slice(active.start, active.stop)
+                    ordinals = np.frombuffer(index.ordinals, dtype=np.int32)[rows]
+                    totals[ordinals - first] = np.frombuffer(
+                        index.totals, dtype=np.int32
+                    )[rows]
+            return totals
+
+        totals = array("i", bytes(days * array("i").itemsize))
+        for year in range(start.year, end.year + 1):
+            index = self.year(year)
+            for i in index.active(first, last):
+                totals[index.ordinals[i] - first] = index.totals[i]
+        return totals
+
+    def total(self, start: date, end: date) -> int:
+        """Activities logged from start to end inclusive."""
+        first, last = start.toordinal(), end.toordinal()
+        return sum(
+            self.year(year).total(first, last)
+            for year in range(start.year, end.year + 1)
+        )
+
+    def week_total(self, day: date) -> int:
+        """Activities logged in the Monday-to-Sunday week containing `day`."""
+        monday = day - timedelta(days=day.weekday())
+        sunday = monday + timedelta(days=6)
+        years = {monday.year, sunday.year}
+        return sum(self.year(y).weeks.get(monday.toordinal(), 0) for y in years)
+
+    def month_total(self, year: int, month: int) -> int:
+        return self.year(year).months[month]
+
+    def streak(self, day: date) -> int:
+        """Consecutive active days ending at `day`, or the day before if `day` has none yet."""
+        run = self._run_ending(day)
+        return run or self._run_ending(day - timedelta(days=1))
+
+    def longest_streak(self) -> int:
+        years = self.years()
+        best, carry = 0, 0
+        for year in range(min(years, default=0), max(years, default=-1) + 1):
+            index = self.year(year)
+            # A streak running into January continues the one that ended the year before
+            carry = carry + index.leading if index.leading else 0
+            best = max(best, index.longest, carry)
+            if index.leading < _days_in(year):
+                carry = index.run_ending(date(year, 12, 31).toordinal())
+        return best
+
+    def years(self) -> set[int]:
+        """Years with activity entries (read or not)."""
+        if isinstance(self.entries, LazySection):
+            parts = self.entries.parts()
+        else:
+            parts = {year_part(key) for key in self.entries}
+        return {int(part) for part in parts if part.isdigit()}
+
+    def year(self, year: int) -> YearIndex:
+        index = self._years.get(year)
+        if index is None:
+            prefix = f"{year:04d}"
+            if isinstance(self.entries, LazySection):
+                entries = self.entries.part(prefix)
+            else:
+                entries = {k: v for k, v in self.entries.items() if k[:4] == prefix}
+            index = self._years[year] = YearIndex(entries)
+        return index
+
+    def _run_ending(self, day: date) -> int:
+        run = self.year(day.year).run_ending(day.toordinal())
+        start = day - timedelta(days=run - 1)
+        if run and start.year > 1 and (start.month, start.day) == (1, 1):
+            run += self._run_ending(start - timedelta(days=1))
+        return run
+
+    def _invalidate(self, key: str) -> None:
+        if key[:4].isdigit():
+            self._years.pop(int(key[:4]), None)
+
+
+def _days_in(year: int) -> int:
+    return (date(year + 1, 1, 1) - date(year, 1, 1)).days
@@ -0,0 +1,77 @@
+"""
+Storage backend interface.
+core.storage talks to persistence engines only through this class, so the
+engine can be swapped via STORAGE_BACKEND in core.constants.
+"""
+
+import copy
+from contextlib import nullcontext
+
+# Top-level keys holding the bulk of the journal; everything else is metadata
+COLLECTION_KEYS = {
+    "notebooks",
+    "tasks",
+    "goals",
+    "calendar",
+    "daily_activities",
+    "notes",
+}
+
+
+class JournalChanged(Exception):
+    """Another session saved since this one last read; sync before writing."""
+
+
+class JournalUnreadable(Exception):
+    """The stored journal exists but cannot be read (and no backup could either)."""
+
+
+def state_header(data: dict) -> dict:
+    """Detached copy of the metadata keys (active notebook, next id, ...)."""
+    return {k: copy.deepcopy(v) for k, v in data.items() if k not in COLLECTION_KEYS}
+
+
+class StorageBackend:
+    """Base class for persistence engines."""
+
+    def load(self) -> tuple[dict, list] | None:
+        """
+        Returns (state, pending_ops) or None if nothing has been stored yet.
+        The state is returned as persisted (before migrations); pending_ops are
+        operation records not yet folded into it, replayed by the caller.
+        """
+        raise NotImplementedError
+
+    def lock(self):
+        """
+        Context manager holding the journal exclusively against other
+        sessions; load, changes and writes nest inside it.
+        """
+        return nullcontext()
+
+    def changes(self) -> list | None:
+        """
+        Operations other sessions saved since this one last loaded or wrote,
+        for the caller to apply; None if the state must be reloaded instead.
+        Cheap when nothing changed. Call it with lock() held.
+        """
+        return []
+
+    def needs_snapshot(self) -> bool:
+        """True when the next save must write the full state instead of operations."""
+        return False
+
+    def append(self, data: dict, ops: list) -> None:
+        """
+        Persists operations already applied to `data`.
+        Only the metadata keys of `data` may be read (see state_header).
+        Raises JournalChanged if another session saved since changes().
+        """
+        raise NotImplementedError
+
+    def write_snapshot(self, data: dict) -> None:
+        """Persists the full state, replacing whatever was stored."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flushes and releases any resources held by the backend."""
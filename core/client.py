@@ -0,0 +1,63 @@
+"""
+Thin client for the journal daemon (see core.daemon).
+One connection serves any number of calls, so a query costs a round trip
+over the socket rather than a load of the journal.
+"""
+
+import json
+import socket
+
+from core.constants import DAEMON_SOCKET
+
+
+class DaemonError(Exception):
+    """The daemon is unreachable or rejected a request."""
+
+
+class JournalClient:
+    def __init__(self, path: str = DAEMON_SOCKET, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader = None
+
+    def call(self, method: str, /, **params):
+        """Sends one request and returns its result; raises DaemonError on failure."""
+        if self._sock is None:
+            self._connect()
+        request = json.dumps({"method": method, "params": params}, ensure_ascii=False)
+        try:
+            self._sock.sendall(request.encode() + b"\n")
+            line = self._reader.readline()
+        except OSError as e:
+            self.close()
+            raise DaemonError(f"lost connection to {self.path}: {e}") from None
+        if not line:
+            self.close()
+            raise DaemonError(f"{self.path} closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "request failed"))
+        return response["result"]
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = self._reader = None
+
+    def __enter__(self) -> "JournalClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"no journal daemon on {self.path}: {e}") from None
+        self._sock, self._reader = sock, sock.makefile("rb")
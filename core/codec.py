@@ -0,0 +1,86 @@
+"""
+JSON codecs for journal snapshots.
+Uses msgspec or orjson when installed and falls back to the standard library;
+all codecs read each other's files. Snapshots are encoded to UTF-8 bytes.
+"""
+
+import gc
+import json
+from contextlib import contextmanager
+from typing import Callable
+
+from core.constants import JSON_CODEC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# ─── Codecs ──────────────────────────────────────────────────────────────────
+# encode(data, compact, default) -> bytes; decode(bytes) -> object
+
+
+def _json_encode(data, compact: bool, default: Callable | None) -> bytes:
+    if compact:
+        text = json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=default
+        )
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    return text.encode("utf-8")
+
+
+def _orjson_encode(data, compact: bool, default: Callable | None) -> bytes:
+    return orjson.dumps(
+        data, default=default, option=0 if compact else orjson.OPT_INDENT_2
+    )
+
+
+def _msgspec_encode(data, compact: bool, default: Callable | None) -> bytes:
+    raw = msgspec.json.encode(data, enc_hook=default)
+    return raw if compact else msgspec.json.format(raw, indent=2)
+
+
+CODECS: dict[str, tuple[Callable, Callable]] = {"json": (_json_encode, json.loads)}
+if orjson is not None:
+    CODECS["orjson"] = (_orjson_encode, orjson.loads)
+if msgspec is not None:
+    # Decoded untyped: snapshots are migrated as plain dicts before
+    # core.records builds its records from them
+    CODECS["msgspec"] = (_msgspec_encode, msgspec.json.decode)
+
+# Fastest first; "auto" picks the first one installed
+PREFERENCE = ["msgspec", "orjson", "json"]
+
+
+@contextmanager
+def paused_gc():
+    """
+    Suspends the cyclic garbage collector while building or converting a whole
+    journal: the allocations are all live, so collector passes are wasted.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def codec_name(name: str = JSON_CODEC) -> str:
+    """Resolves "auto" and codecs that are not installed (stdlib fallback)."""
+    if name == "auto":
+        return next(n for n in PREFERENCE if n in CODECS)
+    return name if name in CODECS else "json"
+
+
+def get_codec(name: str = JSON_CODEC) -> tuple[Callable, Callable]:
+    """Returns (encode, decode) for the configured codec."""
+    return CODECS[codec_name(name)]
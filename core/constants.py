@@ -2,7 +2,35 @@
 Global constants and configuration for the application.
 """
 
+# Storage engine: "json" (snapshot + operation log) or "sqlite"
+STORAGE_BACKEND = "json"
 DATA_FILE = "journal_data.json"
+LOG_FILE = "journal_data.log"
+SQLITE_FILE = "journal_data.db"
+# Logged operations replayed on load before the snapshot is rewritten
+LOG_COMPACT_THRESHOLD = 500
+# fsync snapshots and log appends so a crash never loses acknowledged saves
+FSYNC_WRITES = True
+# Timestamped copies of the previous snapshot kept on every rewrite (0 disables)
+BACKUP_DIR = "journal_backups"
+BACKUP_COUNT = 5
+# Save from a background thread, coalescing changes for WRITE_BEHIND_MS
+WRITE_BEHIND = False
+WRITE_BEHIND_MS = 250
+# Keep notes, calendar and activities in per-year files under SECTIONS_DIR,
+# read on first use instead of at startup
+SPLIT_SECTIONS = True
+SECTIONS_DIR = "journal_sections"
+# Keep each notebook's own tasks in a file under SHARDS_DIR (tasks in several
+# notebooks stay in DATA_FILE); snapshots rewrite only the shards that changed
+SHARD_TASKS = False
+SHARDS_DIR = "journal_shards"
+# Snapshot codec: "auto" (fastest installed), "msgspec", "orjson" or "json"
+JSON_CODEC = "auto"
+# Write snapshots without indentation (smaller and faster, less readable)
+JSON_COMPACT = False
+# Unix socket served by the optional journal daemon (python journald.py)
+DAEMON_SOCKET = "journal.sock"
 TERMINAL_WIDTH = 100
 
 DAYS_EN = {
@@ -0,0 +1,260 @@
+"""
+Journal daemon.
+A long-running process that loads the journal once, keeps it in memory and
+answers requests from thin clients (scripts, status-bar widgets; see
+core.client) over a Unix domain socket. The protocol is one JSON object per
+line each way: {"method": ..., "params": {...}} in, {"ok": true, "result":
+...} or {"ok": false, "error": ...} out. Changes go through core.storage, so
+the daemon shares the journal safely with TUI sessions and other daemons.
+"""
+
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+from datetime import date
+
+from core.activity_store import levels_of
+from core.colors import Color
+from core.constants import DAEMON_SOCKET
+from core.records import DONE, PENDING, STATUS_SYMBOLS
+from core.storage import EditDiscarded, close_storage, commit, load_data, sync_data
+
+MAX_REQUEST = 1 << 20  # bytes buffered for one request line
+SEND_TIMEOUT = 5.0  # seconds a client may take to read a response
+
+
+class RequestError(Exception):
+    """A request the daemon cannot serve; reported to the client."""
+
+
+# ─── Methods ─────────────────────────────────────────────────────────────────
+
+
+def _ping(data: dict, params: dict) -> dict:
+    return {"pid": os.getpid()}
+
+
+def _notebooks(data: dict, params: dict) -> dict:
+    notebooks = []
+    for name in data["notebooks"]:
+        total, completed = data["tasks"].stats(name)
+        notebooks.append({"name": name, "total": total, "completed": completed})
+    return {"active": data["active_notebook"], "notebooks": notebooks}
+
+
+def _tasks(data: dict, params: dict) -> dict:
+    """A notebook's tasks in display order, optionally a window of them."""
+    notebook = _notebook(data, params)
+    start, stop = params.get("start", 0), params.get("stop")
+    tasks = data["tasks"].ordered(notebook, start, stop)
+    return {
+        "notebook": notebook,
+        "total": data["tasks"].count(notebook),
+        "tasks": [task.to_dict() for task in tasks],
+    }
+
+
+def _add(data: dict, params: dict) -> dict:
+    text = str(params.get("text", "")).strip()
+    if not text:
+        raise RequestError("text is required")
+    notebook = _notebook(data, params)
+    notebooks = [notebook] + [
+        nb for nb in params.get("notebooks", []) if nb != notebook
+    ]
+    for nb in notebooks:
+        if nb not in data["notebooks"]:
+            raise RequestError(f"no notebook named {nb!r}")
+    task = {
+        "id": data["next_id"],
+        "text": text,
+        "status": STATUS_SYMBOLS[PENDING],
+        "notebook": notebook,
+        "notebooks": notebooks,
+        "priority": max(1, min(3, int(params.get("priority", 2)))),
+    }
+    _commit(data, "task_add", task=task)
+    return data["tasks"].get(task["id"]).to_dict()
+
+
+def _complete(data: dict, params: dict) -> dict:
+    """Marks a task done ("done": false reopens it)."""
+    task_id = _task_id(data, params)
+    status = DONE if params.get("done", True) else PENDING
+    _commit(data, "task_set", id=task_id, field="status", value=STATUS_SYMBOLS[status])
+    return data["tasks"].get(task_id).to_dict()
+
+
+def _delete(data: dict, params: dict) -> dict:
+    task_id = _task_id(data, params)
+    _commit(data, "task_delete", id=task_id)
+    return {"id": task_id}
+
+
+def _stats(data: dict, params: dict) -> dict:
+    total = len(data["tasks"])
+    completed = data["tasks"].completed()
+    histogram = data["tasks"].pending_by_priority()
+    activities = data["daily_activities"]
+    return {
+        "total": total,
+        "completed": completed,
+        "pending": total - completed,
+        "pending_by_priority": {str(p): count for p, count in histogram.items()},
+        "streak": activities.streak(date.today()),
+        "longest_streak": activities.longest_streak(),
+    }
+
+
+def _heatmap(data: dict, params: dict) -> dict:
+    """Heatmap level (0-4) of every day of a year, from January 1st."""
+    year = int(params.get("year", date.today().year))
+    start, end = date(year, 1, 1), date(year, 12, 31)
+    activities = data["daily_activities"]
+    return {
+        "year": year,
+        "total": activities.total(start, end),
+        "active_days": len(activities.year(year).ordinals),
+        "levels": levels_of(activities.totals(start, end)),
+    }
+
+
+METHODS = {
+    "ping": _ping,
+    "notebooks": _notebooks,
+    "tasks": _tasks,
+    "add": _add,
+    "complete": _complete,
+    "delete": _delete,
+    "stats": _stats,
+    "heatmap": _heatmap,
+}
+
+
+def _notebook(data: dict, params: dict) -> str:
+    notebook = params.get("notebook") or data["active_notebook"]
+    if notebook not in data["notebooks"]:
+        raise RequestError(f"no notebook named {notebook!r}")
+    return notebook
+
+
+def _task_id(data: dict, params: dict) -> int:
+    try:
+        task_id = int(params["id"])
+    except (KeyError, TypeError, ValueError):
+        raise RequestError("a numeric task id is required") from None
+    if task_id not in data["tasks"]:
+        raise RequestError(f"no task with id {task_id}")
+    return task_id
+
+
+def _commit(data: dict, op: str, **fields) -> None:
+    try:
+        saved = commit(data, op, **fields)
+    except EditDiscarded as e:
+        raise RequestError(str(e)) from None
+    if not saved:
+        raise RequestError("the change could not be saved")
+
+
+# ─── Protocol ────────────────────────────────────────────────────────────────
+
+
+def handle(data: dict, line: bytes) -> dict:
+    """Serves one request line, bringing `data` up to date first."""
+    try:
+        request = json.loads(line)
+        method = METHODS[request["method"]]
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            raise RequestError("params must be an object")
+    except (ValueError, TypeError, KeyError):
+        return {"ok": False, "error": "malformed request or unknown method"}
+    except RequestError as e:
+        return {"ok": False, "error": str(e)}
+
+    sync_data(data)  # other sessions' saves (a stat() when there are none)
+    try:
+        return {"ok": True, "result": method(data, params)}
+    except RequestError as e:
+        return {"ok": False, "error": str(e)}
+    except (TypeError, ValueError) as e:
+        return {"ok": False, "error": f"invalid params: {e}"}
+    except Exception as e:  # keep serving the other clients
+        return {"ok": False, "error": f"internal error: {e}"}
+
+
+# ─── Server ──────────────────────────────────────────────────────────────────
+
+
+def serve(path: str = DAEMON_SOCKET) -> None:
+    """Serves requests on `path` until SIGINT/SIGTERM."""
+    data = load_data()
+    server = _listen(path)
+    buffers: dict[socket.socket, bytes] = {}
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"{Color.GREEN}✓ Journal daemon listening on {path}{Color.RESET}")
+
+    try:
+        while True:
+            for key, _ in selector.select():
+                if key.fileobj is server:
+                    conn, _ = server.accept()
+                    conn.settimeout(SEND_TIMEOUT)
+                    selector.register(conn, selectors.EVENT_READ)
+                    buffers[conn] = b""
+                elif not _serve_client(data, key.fileobj, buffers):
+                    selector.unregister(key.fileobj)
+                    del buffers[key.fileobj]
+                    key.fileobj.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        selector.close()
+        server.close()
+        os.remove(path)
+        close_storage()
+
+
+def _serve_client(data: dict, conn: socket.socket, buffers: dict) -> bool:
+    """Answers the complete requests received so far. False once the client is gone."""
+    try:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return False
+        buffer = buffers[conn] + chunk
+        *lines, buffers[conn] = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                response = handle(data, line)
+                conn.sendall(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+        return len(buffers[conn]) <= MAX_REQUEST
+    except OSError:
+        return False
+
+
+def _listen(path: str) -> socket.socket:
+    """Binds the socket, replacing one left by a daemon that is no longer running."""
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)  # stale
+        else:
+            raise RuntimeError(f"a journal daemon is already listening on {path}")
+        finally:
+            probe.close()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)  # the socket is for this user only
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+    server.listen()
+    return server
@@ -0,0 +1,123 @@
+"""
+Crash-safe file helpers: atomic replace with fsync, a ring of backups and an
+advisory lock shared by every session using the same journal.
+"""
+
+import os
+import threading
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: sessions are not coordinated
+    fcntl = None
+
+
+def fsync_dir(path: str) -> None:
+    """Makes a rename inside `path`'s directory durable (no-op where unsupported)."""
+    if os.name == "nt":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, content: str | bytes, fsync: bool = True) -> None:
+    """
+    Writes `content` to a temp file next to `path` and renames it over `path`,
+    so readers (and crashes) only ever see the old or the new file.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(content)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if fsync:
+        fsync_dir(path)
+
+
+def backup_file(path: str, backup_dir: str, keep: int) -> None:
+    """
+    Preserves the current `path` as a timestamped backup, keeping the newest
+    `keep` copies. Uses a hard link when possible, so it costs O(1).
+    """
+    if keep <= 0 or not os.path.exists(path):
+        return
+    os.makedirs(backup_dir, exist_ok=True)
+    stem, ext = os.path.splitext(os.path.basename(path))
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    target = os.path.join(backup_dir, f"{stem}-{stamp}{ext}")
+    try:
+        os.link(path, target)
+    except OSError:
+        with open(path, "rb") as src, open(target, "wb") as dst:
+            dst.write(src.read())
+
+    for old in list_backups(path, backup_dir)[keep:]:
+        os.remove(old)
+
+
+def list_backups(path: str, backup_dir: str) -> list:
+    """Backups of `path`, newest first."""
+    if not os.path.isdir(backup_dir):
+        return []
+    stem, ext = os.path.splitext(os.path.basename(path))
+    names = [
+        n
+        for n in os.listdir(backup_dir)
+        if n.startswith(f"{stem}-") and n.endswith(ext)
+    ]
+    return [os.path.join(backup_dir, n) for n in sorted(names, reverse=True)]
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on `path` (created if missing), held by one
+    session at a time. Reentrant, and also excludes other threads of this
+    process. Without fcntl only the thread lock applies.
+    keep() leaves the file locked after the last exit, so another thread of
+    this process can finish work on the session's behalf before release().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: int | None = None
+        self._depth = 0
+        self._kept = False
+        self._thread_lock = threading.RLock()
+
+    def keep(self) -> None:
+        """Keeps other sessions out past the last exit, until release(). Call while held."""
+        self._kept = True
+
+    def release(self) -> None:
+        """Undoes keep(): the file is unlocked at the last exit. Call while held."""
+        self._kept = False
+
+    def __enter__(self) -> "FileLock":
+        self._thread_lock.acquire()
+        if self._depth == 0 and self._fd is None and fcntl is not None:
+            try:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except OSError:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None and not self._kept:
+            os.close(self._fd)  # closing releases the flock
+            self._fd = None
+        self._thread_lock.release()
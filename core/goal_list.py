@@ -0,0 +1,120 @@
+"""
+Goal lists with a month index.
+Monthly goals carry a (year, month) key; GoalList keeps the positions of
+each month's goals so a month's view and edits cost O(goals in that month)
+instead of a scan of the whole list. Holds core.records.Goal instances.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import MutableSequence
+
+
+class GoalList(MutableSequence):
+    """Goals of one kind, in order (positions are what goal operations address)."""
+
+    def __init__(self, goals=()):
+        self._goals = list(goals)
+        self._index: _MonthIndex | None = None  # built on first use
+
+    def __getitem__(self, index):
+        return self._goals[index]
+
+    def __setitem__(self, index, goal) -> None:
+        self._goals[index] = goal
+        self._index = None
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice) or self._index is None:
+            del self._goals[index]
+            self._index = None
+            return
+        index = range(len(self._goals))[index]  # negative indexes, IndexError
+        self._index.remove(index, self._goals.pop(index))
+
+    def __len__(self) -> int:
+        return len(self._goals)
+
+    def insert(self, index: int, goal) -> None:
+        if index >= len(self._goals) and self._index is not None:
+            self._index.append(goal)
+        else:
+            self._index = None
+        self._goals.insert(index, goal)
+
+    def update(self, index: int, field: str, value) -> None:
+        """Applies a field update (see Goal.set), keeping the month index current."""
+        goal = self._goals[index]
+        if field not in ("year", "month") or self._index is None:
+            goal.set(field, value)
+            return
+        month = _month(goal)
+        goal.set(field, value)
+        self._index.move(index, month, goal)
+
+    def in_month(self, year: int, month: int) -> list[tuple[int, object]]:
+        """(position, goal) for the goals of a month, in order."""
+        if self._index is None:
+            self._index = _MonthIndex(self._goals)
+        return [(i, self._goals[i]) for i in self._index.positions((year, month))]
+
+
+class _MonthIndex:
+    """
+    Month → slots of its goals, in order. A goal keeps its slot while indexed;
+    a Fenwick tree counting the live slots turns a slot into the goal's
+    current position, so a deletion updates O(log n) counts rather than the
+    positions of every later goal.
+    """
+
+    def __init__(self, goals: list):
+        self._slots = list(range(len(goals)))  # position → slot
+        self._tree = [0] * (len(goals) + 1)  # 1-based Fenwick tree of live slots
+        for i in range(1, len(self._tree)):
+            self._tree[i] += 1
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+        self._months: dict[tuple, list[int]] = {}
+        for slot, goal in enumerate(goals):
+            self._months.setdefault(_month(goal), []).append(slot)
+
+    def append(self, goal) -> None:
+        n = len(self._tree)  # tree node of the new slot, n - 1
+        # Node n sums the slots in (n - lowbit(n), n]: this one plus live earlier ones
+        self._tree.append(1 + self._prefix(n - 1) - self._prefix(n - (n & -n)))
+        self._slots.append(n - 1)
+        self._months.setdefault(_month(goal), []).append(n - 1)
+
+    def remove(self, position: int, goal) -> None:
+        slot = self._slots.pop(position)
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+        self._unlist(_month(goal), slot)
+
+    def move(self, position: int, old_month: tuple, goal) -> None:
+        slot = self._slots[position]
+        self._unlist(old_month, slot)
+        insort(self._months.setdefault(_month(goal), []), slot)
+
+    def positions(self, month: tuple) -> list[int]:
+        return [self._prefix(slot) for slot in self._months.get(month, ())]
+
+    def _unlist(self, month: tuple, slot: int) -> None:
+        slots = self._months[month]
+        del slots[bisect_left(slots, slot)]
+        if not slots:
+            del self._months[month]
+
+    def _prefix(self, n: int) -> int:
+        """Live slots among the first n."""
+        total = 0
+        while n > 0:
+            total += self._tree[n]
+            n -= n & -n
+        return total
+
+
+def _month(goal) -> tuple:
+    return goal.year, goal.month
@@ -0,0 +1,403 @@
+"""
+JSON storage backend: a JSON snapshot plus an append-only operation log.
+With SPLIT_SECTIONS, the sections in core.sections are kept in separate
+files and loaded lazily. With SHARD_TASKS, each notebook's own tasks live in
+a shard file whose first line is a summary header; the snapshot lists the
+current shards, so rewriting it commits a new set of shards atomically.
+Sessions sharing the files take an advisory lock on `<snapshot>.lock` and
+notice each other's saves by the snapshot's identity (inode, mtime, size)
+and the log's length.
+"""
+
+import hashlib
+import os
+import sys
+from urllib.parse import quote
+
+from core.activity_store import ActivityStore
+from core.backend import JournalChanged, JournalUnreadable, StorageBackend
+from core.codec import get_codec, paused_gc
+from core.colors import Color
+from core.constants import (
+    BACKUP_COUNT,
+    BACKUP_DIR,
+    DATA_FILE,
+    FSYNC_WRITES,
+    JSON_COMPACT,
+    LOG_COMPACT_THRESHOLD,
+    LOG_FILE,
+    SECTIONS_DIR,
+    SHARD_TASKS,
+    SHARDS_DIR,
+    SPLIT_SECTIONS,
+)
+from core.fsutil import FileLock, atomic_write, backup_file, list_backups
+from core.oplog import (
+    append_log,
+    drop_torn_tail,
+    read_log,
+    read_log_from,
+    truncate_log,
+)
+from core.migrations import SCHEMA_VERSION
+from core.records import to_persisted
+from core.sections import SECTIONS, LazySection, split_parts
+from core.task_store import ShardedTasks, pending_counts
+
+
+class JsonBackend(StorageBackend):
+    def __init__(
+        self,
+        path: str = DATA_FILE,
+        log_path: str = LOG_FILE,
+        sections_dir: str = SECTIONS_DIR,
+        shards_dir: str = SHARDS_DIR,
+    ):
+        self.path = path
+        self.log_path = log_path
+        self.sections_dir = sections_dir
+        self.shards_dir = shards_dir
+        self._shard_files: dict[str, str] = {}  # notebook → current shard file
+        self._shard_digests: dict[str, bytes] = {}  # notebook → digest of its body
+        self._generation = 0  # bumped on every snapshot that writes shards
+        self._logged_ops = 0  # records in the log since the last snapshot
+        self._seq = 0  # sequence number of the last logged operation
+        self._lock = FileLock(f"{path}.lock")
+        self._stamp = None  # snapshot identity when this session last read or wrote it
+        self._log_size = 0  # bytes of the log this session has seen
+
+    def lock(self) -> FileLock:
+        return self._lock
+
+    def load(self) -> tuple[dict, list] | None:
+        with self._lock:
+            loaded = self._load()
+            self._stamp = _stamp(self.path)
+            self._log_size = _size(self.log_path)
+            return loaded
+
+    def _load(self) -> tuple[dict, list] | None:
+        if not os.path.exists(self.path):
+            return None
+        data = _read_with_backups(self.path)
+        on_disk = self._parts_on_disk()
+        # v0 snapshots name sections in Portuguese; the migration renames them
+        legacy = "schema_version" not in data
+        for name in SECTIONS:
+            # Older snapshots embed every section; they are split on the next rewrite
+            if name not in data and not legacy:
+                data[name] = LazySection(
+                    name,
+                    on_disk.get(name, ()),
+                    lambda part, name=name: self._read_part(name, part),
+                )
+        self._open_shards(data)
+
+        # Records up to the snapshot's log_seq are already folded into it
+        base_seq = data.pop("log_seq", 0)
+        records = read_log(self.log_path)
+        drop_torn_tail(self.log_path)
+        self._logged_ops = len(records)
+        self._seq = max([base_seq] + [r.get("seq", 0) for r in records])
+        pending = [r for r in records if r.get("seq", 0) > base_seq]
+        if pending and pending[0].get("seq") != base_seq + 1:
+            # Restored from an older backup: the log no longer follows on from it
+            os.replace(self.log_path, f"{self.log_path}.corrupt")
+            self._logged_ops = 0
+            self._seq = base_seq
+            pending = []
+        return data, pending
+
+    def changes(self) -> list | None:
+        if _stamp(self.path) != self._stamp:
+            return None  # rewritten (compacted) by another session
+        size = _size(self.log_path)
+        if size == self._log_size:
+            return []
+        if size < self._log_size:
+            return None
+        try:
+            records, self._log_size = read_log_from(self.log_path, self._log_size)
+        except ValueError:
+            return None
+        self._logged_ops += len(records)
+        self._seq = max([self._seq] + [r.get("seq", 0) for r in records])
+        return records
+
+    def _check_unchanged(self) -> None:
+        if _stamp(self.path) != self._stamp or _size(self.log_path) != self._log_size:
+            raise JournalChanged(f"{self.path} was changed by another session")
+
+    def needs_snapshot(self) -> bool:
+        return (
+            not os.path.exists(self.path) or self._logged_ops >= LOG_COMPACT_THRESHOLD
+        )
+
+    def append(self, data: dict, ops: list) -> None:
+        with self._lock:
+            self._check_unchanged()
+            for rec in ops:
+                self._seq += 1
+                rec["seq"] = self._seq
+            append_log(self.log_path, ops, fsync=FSYNC_WRITES)
+            self._logged_ops += len(ops)
+            self._log_size = _size(self.log_path)
+
+    def write_snapshot(self, data: dict) -> None:
+        with self._lock:
+            self._check_unchanged()
+            self._write_snapshot(data)
+            self._stamp = _stamp(self.path)
+            self._log_size = 0
+
+    def _write_snapshot(self, data: dict) -> None:
+        # Sections first: replaying the log over newer sections is harmless,
+        # since every section operation sets a value
+        if SPLIT_SECTIONS:
+            self._write_sections(data)
+            data = {k: v for k, v in data.items() if k not in SECTIONS}
+        shard_files = {}
+        if SHARD_TASKS:
+            data, shard_files = self._write_shards(data)
+        _write_json(self.path, {**to_persisted(data), "log_seq": self._seq})
+        if not SPLIT_SECTIONS:
+            for name, parts in self._parts_on_disk().items():
+                for part in parts:
+                    os.remove(self._part_path(name, part))
+        self._shard_files = shard_files
+        self._remove_stale_shards()
+        truncate_log(self.log_path)
+        self._logged_ops = 0
+
+    # ─── Section files ───────────────────────────────────────────────────────
+
+    def _part_path(self, name: str, part: str) -> str:
+        filename = f"{name}-{part}.json" if part else f"{name}.json"
+        return os.path.join(self.sections_dir, filename)
+
+    def _parts_on_disk(self) -> dict[str, list]:
+        """Section name → parts with a file in sections_dir."""
+        if not os.path.isdir(self.sections_dir):
+            return {}
+        found: dict[str, list] = {}
+        for filename in os.listdir(self.sections_dir):
+            stem, ext = os.path.splitext(filename)
+            name, _, part = stem.partition("-")
+            if ext == ".json" and name in SECTIONS:
+                found.setdefault(name, []).append(part)
+        return found
+
+    def _read_part(self, name: str, part: str) -> dict:
+        try:
+            return _read_with_backups(self._part_path(name, part)).get(name, {})
+        except (OSError, ValueError) as e:
+            raise JournalUnreadable(str(e)) from e
+
+    def _write_sections(self, data: dict) -> None:
+        """Rewrites the parts held in memory; parts never loaded are left alone."""
+        os.makedirs(self.sections_dir, exist_ok=True)
+        on_disk = self._parts_on_disk()
+        for name in SECTIONS:
+            section = data.get(name, {})
+            if isinstance(section, ActivityStore):
+                section = section.entries
+            if isinstance(section, LazySection):
+                parts, stale = section.loaded_parts(), ()
+            else:
+                parts = split_parts(name, section)
+                stale = set(on_disk.get(name, ())) - set(parts)
+            for part, entries in parts.items():
+                content = {
+                    "schema_version": data.get("schema_version", SCHEMA_VERSION),
+                    name: to_persisted({name: entries})[name],
+                }
+                _write_json(self._part_path(name, part), content)
+            for part in stale:
+                os.remove(self._part_path(name, part))
+
+    # ─── Task shards ─────────────────────────────────────────────────────────
+
+    def _open_shards(self, data: dict) -> None:
+        """
+        Reads the shard headers listed by the snapshot; task bodies stay on
+        disk. A damaged shard stops the load (a snapshot written without its
+        tasks would delete them) unless it was moved aside as .corrupt.
+        """
+        self._generation = data.pop("shard_generation", 0)
+        self._shard_files, summaries = {}, {}
+        for filename in data.pop("shards", []):
+            path = os.path.join(self.shards_dir, filename)
+            if not os.path.exists(path) and os.path.exists(f"{path}.corrupt"):
+                print(
+                    f"{Color.YELLOW}⚠ Task shard {path} was moved aside; its tasks "
+                    f"are missing{Color.RESET}",
+                    file=sys.stderr,
+                )
+                continue
+            try:
+                with open(path, "rb") as f:
+                    header = get_codec()[1](f.readline())
+            except (OSError, ValueError) as e:
+                raise _shard_unreadable(path, e) from e
+            notebook = header["notebook"]
+            self._shard_files[notebook] = filename
+            summaries[notebook] = (
+                header["total"],
+                header["completed"],
+                header.get("pending"),  # absent from shards written before it
+            )
+        if summaries:
+            data["tasks"] = ShardedTasks(
+                data.get("tasks", []), summaries, self._read_shard
+            )
+
+    def _read_shard(self, notebook: str) -> list:
+        _, decode = get_codec()
+        path = os.path.join(self.shards_dir, self._shard_files[notebook])
+        try:
+            with open(path, "rb") as f:
+                f.readline()
+                body = f.read()
+            with paused_gc():
+                tasks = decode(body)["tasks"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise _shard_unreadable(path, e) from e
+        self._shard_digests[notebook] = hashlib.sha1(body).digest()
+        return tasks
+
+    def _write_shards(self, data: dict) -> tuple[dict, dict]:
+        """
+        Writes the shards whose tasks changed, under new names so the previous
+        snapshot stays intact until the new one replaces it. Returns the state
+        left for the main snapshot (shared tasks only) and notebook → shard file.
+        """
+        tasks = data["tasks"]
+        unread = tasks.unread_shards()
+        groups: dict[str, list] = {}
+        shared = []
+        for task in tasks.loaded():
+            if len(task.notebooks) == 1:
+                groups.setdefault(task.notebook, []).append(task)
+            else:
+                shared.append(task)
+        # A shard is rewritten from the tasks in memory: one never read would
+        # lose every task not in memory
+        clobbered = unread & groups.keys()
+        if clobbered:
+            raise RuntimeError(
+                f"refusing to overwrite unread task shards: {', '.join(sorted(clobbered))}"
+            )
+
+        encode, _ = get_codec()
+        files = {nb: f for nb, f in self._shard_files.items() if nb in unread}
+        generation = self._generation + 1
+        os.makedirs(self.shards_dir, exist_ok=True)
+        for notebook, group in groups.items():
+            body = encode(
+                {
+                    "schema_version": data.get("schema_version", SCHEMA_VERSION),
+                    "tasks": to_persisted({"tasks": group})["tasks"],
+                },
+                True,  # one line: the header is read with readline()
+                None,
+            )
+            digest = hashlib.sha1(body).digest()
+            if (
+                notebook in self._shard_files
+                and self._shard_digests.get(notebook) == digest
+            ):
+                files[notebook] = self._shard_files[notebook]
+                continue
+            header = {
+                "notebook": notebook,
+                "total": len(group),
+                "completed": sum(t.done for t in group),
+                "pending": pending_counts(group),
+            }
+            filename = f"{quote(notebook, safe='')}.{generation}.jsonl"
+            atomic_write(
+                os.path.join(self.shards_dir, filename),
+                encode(header, True, None) + b"\n" + body,
+                fsync=FSYNC_WRITES,
+            )
+            files[notebook] = filename
+            self._shard_digests[notebook] = digest
+
+        self._generation = generation
+        state = {
+            **data,
+            "tasks": shared,
+            "shards": sorted(files.values()),
+            "shard_generation": generation,
+        }
+        return state, files
+
+    def _remove_stale_shards(self) -> None:
+        """Deletes shard files the current snapshot no longer lists."""
+        if not os.path.isdir(self.shards_dir):
+            return
+        current = set(self._shard_files.values())
+        for filename in os.listdir(self.shards_dir):
+            if filename.endswith(".jsonl") and filename not in current:
+                os.remove(os.path.join(self.shards_dir, filename))
+
+
+def _shard_unreadable(path: str, error: Exception) -> JournalUnreadable:
+    return JournalUnreadable(
+        f"task shard {path} is unreadable ({error}); restore it, or rename it "
+        f"to {os.path.basename(path)}.corrupt to go on without its tasks"
+    )
+
+
+def _stamp(path: str) -> tuple | None:
+    """Identity of a file's current version: atomic rewrites change the inode."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _write_json(path: str, content: dict) -> None:
+    encode, _ = get_codec()
+    backup_file(path, BACKUP_DIR, BACKUP_COUNT)
+    atomic_write(path, encode(content, JSON_COMPACT, None), fsync=FSYNC_WRITES)
+
+
+def _read_with_backups(path: str) -> dict:
+    """Reads a journal file, falling back to its newest readable backup."""
+    try:
+        return _read_json(path)
+    except (OSError, ValueError):
+        pass
+    for backup in list_backups(path, BACKUP_DIR):
+        try:
+            data = _read_json(backup)
+        except (OSError, ValueError):
+            continue
+        # Keep the damaged file for inspection; the next save writes a new one
+        os.replace(path, f"{path}.corrupt")
+        print(
+            f"{Color.YELLOW}⚠ {path} is unreadable; restored {backup}{Color.RESET}",
+            file=sys.stderr,
+        )
+        return data
+    raise ValueError(f"{path} is unreadable and no valid backup exists")
+
+
+def _read_json(path: str) -> dict:
+    _, decode = get_codec()
+    with open(path, "rb") as f:
+        raw = f.read()
+    with paused_gc():
+        data = decode(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} does not contain a journal")
+    return data
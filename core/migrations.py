@@ -0,0 +1,102 @@
+"""
+Versioned schema migrations.
+Persisted state carries a `schema_version`; each step upgrades it by one
+version, so files written by the current version need no per-record work.
+"""
+
+from datetime import date
+
+from core.constants import MONTHS_LIST
+
+SCHEMA_VERSION = 2
+
+
+def _english_keys(data: dict) -> dict:
+    """v0 → v1: Portuguese keys from the original release, plus required keys."""
+
+    # Migrate Portuguese top-level keys to English
+    key_map = {
+        "cadernos": "notebooks",
+        "caderno_ativo": "active_notebook",
+        "tarefas": "tasks",
+        "metas": "goals",
+        "notas": "notes",
+        "calendario": "calendar",
+        "atividades_diarias": "daily_activities",
+        "proximo_id": "next_id",
+    }
+    for old_key, new_key in key_map.items():
+        if old_key in data and new_key not in data:
+            data[new_key] = data.pop(old_key)
+
+    # Migrate task field names
+    for task in data.get("tasks", []):
+        if "texto" in task and "text" not in task:
+            task["text"] = task.pop("texto")
+        if "caderno" in task and "notebook" not in task:
+            task["notebook"] = task.pop("caderno")
+        if "cadernos" in task and "notebooks" not in task:
+            task["notebooks"] = task.pop("cadernos")
+        if "prioridade" in task and "priority" not in task:
+            task["priority"] = task.pop("prioridade")
+        if "notebooks" not in task:
+            task["notebooks"] = [task.get("notebook", "")]
+
+    # Migrate goals keys
+    if "goals" in data:
+        goals = data["goals"]
+        goal_key_map = {"semanais": "weekly", "mensais": "monthly", "anuais": "yearly"}
+        for old_key, new_key in goal_key_map.items():
+            if old_key in goals and new_key not in goals:
+                goals[new_key] = goals.pop(old_key)
+        for goal_type in ("weekly", "monthly", "yearly"):
+            for goal in goals.get(goal_type, []):
+                if "texto" in goal and "text" not in goal:
+                    goal["text"] = goal.pop("texto")
+                if "progresso" in goal and "progress" not in goal:
+                    goal["progress"] = goal.pop("progresso")
+                if "dias_total" in goal and "total_days" not in goal:
+                    goal["total_days"] = goal.pop("dias_total")
+                if goal.get("tipo") == "semana_atual" and "type" not in goal:
+                    goal["type"] = "current_week"
+                    del goal["tipo"]
+
+    # Ensure required keys exist
+    if "calendar" not in data:
+        data["calendar"] = {}
+    if "daily_activities" not in data:
+        data["daily_activities"] = {}
+
+    # Migrate daily activity record keys
+    for record in data["daily_activities"].values():
+        if "atividades" in record and "activities" not in record:
+            record["activities"] = record.pop("atividades")
+        if "nivel" in record and "level" not in record:
+            record["level"] = record.pop("nivel")
+
+    return data
+
+
+def _monthly_keys(data: dict) -> dict:
+    """
+    v1 → v2: monthly goals were matched to a month by its name in their text;
+    they now carry year and month fields. The first month named wins and the
+    year is the current one, which is the year the old screen showed them in.
+    """
+    year = date.today().year
+    for goal in data.get("goals", {}).get("monthly", []):
+        if goal.get("month"):
+            continue
+        text = goal.get("text", "")
+        found = [(text.find(name), i) for i, name in enumerate(MONTHS_LIST, 1)]
+        found = [f for f in found if f[0] >= 0]
+        if found:
+            goal["year"], goal["month"] = year, min(found)[1]
+    return data
+
+
+# (target version, step) in order
+MIGRATIONS = [
+    (1, _english_keys),
+    (2, _monthly_keys),
+]
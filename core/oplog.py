@@ -0,0 +1,190 @@
+"""
+Append-only operation log.
+Every mutation is recorded as one compact JSON line, so persisting a change
+costs O(1) in the size of the journal. load_data replays the log on top of
+the last snapshot.
+"""
+
+import json
+import os
+import sys
+
+from core.goal_list import GoalList
+from core.records import DailyActivity, Goal, Task
+from core.search_index import index_op, unindex_op
+
+
+def make_op(op: str, /, **fields) -> dict:
+    """Builds an operation record."""
+    return {"op": op, **fields}
+
+
+# ─── Handlers ────────────────────────────────────────────────────────────────
+
+
+def _task_add(data: dict, rec: dict) -> None:
+    task = Task.from_dict(rec["task"])
+    data["tasks"].add(task)
+    data["next_id"] = max(data.get("next_id", 1), task.id + 1)
+
+
+def _task_set(data: dict, rec: dict) -> None:
+    data["tasks"].update(rec["id"], rec["field"], rec["value"])
+
+
+def _task_delete(data: dict, rec: dict) -> None:
+    data["tasks"].remove(rec["id"])
+
+
+def _notebook_add(data: dict, rec: dict) -> None:
+    if rec["name"] not in data["notebooks"]:
+        data["notebooks"].append(sys.intern(rec["name"]))
+
+
+def _notebook_remove(data: dict, rec: dict) -> None:
+    name = rec["name"]
+    if name not in data["notebooks"]:
+        return
+    data["notebooks"].remove(name)
+    data["tasks"].remove_notebook(name)
+    if data["active_notebook"] == name:
+        data["active_notebook"] = data["notebooks"][0]
+
+
+def _notebook_select(data: dict, rec: dict) -> None:
+    data["active_notebook"] = rec["name"]
+
+
+def _goal_add(data: dict, rec: dict) -> None:
+    goals = data.setdefault(
+        "goals", {"weekly": GoalList(), "monthly": GoalList(), "yearly": GoalList()}
+    )
+    goals.setdefault(rec["kind"], GoalList()).append(Goal.from_dict(rec["goal"]))
+
+
+def _goal_set(data: dict, rec: dict) -> None:
+    data["goals"][rec["kind"]].update(rec["index"], rec["field"], rec["value"])
+
+
+def _goal_delete(data: dict, rec: dict) -> None:
+    data["goals"][rec["kind"]].pop(rec["index"])
+
+
+def _calendar_set(data: dict, rec: dict) -> None:
+    month = data.setdefault("calendar", {}).setdefault(rec["month"], {})
+    month[rec["day"]] = sys.intern(rec["status"])
+
+
+def _calendar_clear(data: dict, rec: dict) -> None:
+    data.get("calendar", {}).get(rec["month"], {}).pop(rec["day"], None)
+
+
+def _activity_set(data: dict, rec: dict) -> None:
+    activity = DailyActivity.from_dict(rec["record"])
+    data.setdefault("daily_activities", {})[rec["date"]] = activity
+
+
+def _note_set(data: dict, rec: dict) -> None:
+    data.setdefault("notes", {})[rec["notebook"]] = rec["text"]
+
+
+HANDLERS = {
+    "task_add": _task_add,
+    "task_set": _task_set,
+    "task_delete": _task_delete,
+    "notebook_add": _notebook_add,
+    "notebook_remove": _notebook_remove,
+    "notebook_select": _notebook_select,
+    "goal_add": _goal_add,
+    "goal_set": _goal_set,
+    "goal_delete": _goal_delete,
+    "calendar_set": _calendar_set,
+    "calendar_clear": _calendar_clear,
+    "activity_set": _activity_set,
+    "note_set": _note_set,
+}
+
+
+# ─── Applying / replaying ────────────────────────────────────────────────────
+
+
+def apply_op(data: dict, rec: dict) -> None:
+    """Applies a single operation to the in-memory state (see core.records)."""
+    unindex_op(data, rec)
+    HANDLERS[rec["op"]](data, rec)
+    index_op(data, rec)
+
+
+def replay(data: dict, records: list) -> int:
+    """Applies logged operations in order. Returns the number applied."""
+    applied = 0
+    for rec in records:
+        if rec.get("op") in HANDLERS:
+            HANDLERS[rec["op"]](data, rec)
+            applied += 1
+    return applied
+
+
+# ─── File I/O ────────────────────────────────────────────────────────────────
+
+
+def read_log(path: str) -> list:
+    """
+    Reads all complete records. A torn last line (crash mid-write) is
+    ignored; an unreadable line before it raises ValueError.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    records = []
+    for number, line in enumerate(lines, 1):
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            if number < len(lines):
+                raise ValueError(f"{path}: record on line {number} is unreadable")
+    return records
+
+
+def drop_torn_tail(path: str) -> None:
+    """Cuts an unterminated last line, so the next append starts a fresh line."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        content = f.read()
+        if content and not content.endswith(b"\n"):
+            f.truncate(content.rfind(b"\n") + 1)
+
+
+def read_log_from(path: str, offset: int) -> tuple[list, int]:
+    """
+    Complete records after byte `offset`, and the offset just past them.
+    A record still being written is left for the next read.
+    """
+    if not os.path.exists(path):
+        return [], offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read()
+    end = chunk.rfind(b"\n") + 1
+    records = [json.loads(line) for line in chunk[:end].splitlines()]
+    return records, offset + end
+
+
+def append_log(path: str, records: list, fsync: bool = False) -> None:
+    """Appends records as compact JSON lines."""
+    lines = "".join(
+        json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for rec in records
+    )
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(lines)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def truncate_log(path: str) -> None:
+    if os.path.exists(path):
+        open(path, "w", encoding="utf-8").close()
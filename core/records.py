@@ -0,0 +1,238 @@
+"""
+Compact in-memory records for journal entries.
+Files keep the plain JSON layout: records are built when a journal is loaded
+(from_persisted) and turned back into dicts when it is saved (to_persisted).
+Notebook and activity names are interned, and task status is a small int.
+"""
+
+import sys
+from dataclasses import dataclass, field
+
+from core.activity_store import ActivityStore
+from core.codec import paused_gc
+from core.goal_list import GoalList
+from core.sections import LazySection
+from core.task_store import ShardedTasks, TaskStore
+
+PENDING = 0
+DONE = 1
+STATUS_SYMBOLS = ("•", "X")  # persisted form, indexed by status code
+_STATUS_CODES = {symbol: code for code, symbol in enumerate(STATUS_SYMBOLS)}
+
+
+def status_code(symbol: str) -> int:
+    return _STATUS_CODES.get(symbol, PENDING)
+
+
+_name_tuples: dict[tuple, tuple] = {}
+
+
+def _names(names) -> tuple:
+    """Interned, shared tuple of names (tasks in the same notebooks share one)."""
+    key = tuple(names)
+    shared = _name_tuples.get(key)
+    if shared is None:
+        shared = _name_tuples[key] = tuple(sys.intern(n) for n in key)
+    return shared
+
+
+@dataclass(slots=True)
+class Task:
+    id: int
+    text: str
+    status: int = PENDING
+    priority: int = 2
+    notebooks: tuple = ()  # home notebook first
+
+    @property
+    def notebook(self) -> str:
+        """The notebook the task was created in."""
+        return self.notebooks[0] if self.notebooks else ""
+
+    @property
+    def done(self) -> bool:
+        return self.status == DONE
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Task":
+        # Older records only have `notebook`
+        notebooks = d["notebooks"] if "notebooks" in d else [d.get("notebook", "")]
+        return cls(
+            d["id"],
+            d.get("text", ""),
+            status_code(d.get("status", "•")),
+            d.get("priority", 2),
+            _names(notebooks),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "text": self.text,
+            "status": STATUS_SYMBOLS[self.status],
+            "notebook": self.notebook,
+            "notebooks": list(self.notebooks),
+            "priority": self.priority,
+        }
+
+    def set(self, name: str, value) -> None:
+        """Applies a field update in persisted form (as in task_set operations)."""
+        if name == "status":
+            self.status = status_code(value)
+        elif name == "notebooks":
+            self.notebooks = _names(value)
+        elif name == "notebook":
+            rest = (n for n in self.notebooks if n != value)
+            self.notebooks = (sys.intern(value), *rest)
+        elif name in ("text", "priority"):
+            setattr(self, name, value)
+
+
+@dataclass(slots=True)
+class Goal:
+    text: str = ""
+    progress: int = 0
+    type: str = ""
+    year: int = 0  # year and month (1-12) of a monthly goal, else 0
+    month: int = 0
+    extra: dict | None = None  # fields this version doesn't know, kept as-is
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Goal":
+        extra = {k: v for k, v in d.items() if k not in GOAL_FIELDS}
+        return cls(
+            d.get("text", ""),
+            d.get("progress", 0),
+            d.get("type", ""),
+            d.get("year", 0),
+            d.get("month", 0),
+            extra or None,
+        )
+
+    def to_dict(self) -> dict:
+        d = {"text": self.text, "progress": self.progress}
+        if self.type:
+            d["type"] = self.type
+        if self.month:
+            d["year"], d["month"] = self.year, self.month
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def set(self, name: str, value) -> None:
+        if name in GOAL_FIELDS:
+            setattr(self, name, value)
+        else:
+            self.extra = {**(self.extra or {}), name: value}
+
+
+GOAL_FIELDS = ("text", "progress", "type", "year", "month")
+
+
+@dataclass(slots=True)
+class DailyActivity:
+    activities: dict = field(default_factory=dict)  # activity name → count
+    level: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.activities.values())
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "DailyActivity":
+        activities = {sys.intern(k): v for k, v in d.get("activities", {}).items()}
+        return cls(activities, d.get("level", 0))
+
+    def to_dict(self) -> dict:
+        return {"activities": dict(self.activities), "level": self.level}
+
+
+# ─── State conversion ────────────────────────────────────────────────────────
+# Calendar marks stay plain status strings: there are only three, so interning
+# them makes every mark a shared reference, smaller than any per-mark object.
+
+
+def _tasks_from(tasks) -> TaskStore:
+    if not isinstance(tasks, ShardedTasks):
+        return TaskStore(Task.from_dict(t) for t in tasks)
+
+    def load(notebook: str) -> list:
+        with paused_gc():
+            return [Task.from_dict(t) for t in tasks.load(notebook)]
+
+    store = TaskStore(Task.from_dict(t) for t in tasks.shared)
+    store.attach_shards(tasks.summaries, load)
+    return store
+
+
+def _goals_from(goals: dict) -> dict:
+    return {
+        kind: GoalList(Goal.from_dict(g) for g in items)
+        for kind, items in goals.items()
+    }
+
+
+def _calendar_from(calendar: dict) -> dict:
+    return {
+        month: {day: sys.intern(status) for day, status in days.items()}
+        for month, days in calendar.items()
+    }
+
+
+def _activities_from(activities: dict) -> dict:
+    return {date: DailyActivity.from_dict(r) for date, r in activities.items()}
+
+
+def _goals_to(goals: dict) -> dict:
+    return {kind: [g.to_dict() for g in items] for kind, items in goals.items()}
+
+
+def _calendar_to(calendar) -> dict:
+    return {month: dict(days) for month, days in calendar.items()}
+
+
+def _activities_to(activities) -> dict:
+    return {date: r.to_dict() for date, r in activities.items()}
+
+
+FROM_PERSISTED = {
+    "notebooks": lambda names: list(_names(names)),
+    "tasks": _tasks_from,
+    "goals": _goals_from,
+    "calendar": _calendar_from,
+    "daily_activities": _activities_from,
+}
+
+TO_PERSISTED = {
+    "tasks": lambda tasks: [t.to_dict() for t in tasks],
+    "goals": _goals_to,
+    "notes": dict,
+    "calendar": _calendar_to,
+    "daily_activities": _activities_to,
+}
+
+
+def from_persisted(data: dict) -> dict:
+    """
+    Replaces the persisted collections of `data` with records (in place).
+    Lazy sections convert their parts as they are loaded instead. Daily
+    activities are wrapped in a date-indexed core.activity_store.ActivityStore.
+    """
+    with paused_gc():
+        for key, convert in FROM_PERSISTED.items():
+            section = data.get(key, [] if key in ("notebooks", "tasks") else {})
+            if isinstance(section, LazySection):
+                section.convert = convert
+                data[key] = section
+            else:
+                data[key] = convert(section)
+    data["daily_activities"] = ActivityStore(data["daily_activities"])
+    return data
+
+
+def to_persisted(data: dict) -> dict:
+    """Shallow copy of `data` in the persisted layout (records as dicts)."""
+    with paused_gc():
+        return {
+            k: TO_PERSISTED[k](v) if k in TO_PERSISTED else v for k, v in data.items()
+        }
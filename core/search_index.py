@@ -0,0 +1,219 @@
+"""
+Full-text search over task text, goal text and notebook notes.
+An inverted index (token → documents) plus a sorted vocabulary for prefix
+lookups. It is built the first time a journal is searched and from then on
+kept current by apply_op, which unindexes what an operation is about to
+change and indexes the result, so it is never rebuilt.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from typing import NamedTuple
+
+from core.codec import paused_gc
+
+_TOKEN = re.compile(r"\w+")
+
+_index: "SearchIndex | None" = None
+_owner: dict | None = None  # the journal state _index was built from
+
+
+def tokenize(text: str) -> set[str]:
+    return set(_TOKEN.findall(text.lower()))
+
+
+class Match(NamedTuple):
+    kind: str  # "task", "goal" or "note"
+    key: object  # task id, goal kind or notebook name
+    text: str
+    item: object = None  # the Task / Goal record (None for notes)
+
+
+class SearchIndex:
+    """
+    Documents are task ids (ints), ("goal", id(goal)) tuples (the records
+    are kept alive in _goals) and ("note", notebook) tuples. A token found in
+    a single document maps to that document rather than to a set, which
+    keeps the many one-off tokens (numbers, names) small.
+    """
+
+    def __init__(self, data: dict):
+        self._postings: dict = {}
+        self._vocab: list[str] = []  # sorted tokens, for prefix lookups
+        self._goals: dict[tuple, tuple] = {}  # document → (kind, goal)
+        with paused_gc():
+            postings = self._postings
+            for task in data["tasks"]:
+                doc = task.id
+                for token in _TOKEN.findall(task.text.lower()):
+                    docs = postings.get(token)
+                    if docs is None:
+                        postings[token] = doc
+                    elif type(docs) is set:
+                        docs.add(doc)
+                    elif docs != doc:
+                        postings[token] = {docs, doc}
+            for kind, goals in data.get("goals", {}).items():
+                for goal in goals:
+                    self._add_goal(kind, goal)
+            for notebook, text in data.get("notes", {}).items():
+                self._add(("note", notebook), text)
+            self._vocab = sorted(postings)
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    def search(
+        self, data: dict, query: str, limit: int | None = None
+    ) -> tuple[int, list[Match]]:
+        """
+        Documents containing every term of `query`, each term as a prefix.
+        Returns the number found and the first `limit` of them: tasks by id,
+        then goals, then notes.
+        """
+        found: set | None = None
+        for term in sorted(tokenize(query), key=len, reverse=True):
+            docs = self._prefix(term)  # longest (most selective) term first
+            found = docs if found is None else found & docs
+            if not found:
+                return 0, []
+        if not found:
+            return 0, []
+
+        task_ids = [doc for doc in found if type(doc) is int]
+        if limit is not None and limit < len(task_ids):
+            task_ids = heapq.nsmallest(limit, task_ids)
+        else:
+            task_ids.sort()
+
+        matches = []
+        for task_id in task_ids:
+            task = data["tasks"].get(task_id)
+            matches.append(Match("task", task_id, task.text, task))
+        notes = []
+        for doc in found:
+            if type(doc) is int:
+                continue
+            if doc[0] == "goal":
+                kind, goal = self._goals[doc]
+                matches.append(Match("goal", kind, goal.text, goal))
+            else:
+                notes.append(Match("note", doc[1], data["notes"].get(doc[1], "")))
+        matches += sorted(notes, key=lambda m: m.key)
+        return len(found), matches[:limit]
+
+    def _prefix(self, term: str) -> set:
+        start = bisect_left(self._vocab, term)
+        end = bisect_left(self._vocab, term + "\U0010ffff", start)
+        if end - start == 1:
+            posting = self._postings[self._vocab[start]]
+            return posting if type(posting) is set else {posting}
+        docs = set()
+        for token in self._vocab[start:end]:
+            posting = self._postings[token]
+            if type(posting) is set:
+                docs |= posting
+            else:
+                docs.add(posting)
+        return docs
+
+    # ─── Updates ─────────────────────────────────────────────────────────────
+    # unindex() runs before an operation is applied, index() after it.
+
+    def unindex(self, data: dict, rec: dict) -> None:
+        op = rec["op"]
+        tasks = data["tasks"]
+        # Only tasks in memory are indexed, so unread shards need no lookup
+        if op == "task_add":
+            task = tasks.peek(rec["task"]["id"])  # re-added: replaces the old one
+            if task is not None:
+                self._remove(task.id, task.text)
+        elif op == "task_delete" or (op == "task_set" and rec["field"] == "text"):
+            task = tasks.peek(rec["id"])
+            if task is not None:
+                self._remove(task.id, task.text)
+        elif op == "notebook_remove":
+            # Tasks only in that notebook are deleted with it
+            for task in tasks.in_notebook(rec["name"]):
+                if task.notebooks == (rec["name"],):
+                    self._remove(task.id, task.text)
+        elif op in ("goal_set", "goal_delete"):
+            goals = data.get("goals", {}).get(rec["kind"], [])
+            if op == "goal_delete" or rec["field"] == "text":
+                goal = goals[rec["index"]]
+                doc = ("goal", id(goal))
+                self._remove(doc, goal.text)
+                del self._goals[doc]
+        elif op == "note_set":
+            notebook = rec["notebook"]
+            self._remove(("note", notebook), data.get("notes", {}).get(notebook, ""))
+
+    def index(self, data: dict, rec: dict) -> None:
+        op = rec["op"]
+        if op == "task_add":
+            task = data["tasks"].get(rec["task"]["id"])
+            self._add(task.id, task.text)
+        elif op == "task_set" and rec["field"] == "text":
+            task = data["tasks"].get(rec["id"])
+            if task is not None:
+                self._add(task.id, task.text)
+        elif op == "goal_add":
+            self._add_goal(rec["kind"], data["goals"][rec["kind"]][-1])
+        elif op == "goal_set" and rec["field"] == "text":
+            self._add_goal(rec["kind"], data["goals"][rec["kind"]][rec["index"]])
+        elif op == "note_set":
+            self._add(("note", rec["notebook"]), rec["text"])
+
+    def _add_goal(self, kind: str, goal) -> None:
+        doc = ("goal", id(goal))
+        self._goals[doc] = (kind, goal)
+        self._add(doc, goal.text)
+
+    def _add(self, doc, text: str) -> None:
+        for token in tokenize(text):
+            docs = self._postings.get(token)
+            if docs is None:
+                self._postings[token] = doc
+                insort(self._vocab, token)
+            elif type(docs) is set:
+                docs.add(doc)
+            elif docs != doc:
+                self._postings[token] = {docs, doc}
+
+    def _remove(self, doc, text: str) -> None:
+        for token in tokenize(text):
+            docs = self._postings.get(token)
+            if type(docs) is set:
+                docs.discard(doc)
+                if len(docs) == 1:
+                    self._postings[token] = next(iter(docs))
+            elif docs == doc:
+                del self._postings[token]
+                del self._vocab[bisect_left(self._vocab, token)]
+
+
+def search_index(data: dict) -> SearchIndex:
+    """The index of `data`, built on first use."""
+    global _index, _owner
+    if _owner is not data:
+        _index, _owner = SearchIndex(data), data
+    return _index
+
+
+def drop_index(data: dict) -> None:
+    """Forgets the index of `data` (after it was reloaded in place)."""
+    global _index, _owner
+    if _owner is data:
+        _index = _owner = None
+
+
+def unindex_op(data: dict, rec: dict) -> None:
+    """Drops what an operation is about to change (no-op until the index is built)."""
+    if _owner is data:
+        _index.unindex(data, rec)
+
+
+def index_op(data: dict, rec: dict) -> None:
+    """Indexes what an applied operation created or changed."""
+    if _owner is data:
+        _index.index(data, rec)
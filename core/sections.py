@@ -0,0 +1,114 @@
+"""
+Lazily loaded journal sections.
+Notes, calendar marks and daily activities live in their own files (calendar
+and activities split by year), so startup only parses the main snapshot and
+each part is read the first time one of its entries is touched.
+"""
+
+import copy
+from collections.abc import MutableMapping
+from typing import Callable
+
+
+def year_part(key: str) -> str:
+    """Partition of a date-keyed entry ("2025-03" or "2025-03-14" → "2025")."""
+    year = key[:4]
+    return year if year.isdigit() else "other"
+
+
+# Section key → partition function (None: the whole section is one part)
+SECTIONS: dict[str, Callable[[str], str] | None] = {
+    "notes": None,
+    "calendar": year_part,
+    "daily_activities": year_part,
+}
+
+
+def part_of(section: str, key: str) -> str:
+    partition = SECTIONS[section]
+    return partition(key) if partition else ""
+
+
+def split_parts(section: str, entries: dict) -> dict[str, dict]:
+    """Groups a section's entries by part."""
+    parts: dict[str, dict] = {}
+    for key, value in entries.items():
+        parts.setdefault(part_of(section, key), {})[key] = value
+    return parts
+
+
+class LazySection(MutableMapping):
+    """
+    A section whose parts are read on first access.
+    `load(part)` returns the persisted entries of one part; `convert` (set by
+    core.records) turns them into in-memory values as they are loaded.
+    """
+
+    def __init__(self, name: str, parts, load: Callable[[str], dict]):
+        self.name = name
+        self.convert: Callable[[dict], dict] = dict
+        self._load = load
+        self._pending = set(parts)  # parts on disk not read yet
+        self._loaded: set[str] = set()
+        self._entries: dict = {}
+
+    def loaded_parts(self) -> dict[str, dict]:
+        """Entries of every part read (or created) so far, by part."""
+        parts = {part: {} for part in self._loaded}
+        for key, value in self._entries.items():
+            parts[part_of(self.name, key)][key] = value
+        return parts
+
+    def parts(self) -> set[str]:
+        """Every part, read or not."""
+        return self._pending | self._loaded
+
+    def part(self, part: str) -> dict:
+        """Entries of one part, reading it if needed."""
+        self._ensure(part)
+        return {
+            key: value
+            for key, value in self._entries.items()
+            if part_of(self.name, key) == part
+        }
+
+    def _ensure(self, part: str) -> None:
+        if part in self._pending:
+            # A part that fails to read stays pending, so it is never rewritten
+            self._entries.update(self.convert(self._load(part)))
+            self._pending.discard(part)
+        self._loaded.add(part)
+
+    def _ensure_all(self) -> None:
+        for part in sorted(self._pending):
+            self._ensure(part)
+
+    # ─── MutableMapping ──────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        self._ensure(part_of(self.name, key))
+        return self._entries[key]
+
+    def __setitem__(self, key, value) -> None:
+        self._ensure(part_of(self.name, key))
+        self._entries[key] = value
+
+    def __delitem__(self, key) -> None:
+        self._ensure(part_of(self.name, key))
+        del self._entries[key]
+
+    def __iter__(self):
+        self._ensure_all()
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        self._ensure_all()
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        # Share the loader (it belongs to the backend); copy what is in memory
+        clone = LazySection(self.name, self._pending, self._load)
+        clone.convert = self.convert
+        clone._loaded = set(self._loaded)
+        clone._entries = copy.deepcopy(self._entries, memo)
+        return clone
@@ -0,0 +1,453 @@
+"""
+SQLite storage backend.
+Each operation becomes an indexed INSERT/UPDATE/DELETE, so saving a change
+never rewrites the rest of the journal. Other sessions' commits are noticed
+through PRAGMA data_version; the state is then reloaded.
+"""
+
+import json
+import os
+import sqlite3
+
+from core.backend import COLLECTION_KEYS, JournalChanged, StorageBackend
+from core.constants import SQLITE_FILE
+from core.fsutil import FileLock
+from core.records import to_persisted
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notebooks (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL,
+    status TEXT NOT NULL,
+    notebook TEXT NOT NULL,
+    priority INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_notebooks (
+    task_id INTEGER NOT NULL,
+    notebook TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (task_id, notebook)
+);
+CREATE INDEX IF NOT EXISTS idx_task_notebooks_notebook ON task_notebooks (notebook);
+CREATE TABLE IF NOT EXISTS goals (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    progress INTEGER NOT NULL,
+    extra TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_goals_kind ON goals (kind, position);
+CREATE TABLE IF NOT EXISTS calendar (
+    month TEXT NOT NULL,
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (month, day)
+);
+CREATE TABLE IF NOT EXISTS daily_activities (
+    date TEXT PRIMARY KEY,
+    level INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS activity_counts (
+    date TEXT NOT NULL,
+    activity TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, activity)
+);
+CREATE TABLE IF NOT EXISTS notes (
+    notebook TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+);
+"""
+
+# Collections (COLLECTION_KEYS) get their own tables; every other top-level
+# key is stored as JSON in `meta`
+TASK_COLUMNS = {"text", "status", "notebook", "priority"}
+GOAL_COLUMNS = {"text", "progress"}
+
+
+class SqliteBackend(StorageBackend):
+    def __init__(self, path: str = SQLITE_FILE):
+        self.path = path
+        self._conn = None
+        self._has_state = False
+        self._lock = FileLock(f"{path}.lock")
+        self._version = None  # data_version when this session last read or wrote
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Writes may come from the write-behind thread (see core.write_behind)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def lock(self) -> FileLock:
+        return self._lock
+
+    def changes(self) -> list | None:
+        # data_version changes only when another connection commits
+        if self._conn is None and not os.path.exists(self.path):
+            return []
+        return [] if self._data_version() == self._version else None
+
+    def _data_version(self) -> int:
+        return self._connect().execute("PRAGMA data_version").fetchone()[0]
+
+    def _check_unchanged(self) -> None:
+        if self._data_version() != self._version:
+            raise JournalChanged(f"{self.path} was changed by another session")
+
+    # ─── Loading ─────────────────────────────────────────────────────────────
+
+    def load(self) -> tuple[dict, list] | None:
+        if not os.path.exists(self.path):
+            return None
+        conn = self._connect()
+        self._version = self._data_version()
+        meta = {
+            k: json.loads(v) for k, v in conn.execute("SELECT key, value FROM meta")
+        }
+        if not meta:
+            return None
+        self._has_state = True
+
+        memberships: dict[int, list] = {}
+        for task_id, notebook in conn.execute(
+            "SELECT task_id, notebook FROM task_notebooks ORDER BY task_id, position"
+        ):
+            memberships.setdefault(task_id, []).append(notebook)
+
+        goals: dict[str, list] = {"weekly": [], "monthly": [], "yearly": []}
+        for kind, text, progress, extra in conn.execute(
+            "SELECT kind, text, progress, extra FROM goals ORDER BY kind, position"
+        ):
+            goals.setdefault(kind, []).append(
+                {"text": text, "progress": progress, **json.loads(extra)}
+            )
+
+        calendar: dict[str, dict] = {}
+        for month, day, status in conn.execute(
+            "SELECT month, day, status FROM calendar ORDER BY month"
+        ):
+            calendar.setdefault(month, {})[day] = status
+
+        activities = {
+            date: {"activities": {}, "level": level}
+            for date, level in conn.execute(
+                "SELECT date, level FROM daily_activities ORDER BY date"
+            )
+        }
+        for date, activity, count in conn.execute(
+            "SELECT date, activity, count FROM activity_counts ORDER BY rowid"
+        ):
+            activities[date]["activities"][activity] = count
+
+        data = {
+            "notebooks": [
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM notebooks ORDER BY position"
+                )
+            ],
+            "tasks": [
+                {
+                    "id": task_id,
+                    "text": text,
+                    "status": status,
+                    "notebook": notebook,
+                    "notebooks": memberships.get(task_id, []),
+                    "priority": priority,
+                }
+                for task_id, text, status, notebook, priority in conn.execute(
+                    "SELECT id, text, status, notebook, priority FROM tasks ORDER BY id"
+                )
+            ],
+            "goals": goals,
+            "notes": dict(conn.execute("SELECT notebook, text FROM notes")),
+            "calendar": calendar,
+            "daily_activities": activities,
+        }
+        data.update(meta)
+        return data, []
+
+    # ─── Saving ──────────────────────────────────────────────────────────────
+
+    def needs_snapshot(self) -> bool:
+        return not self._has_state
+
+    def append(self, data: dict, ops: list) -> None:
+        conn = self._connect()
+        with self._lock, conn:
+            self._check_unchanged()
+            for rec in ops:
+                OP_STATEMENTS[rec["op"]](conn, rec)
+            self._write_meta(conn, data)
+
+    def write_snapshot(self, data: dict) -> None:
+        data = to_persisted(data)
+        conn = self._connect()
+        with self._lock, conn:
+            if self._has_state:
+                self._check_unchanged()
+            for table in (
+                "meta",
+                "notebooks",
+                "tasks",
+                "task_notebooks",
+                "goals",
+                "calendar",
+                "daily_activities",
+                "activity_counts",
+                "notes",
+            ):
+                conn.execute(f"DELETE FROM {table}")
+
+            conn.executemany(
+                "INSERT INTO notebooks (name, position) VALUES (?, ?)",
+                [(name, pos) for pos, name in enumerate(data.get("notebooks", []))],
+            )
+            for task in data.get("tasks", []):
+                _insert_task(conn, task)
+            for kind, goals in data.get("goals", {}).items():
+                for pos, goal in enumerate(goals):
+                    _insert_goal(conn, kind, pos, goal)
+            conn.executemany(
+                "INSERT INTO calendar (month, day, status) VALUES (?, ?, ?)",
+                [
+                    (month, day, status)
+                    for month, days in data.get("calendar", {}).items()
+                    for day, status in days.items()
+                ],
+            )
+            for date, record in data.get("daily_activities", {}).items():
+                _replace_activity(conn, date, record)
+            conn.executemany(
+                "INSERT INTO notes (notebook, text) VALUES (?, ?)",
+                list(data.get("notes", {}).items()),
+            )
+            self._write_meta(conn, data)
+        self._has_state = True
+        self._version = self._data_version()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _write_meta(self, conn: sqlite3.Connection, data: dict) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [
+                (key, json.dumps(value, ensure_ascii=False))
+                for key, value in data.items()
+                if key not in COLLECTION_KEYS
+            ],
+        )
+
+
+# ─── Row helpers ─────────────────────────────────────────────────────────────
+
+
+def _insert_task(conn: sqlite3.Connection, task: dict) -> None:
+    conn.execute(
+        "INSERT INTO tasks (id, text, status, notebook, priority) VALUES (?, ?, ?, ?, ?)",
+        (
+            task["id"],
+            task.get("text", ""),
+            task.get("status", "•"),
+            task.get("notebook", ""),
+            task.get("priority", 2),
+        ),
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO task_notebooks (task_id, notebook, position) VALUES (?, ?, ?)",
+        [(task["id"], nb, pos) for pos, nb in enumerate(task.get("notebooks", []))],
+    )
+
+
+def _insert_goal(conn: sqlite3.Connection, kind: str, pos: int, goal: dict) -> None:
+    extra = {k: v for k, v in goal.items() if k not in GOAL_COLUMNS}
+    conn.execute(
+        "INSERT INTO goals (kind, position, text, progress, extra) VALUES (?, ?, ?, ?, ?)",
+        (
+            kind,
+            pos,
+            goal.get("text", ""),
+            goal.get("progress", 0),
+            json.dumps(extra, ensure_ascii=False),
+        ),
+    )
+
+
+def _replace_activity(conn: sqlite3.Connection, date: str, record: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO daily_activities (date, level) VALUES (?, ?)",
+        (date, record.get("level", 0)),
+    )
+    conn.execute("DELETE FROM activity_counts WHERE date = ?", (date,))
+    conn.executemany(
+        "INSERT INTO activity_counts (date, activity, count) VALUES (?, ?, ?)",
+        [(date, name, count) for name, count in record.get("activities", {}).items()],
+    )
+
+
+# ─── Operation → SQL ─────────────────────────────────────────────────────────
+
+
+def _task_add(conn: sqlite3.Connection, rec: dict) -> None:
+    _insert_task(conn, rec["task"])
+
+
+def _task_set(conn: sqlite3.Connection, rec: dict) -> None:
+    if rec["field"] == "notebooks":
+        _set_notebooks(conn, rec["id"], list(dict.fromkeys(rec["value"])))
+    elif rec["field"] == "notebook":
+        # The new primary notebook goes first, the others keep their order
+        rest = [
+            nb
+            for (nb,) in conn.execute(
+                "SELECT notebook FROM task_notebooks WHERE task_id = ? "
+                "ORDER BY position",
+                (rec["id"],),
+            )
+            if nb != rec["value"]
+        ]
+        _set_notebooks(conn, rec["id"], [rec["value"], *rest])
+    elif rec["field"] in TASK_COLUMNS:
+        conn.execute(
+            f"UPDATE tasks SET {rec['field']} = ? WHERE id = ?",
+            (rec["value"], rec["id"]),
+        )
+
+
+def _set_notebooks(conn: sqlite3.Connection, task_id: int, notebooks: list) -> None:
+    """Replaces a task's memberships; its notebook column follows the first."""
+    conn.execute("DELETE FROM task_notebooks WHERE task_id = ?", (task_id,))
+    conn.executemany(
+        "INSERT INTO task_notebooks (task_id, notebook, position) VALUES (?, ?, ?)",
+        [(task_id, nb, pos) for pos, nb in enumerate(notebooks)],
+    )
+    conn.execute(
+        "UPDATE tasks SET notebook = ? WHERE id = ?",
+        (notebooks[0] if notebooks else "", task_id),
+    )
+
+
+def _task_delete(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute("DELETE FROM task_notebooks WHERE task_id = ?", (rec["id"],))
+    conn.execute("DELETE FROM tasks WHERE id = ?", (rec["id"],))
+
+
+def _notebook_add(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO notebooks (name, position) "
+        "SELECT ?, COALESCE(MAX(position), -1) + 1 FROM notebooks",
+        (rec["name"],),
+    )
+
+
+def _notebook_remove(conn: sqlite3.Connection, rec: dict) -> None:
+    name = rec["name"]
+    task_ids = [
+        (task_id,)
+        for (task_id,) in conn.execute(
+            "SELECT task_id FROM task_notebooks WHERE notebook = ?", (name,)
+        )
+    ]
+    conn.execute("DELETE FROM notebooks WHERE name = ?", (name,))
+    conn.execute("DELETE FROM task_notebooks WHERE notebook = ?", (name,))
+    conn.executemany(
+        "DELETE FROM tasks WHERE id = ? AND NOT EXISTS "
+        "(SELECT 1 FROM task_notebooks WHERE task_id = tasks.id)",
+        task_ids,
+    )
+
+
+def _goal_add(conn: sqlite3.Connection, rec: dict) -> None:
+    (count,) = conn.execute(
+        "SELECT COUNT(*) FROM goals WHERE kind = ?", (rec["kind"],)
+    ).fetchone()
+    _insert_goal(conn, rec["kind"], count, rec["goal"])
+
+
+def _goal_set(conn: sqlite3.Connection, rec: dict) -> None:
+    if rec["field"] in GOAL_COLUMNS:
+        conn.execute(
+            f"UPDATE goals SET {rec['field']} = ? WHERE kind = ? AND position = ?",
+            (rec["value"], rec["kind"], rec["index"]),
+        )
+        return
+    (extra,) = conn.execute(
+        "SELECT extra FROM goals WHERE kind = ? AND position = ?",
+        (rec["kind"], rec["index"]),
+    ).fetchone()
+    extra = {**json.loads(extra), rec["field"]: rec["value"]}
+    conn.execute(
+        "UPDATE goals SET extra = ? WHERE kind = ? AND position = ?",
+        (json.dumps(extra, ensure_ascii=False), rec["kind"], rec["index"]),
+    )
+
+
+def _goal_delete(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "DELETE FROM goals WHERE kind = ? AND position = ?",
+        (rec["kind"], rec["index"]),
+    )
+    conn.execute(
+        "UPDATE goals SET position = position - 1 WHERE kind = ? AND position > ?",
+        (rec["kind"], rec["index"]),
+    )
+
+
+def _calendar_set(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO calendar (month, day, status) VALUES (?, ?, ?)",
+        (rec["month"], rec["day"], rec["status"]),
+    )
+
+
+def _calendar_clear(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "DELETE FROM calendar WHERE month = ? AND day = ?", (rec["month"], rec["day"])
+    )
+
+
+def _activity_set(conn: sqlite3.Connection, rec: dict) -> None:
+    _replace_activity(conn, rec["date"], rec["record"])
+
+
+def _note_set(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO notes (notebook, text) VALUES (?, ?)",
+        (rec["notebook"], rec["text"]),
+    )
+
+
+def _meta_only(conn: sqlite3.Connection, rec: dict) -> None:
+    """Operations whose effect is fully captured by the meta table."""
+
+
+OP_STATEMENTS = {
+    "task_add": _task_add,
+    "task_set": _task_set,
+    "task_delete": _task_delete,
+    "notebook_add": _notebook_add,
+    "notebook_remove": _notebook_remove,
+    "notebook_select": _meta_only,
+    "goal_add": _goal_add,
+    "goal_set": _goal_set,
+    "goal_delete": _goal_delete,
+    "calendar_set": _calendar_set,
+    "calendar_clear": _calendar_clear,
+    "activity_set": _activity_set,
+    "note_set": _note_set,
+}
@@ -1,14 +1,62 @@
 """
 Data persistence module.
-Responsible for loading and saving application state to JSON.
+Responsible for loading and saving application state through the storage
+backend selected by STORAGE_BACKEND ("json" or "sqlite"). Mutations are
+persisted as operation records (see core.oplog) rather than full rewrites.
+Several sessions may share one journal: each write happens under the
+backend's lock after merging what the others saved (see sync_data).
 """
 
-import json
 import os
 from datetime import datetime
 
+from core.backend import JournalUnreadable, StorageBackend
 from core.colors import Color
-from core.constants import DATA_FILE, MONTHS_EN, MONTHS_LIST
+from core.constants import (
+    BACKUP_DIR,
+    DATA_FILE,
+    MONTHS_EN,
+    MONTHS_LIST,
+    STORAGE_BACKEND,
+    WRITE_BEHIND,
+    WRITE_BEHIND_MS,
+)
+from core.json_backend import JsonBackend
+from core.migrations import MIGRATIONS, SCHEMA_VERSION
+from core.oplog import HANDLERS, apply_op, make_op, replay
+from core.records import from_persisted
+from core.search_index import drop_index
+from core.sqlite_backend import SqliteBackend
+from core.write_behind import WriteBehind
+
+BACKENDS = {
+    "json": JsonBackend,
+    "sqlite": SqliteBackend,
+}
+
+_backend: StorageBackend | None = None
+
+
+class EditDiscarded(Exception):
+    """An edit's target was removed by another session; nothing was saved."""
+
+
+def get_backend() -> StorageBackend:
+    """Returns the configured storage backend (created on first use)."""
+    global _backend
+    if _backend is None:
+        _backend = BACKENDS[STORAGE_BACKEND]()
+        if WRITE_BEHIND:
+            _backend = WriteBehind(_backend, WRITE_BEHIND_MS)
+    return _backend
+
+
+def close_storage() -> None:
+    """Flushes pending writes and releases the backend (call before exiting)."""
+    global _backend
+    if _backend is not None:
+        _backend.close()
+        _backend = None
 
 
 def _get_initial_state() -> dict:
@@ -57,9 +105,16 @@ def _get_initial_state() -> dict:
                 {"text": "Read 1 book", "progress": 30},
             ],
             "monthly": [
-                {"text": f"{name} - {days} days", "progress": 0, "total_days": days}
-                for name, days in zip(
-                    MONTHS_LIST, [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+                {
+                    "text": f"{name} - {days} days",
+                    "progress": 0,
+                    "total_days": days,
+                    "year": now.year,
+                    "month": month,
+                }
+                for month, (name, days) in enumerate(
+                    zip(MONTHS_LIST, [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]),
+                    1,
                 )
             ],
             "yearly": [
@@ -71,87 +126,190 @@ def _get_initial_state() -> dict:
         "calendar": {},
         "daily_activities": {},
         "next_id": 4,
+        "schema_version": SCHEMA_VERSION,
     }
 
 
 def _migrate_data(data: dict) -> dict:
-    """Applies migrations for compatibility with older versions (including Portuguese keys)."""
-
-    # Migrate Portuguese top-level keys to English
-    key_map = {
-        "cadernos": "notebooks",
-        "caderno_ativo": "active_notebook",
-        "tarefas": "tasks",
-        "metas": "goals",
-        "notas": "notes",
-        "calendario": "calendar",
-        "atividades_diarias": "daily_activities",
-        "proximo_id": "next_id",
-    }
-    for old_key, new_key in key_map.items():
-        if old_key in data and new_key not in data:
-            data[new_key] = data.pop(old_key)
-
-    # Migrate task field names
-    for task in data.get("tasks", []):
-        if "texto" in task and "text" not in task:
-            task["text"] = task.pop("texto")
-        if "caderno" in task and "notebook" not in task:
-            task["notebook"] = task.pop("caderno")
-        if "cadernos" in task and "notebooks" not in task:
-            task["notebooks"] = task.pop("cadernos")
-        if "prioridade" in task and "priority" not in task:
-            task["priority"] = task.pop("prioridade")
-        if "notebooks" not in task:
-            task["notebooks"] = [task.get("notebook", "")]
-
-    # Migrate goals keys
-    if "goals" in data:
-        goals = data["goals"]
-        goal_key_map = {"semanais": "weekly", "mensais": "monthly", "anuais": "yearly"}
-        for old_key, new_key in goal_key_map.items():
-            if old_key in goals and new_key not in goals:
-                goals[new_key] = goals.pop(old_key)
-        for goal_type in ("weekly", "monthly", "yearly"):
-            for goal in goals.get(goal_type, []):
-                if "texto" in goal and "text" not in goal:
-                    goal["text"] = goal.pop("texto")
-                if "progresso" in goal and "progress" not in goal:
-                    goal["progress"] = goal.pop("progresso")
-                if "dias_total" in goal and "total_days" not in goal:
-                    goal["total_days"] = goal.pop("dias_total")
-                if goal.get("tipo") == "semana_atual" and "type" not in goal:
-                    goal["type"] = "current_week"
-                    del goal["tipo"]
-
-    # Ensure required keys exist
-    if "calendar" not in data:
-        data["calendar"] = {}
-    if "daily_activities" not in data:
-        data["daily_activities"] = {}
-
+    """Upgrades persisted state to SCHEMA_VERSION, running only the missing steps."""
+    version = data.get("schema_version", 0)
+    for target, step in MIGRATIONS:
+        if version < target:
+            data = step(data)
+    data["schema_version"] = SCHEMA_VERSION
     return data
 
 
 def load_data() -> dict:
-    """Loads data from the JSON file. Returns default state if not found."""
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return _migrate_data(data)
-        except Exception:
-            pass
+    """
+    Loads data from the configured backend. Returns default state if nothing
+    is stored yet; raises JournalUnreadable if the stored journal is damaged,
+    rather than starting over on top of it.
+    """
+    backend = get_backend()
+    try:
+        with backend.lock():
+            loaded = backend.load()
+            if loaded is not None:
+                data, pending_ops = loaded
+                outdated = data.get("schema_version", 0) < SCHEMA_VERSION
+                data = _prepare(data, pending_ops)
+                if outdated:
+                    save_data(data)  # rewrite once in the current schema
+                return data
+            if STORAGE_BACKEND != "json" and os.path.exists(DATA_FILE):
+                return import_json(DATA_FILE)
+    except Exception as e:
+        raise JournalUnreadable(
+            f"The journal could not be read: {e}. Restore a copy from "
+            f"{BACKUP_DIR}/ or move the damaged files aside to start a new one."
+        ) from e
 
-    return _get_initial_state()
+    return _prepare(_get_initial_state(), [])
 
 
-def save_data(data: dict) -> bool:
-    """Persists data to the JSON file. Returns True if successful."""
+def _prepare(data: dict, pending_ops: list) -> dict:
+    """Migrates persisted state, indexes its tasks and replays pending operations."""
+    data = _migrate_data(data)
+    data = from_persisted(data)
+    replay(data, pending_ops)
+    return data
+
+
+def import_json(path: str = DATA_FILE) -> dict:
+    """
+    One-shot import of a JSON journal (snapshot + operation log) into the
+    configured backend. Returns the imported state.
+    """
+    data = _prepare(*JsonBackend(path).load())
+    get_backend().write_snapshot(data)
+    return data
+
+
+def save_data(data: dict, *ops: dict) -> bool:
+    """
+    Persists data. Returns True if successful.
+    With ops, only those operations are written; otherwise (or when the
+    backend asks for it, e.g. a long JSON log) the full state is rewritten.
+    """
+    backend = get_backend()
     try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ops and not backend.needs_snapshot():
+            backend.append(data, list(ops))
+        else:
+            backend.write_snapshot(data)
         return True
     except Exception as e:
         print(f"{Color.RED}✗ Error saving: {e}{Color.RESET}")
         return False
+
+
+def commit(data: dict, op: str, /, **fields) -> bool:
+    """
+    Applies a single operation to the state and persists it. Returns True if
+    saved. Other sessions' changes are merged first, under the journal lock;
+    raises EditDiscarded if the operation's target no longer exists.
+    """
+    backend = get_backend()
+    with backend.lock():
+        goal = _target_goal(data, op, fields)
+        sync_data(data)
+        _rebase(data, op, fields, goal)
+        rec = make_op(op, **fields)
+        apply_op(data, rec)
+        return save_data(data, rec)
+
+
+# ─── Sessions sharing a journal ──────────────────────────────────────────────
+
+
+def sync_data(data: dict) -> bool:
+    """
+    Brings `data` up to date with what other sessions saved: their operations
+    are applied, or the journal is reloaded in place if it was rewritten.
+    Costs a stat() or two when nothing changed. Returns True if data changed.
+    """
+    backend = get_backend()
+    try:
+        with backend.lock():
+            ops = backend.changes()
+            if ops is None:
+                _reload(data, backend)
+                return True
+            for rec in ops:
+                # The active notebook is this session's own
+                if rec.get("op") in HANDLERS and rec["op"] != "notebook_select":
+                    apply_op(data, rec)
+            return bool(ops)
+    except Exception:
+        return False
+
+
+def _reload(data: dict, backend: StorageBackend) -> None:
+    loaded = backend.load()
+    if loaded is None:
+        return
+    active = data.get("active_notebook")
+    fresh = _prepare(*loaded)
+    data.clear()
+    data.update(fresh)
+    if active in data["notebooks"]:
+        data["active_notebook"] = active
+    drop_index(data)
+
+
+def _target_goal(data: dict, op: str, fields: dict):
+    """The goal a goal_set/goal_delete refers to, looked up before merging."""
+    if op in ("goal_set", "goal_delete"):
+        return data["goals"][fields["kind"]][fields["index"]]
+    return None
+
+
+def _rebase(data: dict, op: str, fields: dict, goal) -> None:
+    """
+    Re-targets an operation built before other sessions' changes were merged:
+    a new task takes the next free id and leaves out notebooks removed since,
+    and goal operations follow their goal (the same object, as merged
+    operations update goals in place, or an equal one after a reload) to its
+    current position. Raises EditDiscarded if the task, its notebooks or the
+    goal are gone.
+    """
+    if op == "task_add":
+        task = fields["task"]
+        if task["id"] < data["next_id"]:
+            task["id"] = data["next_id"]
+        notebooks = [
+            nb
+            for nb in task.get("notebooks") or [task["notebook"]]
+            if nb in data["notebooks"]
+        ]
+        if not notebooks:
+            raise EditDiscarded(
+                "The task's notebook was removed by another session; the task was not added."
+            )
+        if task["notebook"] not in notebooks:
+            task["notebook"] = notebooks[0]
+        task["notebooks"] = [task["notebook"]] + [
+            nb for nb in notebooks if nb != task["notebook"]
+        ]
+    elif op in ("task_set", "task_delete") and fields["id"] not in data["tasks"]:
+        raise EditDiscarded(
+            "This task was deleted by another session; your edit was discarded."
+        )
+    elif op == "task_set" and fields["field"] == "notebook":
+        if fields["value"] not in data["notebooks"]:
+            raise EditDiscarded(
+                "That notebook was removed by another session; your edit was discarded."
+            )
+    elif goal is not None:
+        goals = data["goals"][fields["kind"]]
+        index = next((i for i, g in enumerate(goals) if g is goal), None)
+        if index is None:
+            # After a reload the goal is a new object: look for it by value
+            same = [i for i, g in enumerate(goals) if g == goal]
+            if len(same) != 1:
+                raise EditDiscarded(
+                    "This goal was deleted or changed by another session; your edit was discarded."
+                )
+            index = same[0]
+        fields["index"] = index
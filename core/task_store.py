@@ -0,0 +1,277 @@
+"""
+Indexed task collection.
+Keeps tasks by id plus an inverted notebook → ids index so lookups are O(1)
+and per-notebook views are proportional to that notebook's size. Completion
+and pending-per-priority counters are maintained alongside, so statistics
+never scan tasks. Each notebook viewed in display order also gets a sorted
+(status, priority) key list, kept current by the same index maintenance, so a
+page of it is a slice.
+Holds core.records.Task instances.
+With a sharded journal (see core.json_backend), a notebook's own tasks are
+only read when that notebook is first needed; until then its shard's summary
+header (totals and pending tasks per priority) stands in for it in the
+counters.
+"""
+
+import copy
+from bisect import bisect_left, insort
+from typing import Callable, NamedTuple
+
+PRIORITIES = (1, 2, 3)
+
+
+class ShardedTasks(NamedTuple):
+    """Persisted tasks of a sharded journal, as returned by the backend."""
+
+    shared: list  # tasks in several notebooks (kept in the main snapshot)
+    # notebook → (total, completed, pending per priority or None) of its unread shard
+    summaries: dict
+    load: Callable  # notebook → persisted tasks of its shard
+
+
+class TaskStore:
+    """
+    Tasks keyed by id, in insertion order.
+    The notebook index maps each name to an insertion-ordered set of ids
+    (a dict with None values), so notebook views keep the original order.
+    """
+
+    def __init__(self, tasks=()):
+        self._by_id: dict = {}
+        self._by_notebook: dict[str, dict[int, None]] = {}
+        self._completed_by_notebook: dict[str, int] = {}
+        self._completed = 0
+        self._pending_by_priority = dict.fromkeys(PRIORITIES, 0)
+        # notebook → sorted display keys (see _order_key), built on first use
+        self._orders: dict[str, list[tuple]] = {}
+        self._shards: dict[str, tuple] = {}  # unread shard summaries
+        self._load_shard: Callable | None = None
+        for task in tasks:
+            self.add(task)
+
+    def __iter__(self):
+        self._load_all()
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id) + sum(s[0] for s in self._shards.values())
+
+    def __contains__(self, task_id: int) -> bool:
+        return self.get(task_id) is not None
+
+    def __deepcopy__(self, memo):
+        # Unread shards stay on disk; the loader belongs to the backend and is shared
+        clone = TaskStore(copy.deepcopy(list(self._by_id.values()), memo))
+        clone._attach(self._shards, self._load_shard)
+        return clone
+
+    def get(self, task_id: int):
+        if task_id not in self._by_id and self._shards:
+            self._load_all()
+        return self._by_id.get(task_id)
+
+    def peek(self, task_id: int):
+        """The task if it is in memory, without reading any shard (else None)."""
+        return self._by_id.get(task_id)
+
+    def in_notebook(self, notebook: str) -> list:
+        """Tasks in a notebook, in insertion order."""
+        self._load(notebook)
+        return [self._by_id[i] for i in self._by_notebook.get(notebook, ())]
+
+    def count(self, notebook: str) -> int:
+        unread = self._shards.get(notebook, (0, 0))[0]
+        return len(self._by_notebook.get(notebook, ())) + unread
+
+    def stats(self, notebook: str) -> tuple[int, int]:
+        """(total, completed) for a notebook, in O(1)."""
+        unread = self._shards.get(notebook, (0, 0))[1]
+        completed = self._completed_by_notebook.get(notebook, 0) + unread
+        return self.count(notebook), completed
+
+    def completed(self) -> int:
+        """Completed tasks across all notebooks (each task counted once)."""
+        return self._completed
+
+    def ordered(self, notebook: str, start: int = 0, stop: int | None = None) -> list:
+        """
+        Tasks of a notebook in display order (pending first, then by priority
+        and id), from position `start` to `stop`. Only that window is built.
+        """
+        keys = self._orders.get(notebook)
+        if keys is None:
+            self._load(notebook)
+            keys = self._orders[notebook] = sorted(
+                _order_key(self._by_id[i]) for i in self._by_notebook.get(notebook, ())
+            )
+        return [self._by_id[key[2]] for key in keys[start:stop]]
+
+    def pending_by_priority(self) -> dict[int, int]:
+        """Pending tasks per priority across the journal, from counters."""
+        for notebook, summary in list(self._shards.items()):
+            if summary[2] is None:
+                self._load(notebook)  # a shard header without priorities
+        return dict(self._pending_by_priority)
+
+    # ─── Shards ──────────────────────────────────────────────────────────────
+
+    def attach_shards(self, summaries: dict, load: Callable) -> None:
+        """Registers unread shards (see ShardedTasks.summaries), read via load(notebook)."""
+        self._attach(summaries, load)
+
+    def unread_shards(self) -> set:
+        return set(self._shards)
+
+    def loaded(self):
+        """Tasks in memory, without reading any shard."""
+        return iter(self._by_id.values())
+
+    def _attach(self, summaries: dict, load: Callable | None) -> None:
+        self._shards = dict(summaries)
+        self._load_shard = load
+        for summary in self._shards.values():
+            self._add_summary(summary, 1)
+
+    def _load(self, notebook: str) -> None:
+        summary = self._shards.get(notebook)
+        if summary is not None:
+            # Read first: a shard that fails to read stays unread (and on disk)
+            tasks = self._load_shard(notebook)
+            del self._shards[notebook]
+            self._add_summary(summary, -1)
+            for task in tasks:
+                self.add(task)
+            # Shared tasks were indexed first; restore creation (id) order
+            ids = self._by_notebook.get(notebook)
+            if ids:
+                self._by_notebook[notebook] = dict.fromkeys(sorted(ids))
+
+    def _add_summary(self, summary: tuple, sign: int) -> None:
+        self._completed += sign * summary[1]
+        if summary[2] is not None:
+            for priority, count in zip(PRIORITIES, summary[2]):
+                self._pending_by_priority[priority] += sign * count
+
+    def _load_all(self) -> None:
+        for notebook in list(self._shards):
+            self._load(notebook)
+
+    # ─── Mutations ───────────────────────────────────────────────────────────
+
+    def add(self, task) -> None:
+        # A shard is rewritten whole, so it must be read before it changes
+        for nb in task.notebooks:
+            self._load(nb)
+        if task.id in self._by_id:
+            self.remove(task.id)
+        self._by_id[task.id] = task
+        self._index(task)
+
+    def remove(self, task_id: int):
+        if task_id not in self._by_id and self._shards:
+            self._load_all()
+        task = self._by_id.pop(task_id, None)
+        if task is not None:
+            self._unindex(task)
+        return task
+
+    def update(self, task_id: int, field: str, value):
+        """Applies a persisted-form field update (see Task.set), keeping indexes current."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        if field in ("notebook", "notebooks", "status", "priority"):
+            # Counters and display keys are adjusted in place; notebooks the
+            # task stays in keep its position in their insertion order
+            self._unorder(task)
+            self._count(task, -1)
+            before = task.notebooks
+            task.set(field, value)
+            for nb in before:
+                if nb not in task.notebooks and nb in self._by_notebook:
+                    self._by_notebook[nb].pop(task.id, None)
+            for nb in task.notebooks:
+                if nb not in before:
+                    self._load(nb)
+                    self._by_notebook.setdefault(nb, {})[task.id] = None
+            self._count(task, 1)
+            self._order(task)
+        else:
+            task.set(field, value)
+        return task
+
+    def remove_notebook(self, notebook: str) -> None:
+        """Drops a notebook from its tasks; tasks left without notebooks are deleted."""
+        self._load(notebook)
+        # A task left in one notebook moves into that notebook's shard, which
+        # is rewritten whole: read it first
+        for task_id in self._by_notebook.get(notebook, ()):
+            rest = [n for n in self._by_id[task_id].notebooks if n != notebook]
+            if len(rest) == 1:
+                self._load(rest[0])
+        self._completed_by_notebook.pop(notebook, None)
+        self._orders.pop(notebook, None)
+        for task_id in self._by_notebook.pop(notebook, {}):
+            task = self._by_id[task_id]
+            task.notebooks = tuple(n for n in task.notebooks if n != notebook)
+            if not task.notebooks:
+                self.remove(task_id)
+
+    # ─── Index maintenance ───────────────────────────────────────────────────
+
+    def _index(self, task) -> None:
+        for nb in task.notebooks:
+            self._by_notebook.setdefault(nb, {})[task.id] = None
+        self._count(task, 1)
+        self._order(task)
+
+    def _unindex(self, task) -> None:
+        self._count(task, -1)
+        self._unorder(task)
+        for nb in task.notebooks:
+            ids = self._by_notebook.get(nb)
+            if ids is not None:
+                ids.pop(task.id, None)
+
+    def _order(self, task) -> None:
+        key = _order_key(task)
+        for nb in task.notebooks:
+            keys = self._orders.get(nb)
+            if keys is not None:
+                insort(keys, key)
+
+    def _unorder(self, task) -> None:
+        """Drops a task's display keys (before a field in the key changes)."""
+        key = _order_key(task)
+        for nb in task.notebooks:
+            keys = self._orders.get(nb)
+            if keys is not None:
+                i = bisect_left(keys, key)
+                if i < len(keys) and keys[i] == key:
+                    del keys[i]
+
+    def _count(self, task, delta: int) -> None:
+        """Adjusts completion and pending-priority counters for an indexed task."""
+        if not task.done:
+            priority = task.priority if task.priority in PRIORITIES else 2
+            self._pending_by_priority[priority] += delta
+            return
+        self._completed += delta
+        for nb in task.notebooks:
+            if nb in self._by_notebook:
+                self._completed_by_notebook[nb] = (
+                    self._completed_by_notebook.get(nb, 0) + delta
+                )
+
+
+def pending_counts(tasks) -> list[int]:
+    """Pending tasks per priority, in PRIORITIES order (as in shard headers)."""
+    counts = dict.fromkeys(PRIORITIES, 0)
+    for task in tasks:
+        if not task.done:
+            counts[task.priority if task.priority in PRIORITIES else 2] += 1
+    return list(counts.values())
+
+
+def _order_key(task) -> tuple:
+    return (task.status, -task.priority, task.id)
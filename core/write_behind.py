@@ -0,0 +1,137 @@
+"""
+Write-behind persistence.
+Wraps a storage backend so saves only queue work; a background thread
+coalesces bursts and flushes them at most every WRITE_BEHIND_MS, and on exit.
+Saves made while the journal lock is held keep it held (see FileLock.keep)
+until the thread has written them, so other sessions wait for them instead
+of building on a journal behind this one. The thread appends under the lock,
+which moves the backend past this session's own records: changes() never
+returns them.
+"""
+
+import atexit
+import copy
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from core.backend import StorageBackend, state_header
+from core.fsutil import FileLock
+
+
+class WriteBehind(StorageBackend):
+    def __init__(self, backend: StorageBackend, interval_ms: int):
+        self.backend = backend
+        self.interval = interval_ms / 1000
+        self.error: Exception | None = None
+        self._lost_writes = False  # a flush failed; the next save must be full
+        self._pending: list[tuple[str, dict, object]] = []
+        self._lock = threading.Lock()  # guards _pending
+        self._flush_lock = threading.Lock()  # one flush at a time
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._run, name="journal-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+        _exit_on_signals()
+
+    # ─── StorageBackend ──────────────────────────────────────────────────────
+
+    def load(self) -> tuple[dict, list] | None:
+        self.flush()
+        return self.backend.load()
+
+    @contextmanager
+    def lock(self):
+        with self.backend.lock() as journal:
+            try:
+                yield
+            finally:
+                if self._pending and isinstance(journal, FileLock):
+                    journal.keep()  # released by flush() once the saves are written
+
+    def changes(self) -> list | None:
+        return self.backend.changes()
+
+    def needs_snapshot(self) -> bool:
+        return self._lost_writes or self.backend.needs_snapshot()
+
+    def append(self, data: dict, ops: list) -> None:
+        self._submit("ops", state_header(data), copy.deepcopy(ops))
+
+    def write_snapshot(self, data: dict) -> None:
+        self._submit("snapshot", {}, copy.deepcopy(data))
+
+    def close(self) -> None:
+        """Stops the writer thread after a final flush. Safe to call twice."""
+        if not self._closing:
+            self._closing = True
+            self._wake.set()
+            self._thread.join()
+            self.backend.close()
+
+    # ─── Queue ───────────────────────────────────────────────────────────────
+
+    def _submit(self, kind: str, header: dict, payload) -> None:
+        """Queues work; raises the last background error so the caller can report it."""
+        error, self.error = self.error, None
+        with self._lock:
+            if kind == "snapshot":
+                self._pending.clear()  # superseded by the full state
+                self._lost_writes = False
+            self._pending.append((kind, header, payload))
+        self._wake.set()
+        if error is not None:
+            raise error
+
+    def _run(self) -> None:
+        while not self._closing:
+            self._wake.wait()
+            if not self._closing:
+                time.sleep(self.interval)  # let a burst of changes accumulate
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes everything queued so far, coalescing consecutive operations."""
+        # The journal lock first, as commits hold it while queueing
+        with self.backend.lock() as journal, self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._wake.clear()
+            try:
+                for kind, header, payload in _coalesce(pending):
+                    if kind == "snapshot":
+                        self.backend.write_snapshot(payload)
+                    else:
+                        self.backend.append(header, payload)
+            except Exception as e:
+                self.error = e
+                self._lost_writes = True
+            finally:
+                if isinstance(journal, FileLock):
+                    journal.release()
+
+
+def _coalesce(pending: list) -> list:
+    """Merges consecutive operation batches into one write (latest header wins)."""
+    merged = []
+    for kind, header, payload in pending:
+        if kind == "ops" and merged and merged[-1][0] == "ops":
+            merged[-1] = ("ops", header, merged[-1][2] + payload)
+        else:
+            merged.append((kind, header, payload))
+    return merged
+
+
+def _exit_on_signals() -> None:
+    """Turns SIGTERM/SIGHUP into a normal exit so atexit flushes pending writes."""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for name in ("SIGTERM", "SIGHUP"):
+        sig = getattr(signal, name, None)
+        if sig is not None and signal.getsignal(sig) == signal.SIG_DFL:
+            signal.signal(sig, lambda signum, frame: sys.exit(128 + signum))
@@ -7,39 +7,49 @@ from datetime import datetime
 
 from core.colors import Color
 from core.constants import MONTHS_LIST
-from core.storage import save_data
-from ui.utils import clear_screen, create_progress_bar, show_feedback
+from core.goal_list import GoalList
+from core.records import Goal
+from core.storage import EditDiscarded, commit
+from ui.keys import prompt_key
+from ui.layout import layout
+from ui.renderer import frame
+from ui.utils import create_progress_bar, show_feedback
 
 
 def manage_goals(data: dict) -> None:
     if "goals" not in data:
-        data["goals"] = {"weekly": [], "monthly": [], "yearly": []}
+        data["goals"] = {
+            "weekly": GoalList(),
+            "monthly": GoalList(),
+            "yearly": GoalList(),
+        }
 
     current_type = "weekly"
-    selected_month = datetime.now().month
+    now = datetime.now()
+    selected = (now.year, now.month)  # (year, month) shown in the monthly tab
 
     while True:
-        clear_screen()
-        _goals_header()
-        _render_tabs(current_type)
-
-        if current_type == "calendar":
-            _render_calendar(data)
-        elif current_type == "monthly":
-            selected_month = _render_monthly(data, selected_month)
-        else:
-            _render_goals_list(data["goals"].get(current_type, []), current_type)
+        with frame():
+            _goals_header()
+            _render_tabs(current_type)
+
+            if current_type == "calendar":
+                _render_calendar(data)
+            elif current_type == "monthly":
+                _render_monthly(data, selected)
+            else:
+                _render_goals_list(data["goals"].get(current_type, []), current_type)
 
-        _goals_menu(current_type)
-        cmd = input(f"{Color.CYAN}❯{Color.RESET} ").lower().strip()
+            _goals_menu(current_type)
+        cmd = prompt_key()
 
         # Month navigation
         if current_type == "monthly":
             if cmd in ["<", "←"]:
-                selected_month = selected_month - 1 if selected_month > 1 else 12
+                selected = _shift_month(selected, -1)
                 continue
             elif cmd in [">", "→"]:
-                selected_month = selected_month + 1 if selected_month < 12 else 1
+                selected = _shift_month(selected, 1)
                 continue
 
         # Switch tab
@@ -56,22 +66,24 @@ def manage_goals(data: dict) -> None:
         elif current_type == "calendar":
             _handle_calendar(data, cmd)
         elif cmd == "+":
-            _add_goal(data, current_type, selected_month)
+            _add_goal(data, current_type, selected)
         elif cmd == "e":
-            _edit_goal(data, current_type, selected_month)
+            _edit_goal(data, current_type, selected)
         elif cmd == "u":
-            _update_progress(data, current_type, selected_month)
+            _update_progress(data, current_type, selected)
         elif cmd == "d":
-            _delete_goal(data, current_type, selected_month)
+            _delete_goal(data, current_type, selected)
 
 
 # ─── Rendering ───────────────────────────────────────────────────────────────
 
 
 def _goals_header() -> None:
-    print(f"\n{Color.MAGENTA_B}{'━' * 100}{Color.RESET}")
-    print(f"{Color.BOLD}{Color.MAGENTA_B}{'🎯 GOALS MANAGER'.center(100)}{Color.RESET}")
-    print(f"{Color.MAGENTA_B}{'━' * 100}{Color.RESET}\n")
+    print(f"\n{Color.MAGENTA_B}{'━' * layout().width}{Color.RESET}")
+    print(
+        f"{Color.BOLD}{Color.MAGENTA_B}{'🎯 GOALS MANAGER'.center(layout().width)}{Color.RESET}"
+    )
+    print(f"{Color.MAGENTA_B}{'━' * layout().width}{Color.RESET}\n")
 
 
 def _render_tabs(current_type: str) -> None:
@@ -84,7 +96,7 @@ def _render_tabs(current_type: str) -> None:
             name_inactive = "Calendar" if t == "calendar" else t.capitalize()
             tabs.append(f"{Color.DIM}[{name_inactive}]{Color.RESET}")
     print("  " + "   ".join(tabs))
-    print(f"\n{Color.DIM}{'─' * 100}{Color.RESET}\n")
+    print(f"\n{Color.DIM}{'─' * layout().width}{Color.RESET}\n")
 
 
 def _render_goals_list(goals: list, goal_type: str) -> None:
@@ -96,18 +108,19 @@ def _render_goals_list(goals: list, goal_type: str) -> None:
         _print_goal(idx, goal)
 
 
-def _render_monthly(data: dict, selected_month: int) -> int:
+def _render_monthly(data: dict, selected: tuple[int, int]) -> None:
+    year, month = selected
     print(
-        f"{Color.BOLD}{Color.MAGENTA_B}📅 {MONTHS_LIST[selected_month - 1].upper()}{Color.RESET}"
+        f"{Color.BOLD}{Color.MAGENTA_B}📅 {MONTHS_LIST[month - 1].upper()} {year}{Color.RESET}"
     )
-    print(f"{Color.DIM}{'─' * 100}{Color.RESET}\n")
+    print(f"{Color.DIM}{'─' * layout().width}{Color.RESET}\n")
 
-    current_month = datetime.now().month
+    now = datetime.now()
     nav = []
     for i, name in enumerate(MONTHS_LIST, 1):
-        if i == selected_month:
+        if i == month:
             nav.append(f"{Color.BG_BLUE}{Color.WHITE} {name[:3]} {Color.RESET}")
-        elif i == current_month:
+        elif (year, i) == (now.year, now.month):
             nav.append(f"{Color.CYAN_B}{name[:3]}{Color.RESET}")
         else:
             nav.append(f"{Color.DIM}{name[:3]}{Color.RESET}")
@@ -115,41 +128,39 @@ def _render_monthly(data: dict, selected_month: int) -> int:
     print("  " + "  ".join(nav[:6]))
     print("  " + "  ".join(nav[6:]))
     print(f"\n{Color.DIM}Use < and > to navigate between months{Color.RESET}")
-    print(f"{Color.DIM}{'─' * 100}{Color.RESET}\n")
-
-    month_name = MONTHS_LIST[selected_month - 1]
-    month_goals = [
-        (i, g)
-        for i, g in enumerate(data["goals"].get("monthly", []))
-        if month_name in g.get("text", "")
-    ]
+    print(f"{Color.DIM}{'─' * layout().width}{Color.RESET}\n")
 
+    month_goals = _get_filtered_goals(data, "monthly", selected)
     if not month_goals:
-        print(f"{Color.DIM}  No goals for {month_name}.{Color.RESET}\n")
+        print(f"{Color.DIM}  No goals for {MONTHS_LIST[month - 1]}.{Color.RESET}\n")
     else:
+        highlight = (
+            f" {Color.CYAN_B}⭐ CURRENT MONTH{Color.RESET}"
+            if selected == (now.year, now.month)
+            else ""
+        )
         for display_idx, (_, goal) in enumerate(month_goals, 1):
-            highlight = (
-                f" {Color.CYAN_B}⭐ CURRENT MONTH{Color.RESET}"
-                if selected_month == datetime.now().month
-                else ""
-            )
             _print_goal(display_idx, goal, highlight)
 
-    return selected_month
+
+def _shift_month(selected: tuple[int, int], step: int) -> tuple[int, int]:
+    """(year, month) `step` months away, rolling over the year."""
+    months = selected[0] * 12 + selected[1] - 1 + step
+    return months // 12, months % 12 + 1
 
 
-def _print_goal(idx: int, goal: dict, highlight: str = "") -> None:
-    text = goal.get("text", "")
-    prog = goal.get("progress", 0)
+def _print_goal(idx: int, goal: Goal, highlight: str = "") -> None:
+    text = goal.text
+    prog = goal.progress
     bar = create_progress_bar(prog, 40)
-    if goal.get("type") == "current_week" and not highlight:
+    if goal.type == "current_week" and not highlight:
         highlight = f" {Color.CYAN_B}⭐ CURRENT WEEK{Color.RESET}"
     print(f"  {Color.BOLD}{idx}.{Color.RESET} {text}{highlight}")
     print(f"     {bar}  {Color.BOLD}{prog}%{Color.RESET}\n")
 
 
 def _goals_menu(current_type: str) -> None:
-    print(f"{Color.DIM}{'─' * 100}{Color.RESET}")
+    print(f"{Color.DIM}{'─' * layout().width}{Color.RESET}")
     print(f"{Color.BOLD}COMMANDS:{Color.RESET}")
     print(
         f"  {Color.BOLD}[1]{Color.RESET} Weekly  {Color.BOLD}[2]{Color.RESET} Monthly  {Color.BOLD}[3]{Color.RESET} Yearly  {Color.BOLD}[4]{Color.RESET} Calendar"
@@ -159,7 +170,7 @@ def _goals_menu(current_type: str) -> None:
             f"  {Color.BOLD}[+]{Color.RESET} New  {Color.BOLD}[E]{Color.RESET} Edit  {Color.BOLD}[U]{Color.RESET} Progress  {Color.BOLD}[D]{Color.RESET} Delete"
         )
     print(f"  {Color.BOLD}[V]{Color.RESET} Back")
-    print(f"{Color.DIM}{'─' * 100}{Color.RESET}\n")
+    print(f"{Color.DIM}{'─' * layout().width}{Color.RESET}\n")
 
 
 # ─── Calendar ────────────────────────────────────────────────────────────────
@@ -175,7 +186,7 @@ def _render_calendar(data: dict) -> None:
     for line in _create_visual_calendar(now.year, now.month, marked_days).split("\n"):
         print(f"  {line}")
 
-    print(f"\n{Color.DIM}{'─' * 100}{Color.RESET}")
+    print(f"\n{Color.DIM}{'─' * layout().width}{Color.RESET}")
     print(f"\n{Color.BOLD}MARK TODAY:{Color.RESET}")
     print(
         f"  {Color.GREEN_B}[C]{Color.RESET} Complete  {Color.YELLOW_B}[P]{Color.RESET} Partial  {Color.RED_B}[F]{Color.RESET} Failed  {Color.DIM}[L]{Color.RESET} Clear"
@@ -236,8 +247,7 @@ def _handle_calendar(data: dict, cmd: str) -> None:
 def _mark_day(data: dict, status: str) -> None:
     now = datetime.now()
     month_key = f"{now.year}-{now.month:02d}"
-    data.setdefault("calendar", {}).setdefault(month_key, {})[str(now.day)] = status
-    if save_data(data):
+    if commit(data, "calendar_set", month=month_key, day=str(now.day), status=status):
         msgs = {
             "complete": ("Day marked as complete! ✓", "success"),
             "partial": ("Day marked as partial!", "warning"),
@@ -251,8 +261,7 @@ def _clear_day(data: dict) -> None:
     month_key = f"{now.year}-{now.month:02d}"
     cal = data.get("calendar", {}).get(month_key, {})
     if str(now.day) in cal:
-        del cal[str(now.day)]
-        if save_data(data):
+        if commit(data, "calendar_clear", month=month_key, day=str(now.day)):
             show_feedback("Day mark removed!", "info")
 
 
@@ -260,20 +269,15 @@ def _clear_day(data: dict) -> None:
 
 
 def _get_filtered_goals(
-    data: dict, goal_type: str, month: int
-) -> list[tuple[int, dict]]:
-    """Returns list of (real_index, goal) filtered by month (for monthly goals)."""
+    data: dict, goal_type: str, period: tuple[int, int]
+) -> list[tuple[int, Goal]]:
+    """Returns list of (real_index, goal), only the period's (year, month) for monthly goals."""
     if goal_type == "monthly":
-        month_name = MONTHS_LIST[month - 1]
-        return [
-            (i, g)
-            for i, g in enumerate(data["goals"]["monthly"])
-            if month_name in g.get("text", "")
-        ]
+        return data["goals"].get("monthly", GoalList()).in_month(*period)
     return list(enumerate(data["goals"].get(goal_type, [])))
 
 
-def _add_goal(data: dict, goal_type: str, month: int) -> None:
+def _add_goal(data: dict, goal_type: str, period: tuple[int, int]) -> None:
     print(f"\n{Color.GREEN_B}➕ NEW {goal_type.upper()} GOAL{Color.RESET}")
     text = input("Description: ").strip()
     if not text:
@@ -284,58 +288,77 @@ def _add_goal(data: dict, goal_type: str, month: int) -> None:
     except ValueError:
         prog = 0
 
-    data["goals"][goal_type].append({"text": text, "progress": prog})
-    if save_data(data):
+    goal = {"text": text, "progress": prog}
+    if goal_type == "monthly":
+        goal["year"], goal["month"] = period
+    if commit(data, "goal_add", kind=goal_type, goal=goal):
         show_feedback("Goal added!", "success")
 
 
-def _edit_goal(data: dict, goal_type: str, month: int) -> None:
-    goals = _get_filtered_goals(data, goal_type, month)
+def _edit_goal(data: dict, goal_type: str, period: tuple[int, int]) -> None:
+    goals = _get_filtered_goals(data, goal_type, period)
     if not goals:
         show_feedback("No goals to edit!", "warning")
         return
     try:
         idx_display = int(input(f"\n{Color.BLUE}Goal number:{Color.RESET} ")) - 1
         real_idx, goal = goals[idx_display]
-        print(f"{Color.DIM}Current text: {goal['text']}{Color.RESET}")
+        print(f"{Color.DIM}Current text: {goal.text}{Color.RESET}")
         new_text = input("New text (Enter to keep): ").strip()
         if new_text:
-            data["goals"][goal_type][real_idx]["text"] = new_text
-            if save_data(data):
+            if commit(
+                data,
+                "goal_set",
+                kind=goal_type,
+                index=real_idx,
+                field="text",
+                value=new_text,
+            ):
                 show_feedback("Goal edited!", "success")
     except (ValueError, IndexError):
         show_feedback("Invalid input!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
-def _update_progress(data: dict, goal_type: str, month: int) -> None:
-    goals = _get_filtered_goals(data, goal_type, month)
+def _update_progress(data: dict, goal_type: str, period: tuple[int, int]) -> None:
+    goals = _get_filtered_goals(data, goal_type, period)
     if not goals:
         show_feedback("No goals to update!", "warning")
         return
     try:
         idx_display = int(input(f"\n{Color.BLUE}Goal number:{Color.RESET} ")) - 1
         real_idx, goal = goals[idx_display]
-        print(f"{Color.DIM}Current progress: {goal['progress']}%{Color.RESET}")
+        print(f"{Color.DIM}Current progress: {goal.progress}%{Color.RESET}")
         new_prog = int(input("New progress (0-100): ").strip())
-        data["goals"][goal_type][real_idx]["progress"] = max(0, min(100, new_prog))
-        if save_data(data):
+        if commit(
+            data,
+            "goal_set",
+            kind=goal_type,
+            index=real_idx,
+            field="progress",
+            value=max(0, min(100, new_prog)),
+        ):
             show_feedback(f"Progress updated to {new_prog}%!", "success")
     except (ValueError, IndexError):
         show_feedback("Invalid input!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
-def _delete_goal(data: dict, goal_type: str, month: int) -> None:
-    goals = _get_filtered_goals(data, goal_type, month)
+def _delete_goal(data: dict, goal_type: str, period: tuple[int, int]) -> None:
+    goals = _get_filtered_goals(data, goal_type, period)
     if not goals:
         show_feedback("No goals to delete!", "warning")
         return
     try:
         idx_display = int(input(f"\n{Color.RED}Number to delete:{Color.RESET} ")) - 1
         real_idx, goal = goals[idx_display]
-        confirm = input(f"Confirm delete '{goal['text']}'? (y/n): ").lower()
+        confirm = input(f"Confirm delete '{goal.text}'? (y/n): ").lower()
         if confirm == "y":
-            data["goals"][goal_type].pop(real_idx)
-            if save_data(data):
+            if commit(data, "goal_delete", kind=goal_type, index=real_idx):
                 show_feedback("Goal deleted!", "success")
     except (ValueError, IndexError):
         show_feedback("Invalid input!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
@@ -1,29 +1,34 @@
 """
-Daily activity logging for the weekly heatmap.
+Daily activity logging for the weekly heatmap, and the yearly heatmap screen.
 """
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+from core.activity_store import ActivityStore, level_of, levels_of
 from core.colors import Color
-from core.constants import SUGGESTED_ACTIVITIES
-from core.storage import save_data
-from ui.utils import clear_screen, show_feedback
+from core.constants import MONTHS_LIST, SUGGESTED_ACTIVITIES
+from core.records import DailyActivity
+from core.storage import commit
+from ui.keys import PROMPT, prompt_key
+from ui.layout import layout
+from ui.renderer import frame
+from ui.utils import HEAT_LEVELS, heat_legend, show_feedback
 
+MAX_YEARS = 10  # years shown at once in the yearly heatmap
+WEEKDAY_LABELS = ["Mon", "", "Wed", "", "Fri", "", "Sun"]
 
-def log_daily_activity(data: dict) -> None:
-    clear_screen()
-    print(f"\n{Color.CYAN_B}{'━' * 80}{Color.RESET}")
-    print(
-        f"{Color.BOLD}{Color.CYAN_B}{"🔥 LOG TODAY'S ACTIVITIES".center(80)}{Color.RESET}"
-    )
-    print(f"{Color.CYAN_B}{'━' * 80}{Color.RESET}\n")
 
+def log_daily_activity(data: dict) -> None:
+    title = "🔥 LOG TODAY'S ACTIVITIES"
     today = datetime.now()
     key = today.strftime("%Y-%m-%d")
-    data["daily_activities"].setdefault(key, {"activities": {}, "level": 0})
-    record = data["daily_activities"][key]
+    record = data["daily_activities"].get(key) or DailyActivity()
 
-    _list_activities(record)
+    with frame():
+        print(f"\n{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}")
+        print(f"{Color.BOLD}{Color.CYAN_B}{title.center(layout().narrow)}{Color.RESET}")
+        print(f"{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}\n")
+        _list_activities(record)
 
     choice = input(f"\n{Color.CYAN}❯{Color.RESET} ").strip()
     if not choice:
@@ -33,20 +38,21 @@ def log_daily_activity(data: dict) -> None:
     if not activity:
         return
 
-    record["activities"][activity] = record["activities"].get(activity, 0) + 1
-    record["level"] = _calculate_level(sum(record["activities"].values()))
+    activities = dict(record.activities)
+    activities[activity] = activities.get(activity, 0) + 1
+    total = sum(activities.values())
+    record = {"activities": activities, "level": level_of(total)}
 
-    if save_data(data):
-        total = sum(record["activities"].values())
+    if commit(data, "activity_set", date=key, record=record):
         show_feedback(f"✓ {activity} logged! Today's total: {total}", "success")
 
 
-def _list_activities(record: dict) -> None:
+def _list_activities(record: DailyActivity) -> None:
     print(f"{Color.BOLD}SUGGESTED ACTIVITIES:{Color.RESET}")
-    print(f"{Color.DIM}{'─' * 80}{Color.RESET}\n")
+    print(f"{Color.DIM}{'─' * layout().narrow}{Color.RESET}\n")
 
     for i, name in enumerate(SUGGESTED_ACTIVITIES, 1):
-        count = record["activities"].get(name, 0)
+        count = record.activities.get(name, 0)
         status = (
             f"{Color.GREEN_B}✓ {count}x{Color.RESET}"
             if count > 0
@@ -55,7 +61,7 @@ def _list_activities(record: dict) -> None:
         print(f"  {i}. {status} {name}")
 
     print(f"\n  {Color.BOLD}0.{Color.RESET} Custom activity")
-    print(f"\n{Color.DIM}{'─' * 80}{Color.RESET}")
+    print(f"\n{Color.DIM}{'─' * layout().narrow}{Color.RESET}")
     print(f"{Color.BOLD}Enter the activity number (or Enter to go back):{Color.RESET}")
 
 
@@ -75,13 +81,94 @@ def _resolve_activity(choice: str) -> str | None:
         return None
 
 
-def _calculate_level(total: int) -> int:
-    if total == 0:
-        return 0
-    if total <= 2:
-        return 1
-    if total <= 4:
-        return 2
-    if total <= 6:
-        return 3
-    return 4
+# ─── Yearly heatmap ──────────────────────────────────────────────────────────
+
+
+def show_yearly_heatmap(data: dict) -> None:
+    """GitHub-style heatmaps of whole years, one or several at a time."""
+    activities = data["daily_activities"]
+    this_year = date.today().year
+    last_year, span = this_year, 1
+
+    while True:
+        first_year = last_year - span + 1
+        with frame():
+            print(f"\n{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}")
+            title = f"🔥 ACTIVITY HEATMAP • {first_year}" + (
+                f"-{last_year}" if span > 1 else ""
+            )
+            print(
+                f"{Color.BOLD}{Color.CYAN_B}{title.center(layout().narrow)}{Color.RESET}"
+            )
+            print(f"{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}\n")
+            _render_years(activities, first_year, last_year)
+            print(f"  {heat_legend()}")
+            print(f"\n{Color.DIM}{'─' * layout().narrow}{Color.RESET}")
+            print(
+                f"{Color.BOLD}[<] [>]{Color.RESET} Year  "
+                f"{Color.BOLD}[+] [-]{Color.RESET} Years shown  "
+                f"{Color.BOLD}[V]{Color.RESET} Back"
+            )
+        cmd = prompt_key(f"\n{PROMPT}")
+
+        if cmd in ["<", "←"]:
+            last_year -= 1
+        elif cmd in [">", "→"]:
+            last_year = min(last_year + 1, this_year)
+        elif cmd == "+":
+            span = min(span + 1, MAX_YEARS)
+        elif cmd == "-":
+            span = max(span - 1, 1)
+        elif cmd == "v" or not cmd:
+            break
+
+
+def _grid_start(year: int) -> date:
+    """Monday of the week holding January 1st (the grid's first cell)."""
+    jan1 = date(year, 1, 1)
+    return jan1 - timedelta(days=jan1.weekday())
+
+
+def _render_years(activities: ActivityStore, first_year: int, last_year: int) -> None:
+    # Levels for every day shown, thresholded in one pass
+    start = _grid_start(first_year)
+    levels = levels_of(activities.totals(start, date(last_year, 12, 31)))
+
+    for year in range(last_year, first_year - 1, -1):
+        offset = (_grid_start(year) - start).days
+        stop = (date(year, 12, 31) - start).days + 1
+        _render_year(activities, year, levels[offset:stop])
+
+
+def _render_year(activities: ActivityStore, year: int, levels: list) -> None:
+    """One year as 7 weekday rows × 53 week columns; `levels` starts at _grid_start(year)."""
+    lead = date(year, 1, 1).weekday()  # grid cells before January 1st
+    end = min(len(levels), (date.today() - _grid_start(year)).days + 1)
+    weeks = (len(levels) + 6) // 7
+    cells = [f"{color}{char}{Color.RESET}" for color, char in HEAT_LEVELS]
+
+    total = activities.total(date(year, 1, 1), date(year, 12, 31))
+    active_days = len(activities.year(year).ordinals)
+    print(
+        f"  {Color.BOLD}{year}{Color.RESET}  {Color.DIM}{total} activities • "
+        f"{active_days} active days{Color.RESET}"
+    )
+
+    # Month labels above the week holding each 1st
+    labels = [" "] * (weeks + 3)
+    for month in range(1, 13):
+        week = (lead + date(year, month, 1).timetuple().tm_yday - 1) // 7
+        if labels[week] == " " and (week == 0 or labels[week - 1] == " "):
+            labels[week : week + 3] = MONTHS_LIST[month - 1][:3]
+    print(f"  {'':<4}{Color.DIM}{''.join(labels).rstrip()}{Color.RESET}")
+
+    for weekday in range(7):
+        row = []
+        for week in range(weeks):
+            i = week * 7 + weekday
+            if lead <= i < end:
+                row.append(cells[min(levels[i], 4)])
+            else:
+                row.append(" ")
+        print(f"  {Color.DIM}{WEEKDAY_LABELS[weekday]:<4}{Color.RESET}{''.join(row)}")
+    print()
@@ -3,34 +3,36 @@ Quick notes per notebook.
 """
 
 from core.colors import Color
-from core.storage import save_data
-from ui.utils import clear_screen
+from core.storage import commit
+from ui.keys import pause, prompt_key
+from ui.layout import layout
+from ui.renderer import frame
 
 
 def manage_notes(data: dict) -> None:
     notebook = data["active_notebook"]
 
     while True:
-        clear_screen()
-        WIDTH = 80
+        WIDTH = layout().narrow
 
-        print(f"\n{Color.YELLOW_B}{'━' * WIDTH}{Color.RESET}")
-        print(
-            f"{Color.BOLD}{Color.YELLOW_B}{'📝 QUICK NOTES'.center(WIDTH)}{Color.RESET}"
-        )
-        print(f"{Color.YELLOW_B}{notebook.upper().center(WIDTH)}{Color.RESET}")
-        print(f"{Color.YELLOW_B}{'━' * WIDTH}{Color.RESET}\n")
+        with frame():
+            print(f"\n{Color.YELLOW_B}{'━' * WIDTH}{Color.RESET}")
+            print(
+                f"{Color.BOLD}{Color.YELLOW_B}{'📝 QUICK NOTES'.center(WIDTH)}{Color.RESET}"
+            )
+            print(f"{Color.YELLOW_B}{notebook.upper().center(WIDTH)}{Color.RESET}")
+            print(f"{Color.YELLOW_B}{'━' * WIDTH}{Color.RESET}\n")
 
-        note = data["notes"].get(notebook, "")
-        _display_note(note, WIDTH)
+            note = data["notes"].get(notebook, "")
+            _display_note(note, WIDTH)
 
-        print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}")
-        print(
-            f"{Color.BOLD}[E]{Color.RESET} Edit  {Color.BOLD}[L]{Color.RESET} Clear  {Color.BOLD}[V]{Color.RESET} Back"
-        )
-        print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}\n")
+            print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}")
+            print(
+                f"{Color.BOLD}[E]{Color.RESET} Edit  {Color.BOLD}[L]{Color.RESET} Clear  {Color.BOLD}[V]{Color.RESET} Back"
+            )
+            print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}\n")
 
-        cmd = input(f"{Color.CYAN}❯{Color.RESET} ").lower().strip()
+        cmd = prompt_key()
 
         if cmd == "e":
             _edit_note(data, notebook)
@@ -60,10 +62,9 @@ def _edit_note(data: dict, notebook: str) -> None:
         if line == "":
             break
         lines.append(line)
-    data["notes"][notebook] = "\n".join(lines)
-    if save_data(data):
+    if commit(data, "note_set", notebook=notebook, text="\n".join(lines)):
         print(f"\n{Color.GREEN_B}✓ Notes saved!{Color.RESET}")
-        input(f"{Color.DIM}Press ENTER...{Color.RESET}")
+        pause()
 
 
 def _clear_note(data: dict, notebook: str) -> None:
@@ -71,7 +72,6 @@ def _clear_note(data: dict, notebook: str) -> None:
         f"\n{Color.YELLOW}Confirm clear notes? (y/n):{Color.RESET} "
     ).lower()
     if confirm == "y":
-        data["notes"][notebook] = ""
-        save_data(data)
+        commit(data, "note_set", notebook=notebook, text="")
         print(f"{Color.GREEN_B}✓ Notes cleared!{Color.RESET}")
-        input(f"{Color.DIM}Press ENTER...{Color.RESET}")
+        pause()
@@ -0,0 +1,63 @@
+"""
+Search across tasks, goals and notes.
+"""
+
+from core.colors import Color
+from core.search_index import Match, search_index
+from ui.layout import layout
+from ui.renderer import frame
+from ui.utils import get_priority_emoji, truncate_text
+
+MAX_RESULTS = 20
+
+
+def search(data: dict) -> None:
+    query = input(f"\n{Color.CYAN}🔎 Search:{Color.RESET} ").strip()
+    while query:
+        count, matches = search_index(data).search(data, query, MAX_RESULTS)
+
+        with frame():
+            print(f"\n{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}")
+            print(
+                f"{Color.BOLD}{Color.CYAN_B}{'🔎 SEARCH'.center(layout().narrow)}{Color.RESET}"
+            )
+            print(f"{Color.CYAN_B}{'━' * layout().narrow}{Color.RESET}\n")
+            print(
+                f"{Color.BOLD}“{query}”{Color.RESET} {Color.DIM}— "
+                f"{count} result(s){Color.RESET}\n"
+            )
+            _render_matches(count, matches)
+            print(f"\n{Color.DIM}{'─' * layout().narrow}{Color.RESET}")
+            print(f"{Color.BOLD}New search, or Enter to go back:{Color.RESET}")
+
+        query = input(f"{Color.CYAN}❯{Color.RESET} ").strip()
+
+
+def _render_matches(count: int, matches: list[Match]) -> None:
+    if not matches:
+        print(f"  {Color.DIM}Nothing found.{Color.RESET}")
+        return
+
+    for match in matches:
+        print(f"  {_match_line(match)}")
+    if count > len(matches):
+        print(f"  {Color.DIM}... and {count - len(matches)} more results{Color.RESET}")
+
+
+def _match_line(match: Match) -> str:
+    if match.kind == "task":
+        task = match.item
+        emoji, color = get_priority_emoji(task.priority)
+        mark = f"{Color.GREEN_B}✓{Color.RESET}" if task.done else emoji
+        notebooks = ", ".join(task.notebooks)
+        return (
+            f"{color}#{task.id:02d}{Color.RESET} {mark} {truncate_text(task.text, 45)} "
+            f"{Color.DIM}[{truncate_text(notebooks, 20)}]{Color.RESET}"
+        )
+    if match.kind == "goal":
+        return (
+            f"🎯 {truncate_text(match.text, 50)} {Color.DIM}[{match.key} goal, "
+            f"{match.item.progress}%]{Color.RESET}"
+        )
+    first = match.text.split("\n", 1)[0]
+    return f"📝 {truncate_text(first, 50)} {Color.DIM}[{match.key} notes]{Color.RESET}"
@@ -2,36 +2,47 @@
 General statistics screen for the application.
 """
 
+from datetime import date
+
 from core.colors import Color
-from core.constants import TERMINAL_WIDTH
-from ui.utils import clear_screen, create_progress_bar, calculate_stats
+from ui.keys import pause
+from ui.layout import layout
+from ui.renderer import frame
+from ui.utils import (
+    banner,
+    create_progress_bar,
+    calculate_stats,
+    get_priority_emoji,
+    rule,
+)
+
+PRIORITY_LABELS = {1: "High", 2: "Medium", 3: "Low"}
 
 
 def show_general_stats(data: dict) -> None:
-    clear_screen()
-    WIDTH = TERMINAL_WIDTH
+    WIDTH = layout().width
 
-    print(f"\n{Color.MAGENTA_B}{'━' * WIDTH}{Color.RESET}")
-    print(
-        f"{Color.BOLD}{Color.MAGENTA_B}{'📊 GENERAL STATISTICS'.center(WIDTH)}{Color.RESET}"
-    )
-    print(f"{Color.MAGENTA_B}{'━' * WIDTH}{Color.RESET}\n")
+    with frame():
+        print()
+        print(banner("📊 GENERAL STATISTICS", Color.MAGENTA_B, WIDTH), end="\n\n")
 
-    _notebook_stats(data)
-    _general_summary(data)
-    _goals_summary(data)
+        _notebook_stats(data)
+        _general_summary(data)
+        _goals_summary(data)
 
-    print(f"\n{Color.DIM}{'─' * WIDTH}{Color.RESET}")
-    input(f"\n{Color.DIM}Press ENTER to go back...{Color.RESET}")
+        print(f"\n{rule(width=WIDTH)}")
+    print()
+    pause("Press any key to go back...")
 
 
 def _notebook_stats(data: dict) -> None:
+    lay = layout()
     print(f"{Color.BOLD}PROGRESS BY NOTEBOOK{Color.RESET}")
-    print(f"{Color.DIM}{'─' * TERMINAL_WIDTH}{Color.RESET}\n")
+    print(rule(width=lay.width), end="\n\n")
 
     for notebook in data["notebooks"]:
         total, completed, progress = calculate_stats(data["tasks"], notebook)
-        bar = create_progress_bar(progress, 40)
+        bar = create_progress_bar(progress, lay.stats_bar)
         print(
             f"  {notebook:.<25} {bar}  {progress:>3}%  {Color.DIM}({completed}/{total}){Color.RESET}"
         )
@@ -40,22 +51,33 @@ def _notebook_stats(data: dict) -> None:
 
 def _general_summary(data: dict) -> None:
     print(f"{Color.BOLD}GENERAL SUMMARY{Color.RESET}")
-    print(f"{Color.DIM}{'─' * TERMINAL_WIDTH}{Color.RESET}\n")
+    print(rule(width=layout().width), end="\n\n")
 
-    unique_ids = {t["id"] for t in data["tasks"]}
-    total = len(unique_ids)
-    completed = sum(
-        1 for t in data["tasks"] if t["status"] == "X" and t["id"] in unique_ids
-    )
+    total = len(data["tasks"])
+    completed = data["tasks"].completed()
 
     print(f"  Total tasks: {Color.BOLD}{total}{Color.RESET}")
     print(f"  {Color.GREEN_B}✓{Color.RESET} Completed: {completed}")
-    print(f"  {Color.YELLOW_B}○{Color.RESET} Pending: {total - completed}\n")
+    print(f"  {Color.YELLOW_B}○{Color.RESET} Pending: {total - completed}")
+
+    histogram = data["tasks"].pending_by_priority()
+    by_priority = "  ".join(
+        f"{get_priority_emoji(p)[0]} {PRIORITY_LABELS[p]} {count}"
+        for p, count in histogram.items()
+    )
+    print(f"  {Color.DIM}Pending by priority:{Color.RESET} {by_priority}")
+
+    activities = data["daily_activities"]
+    print(
+        f"  🔥 Activity streak: {Color.BOLD}{activities.streak(date.today())}{Color.RESET} days "
+        f"{Color.DIM}(longest {activities.longest_streak()}){Color.RESET}\n"
+    )
 
 
 def _goals_summary(data: dict) -> None:
+    lay = layout()
     print(f"{Color.BOLD}GOALS SUMMARY{Color.RESET}")
-    print(f"{Color.DIM}{'─' * TERMINAL_WIDTH}{Color.RESET}\n")
+    print(rule(width=lay.width), end="\n\n")
 
     goals = data.get("goals", {})
     has_goals = False
@@ -68,8 +90,8 @@ def _goals_summary(data: dict) -> None:
         lst = goals.get(goal_type, [])
         if lst:
             has_goals = True
-            avg = int(sum(g.get("progress", 0) for g in lst) / len(lst))
-            bar = create_progress_bar(avg, 30)
+            avg = int(sum(g.progress for g in lst) / len(lst))
+            bar = create_progress_bar(avg, lay.stats_bar - 10)
             print(f"  {label:.<15} {bar}  {avg:>3}%")
 
     if not has_goals:
@@ -3,10 +3,11 @@ Task CRUD commands and notebook management.
 """
 
 from core.colors import Color
-from core.storage import save_data
+from core.records import DONE, PENDING, STATUS_SYMBOLS
+from core.storage import EditDiscarded, commit
+from ui.keys import pause
 from ui.utils import show_feedback
 
-
 # ─── Tasks ───────────────────────────────────────────────────────────────────
 
 
@@ -20,71 +21,76 @@ def add_task(data: dict) -> None:
     priority = _ask_priority()
     task_notebooks = _ask_additional_notebooks(data)
 
-    data["tasks"].append(
-        {
-            "id": data["next_id"],
-            "text": txt,
-            "status": "•",
-            "notebook": data["active_notebook"],
-            "notebooks": task_notebooks,
-            "priority": priority,
-        }
-    )
-    data["next_id"] += 1
-
-    if save_data(data):
-        msg = "Task added!"
-        if len(task_notebooks) > 1:
-            msg += f" (in {len(task_notebooks)} notebooks)"
-        show_feedback(msg, "success")
+    task = {
+        "id": data["next_id"],
+        "text": txt,
+        "status": "•",
+        "notebook": data["active_notebook"],
+        "notebooks": task_notebooks,
+        "priority": priority,
+    }
+
+    try:
+        if commit(data, "task_add", task=task):
+            msg = "Task added!"
+            if len(task["notebooks"]) > 1:
+                msg += f" (in {len(task['notebooks'])} notebooks)"
+            show_feedback(msg, "success")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
 def complete_task(data: dict) -> None:
     try:
         task_id = int(input(f"\n{Color.YELLOW}Task ID:{Color.RESET} "))
-        for t in data["tasks"]:
-            if t["id"] == task_id:
-                t["status"] = "X" if t["status"] == "•" else "•"
-                status_msg = "completed" if t["status"] == "X" else "reopened"
-                if save_data(data):
-                    show_feedback(f"Task {status_msg}!", "success")
-                return
-        show_feedback("Task not found!", "error")
+        task = data["tasks"].get(task_id)
+        if not task:
+            show_feedback("Task not found!", "error")
+            return
+        status = PENDING if task.done else DONE
+        status_msg = "completed" if status == DONE else "reopened"
+        symbol = STATUS_SYMBOLS[status]
+        if commit(data, "task_set", id=task_id, field="status", value=symbol):
+            show_feedback(f"Task {status_msg}!", "success")
     except ValueError:
         show_feedback("Invalid ID!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
 def edit_task(data: dict) -> None:
     try:
         task_id = int(input(f"\n{Color.BLUE}Task ID to edit:{Color.RESET} "))
-        for t in data["tasks"]:
-            if t["id"] == task_id:
-                print(f"{Color.DIM}Current text: {t['text']}{Color.RESET}")
-                new_text = input("New text (Enter to keep): ").strip()
-                if new_text:
-                    t["text"] = new_text
-                    if save_data(data):
-                        show_feedback("Task edited!", "success")
-                return
-        show_feedback("Task not found!", "error")
+        task = data["tasks"].get(task_id)
+        if not task:
+            show_feedback("Task not found!", "error")
+            return
+        print(f"{Color.DIM}Current text: {task.text}{Color.RESET}")
+        new_text = input("New text (Enter to keep): ").strip()
+        if new_text:
+            if commit(data, "task_set", id=task_id, field="text", value=new_text):
+                show_feedback("Task edited!", "success")
     except ValueError:
         show_feedback("Invalid ID!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
 def delete_task(data: dict) -> None:
     try:
         task_id = int(input(f"\n{Color.RED}Task ID to delete:{Color.RESET} "))
-        task = next((t for t in data["tasks"] if t["id"] == task_id), None)
+        task = data["tasks"].get(task_id)
         if not task:
             show_feedback("Task not found!", "error")
             return
-        confirm = input(f"Confirm delete '{task['text']}'? (y/n): ").lower()
+        confirm = input(f"Confirm delete '{task.text}'? (y/n): ").lower()
         if confirm == "y":
-            data["tasks"] = [t for t in data["tasks"] if t["id"] != task_id]
-            if save_data(data):
+            if commit(data, "task_delete", id=task_id):
                 show_feedback("Task deleted!", "success")
     except ValueError:
         show_feedback("Invalid ID!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
 def change_priority(data: dict) -> None:
@@ -96,15 +102,16 @@ def change_priority(data: dict) -> None:
                 f"{Color.YELLOW_B}2{Color.RESET}=Medium, {Color.GREEN_B}3{Color.RESET}=Low): "
             )
         )
-        for t in data["tasks"]:
-            if t["id"] == task_id:
-                t["priority"] = max(1, min(3, new_priority))
-                if save_data(data):
-                    show_feedback("Priority updated!", "success")
-                return
-        show_feedback("Task not found!", "error")
+        if task_id not in data["tasks"]:
+            show_feedback("Task not found!", "error")
+            return
+        priority = max(1, min(3, new_priority))
+        if commit(data, "task_set", id=task_id, field="priority", value=priority):
+            show_feedback("Priority updated!", "success")
     except ValueError:
         show_feedback("Invalid input!", "error")
+    except EditDiscarded as e:
+        show_feedback(str(e), "warning")
 
 
 # ─── Notebooks ───────────────────────────────────────────────────────────────
@@ -119,8 +126,7 @@ def add_notebook(data: dict) -> None:
     if name in data["notebooks"]:
         show_feedback("A notebook with that name already exists!", "warning")
         return
-    data["notebooks"].append(name)
-    if save_data(data):
+    if commit(data, "notebook_add", name=name):
         show_feedback(f"Notebook '{name}' created!", "success")
 
 
@@ -132,8 +138,7 @@ def remove_notebook(data: dict) -> None:
     print(f"\n{Color.RED}🗑️  REMOVE NOTEBOOK{Color.RESET}")
     print(f"{Color.DIM}{'─' * 50}{Color.RESET}")
     for i, nb in enumerate(data["notebooks"], 1):
-        n = len([t for t in data["tasks"] if nb in t.get("notebooks", [t["notebook"]])])
-        print(f"  {i}. {nb} ({n} tasks)")
+        print(f"  {i}. {nb} ({data['tasks'].count(nb)} tasks)")
 
     try:
         idx = int(input("\nNotebook number: ")) - 1
@@ -148,15 +153,7 @@ def remove_notebook(data: dict) -> None:
         if confirm != "y":
             return
 
-        data["notebooks"].pop(idx)
-        for t in data["tasks"]:
-            if name in t.get("notebooks", []):
-                t["notebooks"].remove(name)
-        data["tasks"] = [t for t in data["tasks"] if t.get("notebooks")]
-
-        if data["active_notebook"] == name:
-            data["active_notebook"] = data["notebooks"][0]
-        if save_data(data):
+        if commit(data, "notebook_remove", name=name):
             show_feedback("Notebook removed!", "success")
     except ValueError:
         show_feedback("Invalid input!", "error")
@@ -165,8 +162,7 @@ def remove_notebook(data: dict) -> None:
 def select_notebook(data: dict, idx: int) -> bool:
     """Selects a notebook by index (0-based). Returns True if valid."""
     if 0 <= idx < len(data["notebooks"]):
-        data["active_notebook"] = data["notebooks"][idx]
-        save_data(data)
+        commit(data, "notebook_select", name=data["notebooks"][idx])
         return True
     return False
 
@@ -208,6 +204,6 @@ def _ask_additional_notebooks(data: dict) -> list:
             print(
                 f"{Color.YELLOW}⚠ Invalid input, task created in current notebook only{Color.RESET}"
             )
-            input(f"{Color.DIM}Press ENTER...{Color.RESET}")
+            pause()
 
     return task_notebooks
@@ -0,0 +1,68 @@
+"""
+Journal daemon entry point.
+Serves the journal over a Unix socket (see core.daemon), or sends one
+request to a running daemon and prints the JSON result.
+
+Usage: python journald.py [--socket PATH]
+       python journald.py [--socket PATH] call METHOD [KEY=VALUE ...]
+
+Values are read as JSON when they parse (numbers, true/false, lists) and as
+text otherwise, e.g.: python journald.py call add text="Buy milk" priority=1
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.client import DaemonError, JournalClient
+from core.colors import Color
+from core.constants import DAEMON_SOCKET
+from core.daemon import serve
+from core.storage import JournalUnreadable
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--socket", default=DAEMON_SOCKET)
+    sub = parser.add_subparsers(dest="command")
+    call = sub.add_parser("call", help="send one request to a running daemon")
+    call.add_argument("method")
+    call.add_argument("params", nargs="*", metavar="KEY=VALUE")
+    args = parser.parse_args()
+
+    if args.command == "call":
+        _call(args.socket, args.method, args.params)
+        return
+
+    if not hasattr(socket, "AF_UNIX"):
+        sys.exit(f"{Color.RED}✗ The journal daemon needs Unix sockets{Color.RESET}")
+    try:
+        serve(args.socket)
+    except (RuntimeError, JournalUnreadable) as e:
+        sys.exit(f"{Color.RED}✗ {e}{Color.RESET}")
+
+
+def _call(path: str, method: str, pairs: list) -> None:
+    params = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            sys.exit(f"{Color.RED}✗ Expected KEY=VALUE, got {pair!r}{Color.RESET}")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    try:
+        with JournalClient(path) as client:
+            result = client.call(method, **params)
+    except DaemonError as e:
+        sys.exit(f"{Color.RED}✗ {e}{Color.RESET}")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
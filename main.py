@@ -10,10 +10,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.colors import Color
-from core.storage import load_data
+from core.storage import JournalUnreadable, close_storage, load_data, sync_data
+from ui.keys import complete_number, key_pending, prompt_key, read_key
 from ui.utils import clear_screen
 from ui.notebooks import show_notebook_selection
-from ui.dashboard import show_interface
+from ui.dashboard import next_task_page, previous_task_page, show_interface
 from features.tasks import (
     add_task,
     complete_task,
@@ -26,7 +27,8 @@ from features.tasks import (
 )
 from features.goals import manage_goals
 from features.notes import manage_notes
-from features.heatmap import log_daily_activity
+from features.heatmap import log_daily_activity, show_yearly_heatmap
+from features.search import search
 from features.stats import show_general_stats
 
 
@@ -36,10 +38,14 @@ def notebook_selection_loop(data: dict) -> bool:
     Returns True when a notebook is selected, False to quit.
     """
     while True:
+        sync_data(data)
         show_notebook_selection(data)
-        cmd = input(f"{Color.CYAN}❯{Color.RESET} ").lower().strip()
+        cmd = prompt_key(
+            on_idle=lambda: show_notebook_selection(data),
+            changed=lambda: sync_data(data),
+        )
 
-        if cmd.isdigit() and select_notebook(data, int(cmd) - 1):
+        if cmd.isdigit() and select_notebook(data, _notebook_number(data, cmd) - 1):
             return True
         elif cmd == "n":
             add_notebook(data)
@@ -50,6 +56,9 @@ def notebook_selection_loop(data: dict) -> bool:
             return False
 
 
+PAGING_KEYS = ("[", "]")
+
+
 def main_loop(data: dict) -> None:
     """Main loop: displays the dashboard and processes commands."""
     COMMANDS = {
@@ -63,15 +72,29 @@ def main_loop(data: dict) -> None:
         "m": manage_goals,
         "a": manage_notes,
         "h": log_daily_activity,
+        "y": show_yearly_heatmap,
         "s": show_general_stats,
+        "/": search,
+        "]": next_task_page,
+        "[": previous_task_page,
     }
 
     while True:
+        sync_data(data)
         show_interface(data)
-        cmd = input(f"{Color.CYAN}❯{Color.RESET} ").lower().strip()
+        # Redrawing each minute keeps the header clock current, and other
+        # sessions' changes to the journal show up as they are saved
+        cmd = prompt_key(
+            on_idle=lambda: show_interface(data), changed=lambda: sync_data(data)
+        )
+
+        # Paging keys typed ahead are applied together, then drawn once
+        while cmd in PAGING_KEYS and key_pending():
+            COMMANDS[cmd](data)
+            cmd = read_key()
 
         if cmd.isdigit():
-            select_notebook(data, int(cmd) - 1)
+            select_notebook(data, _notebook_number(data, cmd) - 1)
 
         elif cmd == "c":
             if not notebook_selection_loop(data):
@@ -85,6 +108,12 @@ def main_loop(data: dict) -> None:
             COMMANDS[cmd](data)
 
 
+def _notebook_number(data: dict, first_digit: str) -> int:
+    return complete_number(
+        first_digit, len(data["notebooks"]), f"{Color.DIM}Notebook number:{Color.RESET}"
+    )
+
+
 def _exit_screen() -> None:
     clear_screen()
     print(f"\n{Color.CYAN_B}{'━' * 60}{Color.RESET}")
@@ -96,9 +125,20 @@ def _exit_screen() -> None:
 
 
 def main() -> None:
-    data = load_data()
-    if notebook_selection_loop(data):
-        main_loop(data)
+    try:
+        data = load_data()
+    except JournalUnreadable as e:
+        close_storage()
+        sys.exit(f"{Color.RED}✗ {e}{Color.RESET}")
+    try:
+        if notebook_selection_loop(data):
+            main_loop(data)
+    except JournalUnreadable as e:
+        # Part of the journal is read on first use; stop rather than save over it
+        clear_screen()
+        sys.exit(f"{Color.RED}✗ {e}{Color.RESET}")
+    finally:
+        close_storage()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""
+Shared fixtures: every test runs in its own directory with a fresh storage
+backend, since the journal files live in the working directory.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import json_backend, storage  # noqa: E402
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend_name(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(json_backend, "FSYNC_WRITES", False)
+    storage._backend = None
+    yield tmp_path
+    storage.close_storage()
+
+
+def open_session():
+    """Loads the journal with a backend of its own, as another process would."""
+    storage._backend = None
+    return storage.load_data(), storage._backend
+
+
+def add_task(data: dict, text: str, notebooks=("Today",)) -> int:
+    task = {
+        "id": data["next_id"],
+        "text": text,
+        "status": "•",
+        "notebook": notebooks[0],
+        "notebooks": list(notebooks),
+        "priority": 2,
+    }
+    assert storage.commit(data, "task_add", task=task)
+    return task["id"]
@@ -0,0 +1,63 @@
+from conftest import add_task, open_session
+from core import storage
+from core.records import to_persisted
+
+
+def _apply_session(data: dict) -> None:
+    """One of each kind of operation, as the screens issue them."""
+    first = add_task(data, "Write tests")
+    shared = add_task(data, "Shared", notebooks=("Today", "Work"))
+    storage.commit(data, "task_set", id=first, field="status", value="X")
+    storage.commit(data, "task_set", id=first, field="priority", value=1)
+    storage.commit(data, "task_set", id=first, field="text", value="Write more tests")
+    storage.commit(data, "task_set", id=shared, field="notebook", value="College")
+    storage.commit(
+        data, "task_set", id=first, field="notebooks", value=["Work", "Today"]
+    )
+    storage.commit(data, "notebook_add", name="Reading")
+    storage.commit(data, "notebook_select", name="Reading")
+    add_task(data, "Only here", notebooks=("Reading",))
+    storage.commit(data, "notebook_remove", name="Reading")
+    storage.commit(data, "task_delete", id=1)
+    storage.commit(data, "goal_add", kind="yearly", goal={"text": "New", "progress": 0})
+    storage.commit(data, "goal_set", kind="yearly", index=0, field="progress", value=90)
+    storage.commit(data, "goal_delete", kind="monthly", index=0)
+    storage.commit(data, "note_set", notebook="Today", text="a note")
+    storage.commit(data, "calendar_set", month="2026-03", day="4", status="complete")
+    storage.commit(data, "calendar_clear", month="2026-03", day="4")
+    storage.commit(data, "calendar_set", month="2026-03", day="5", status="partial")
+
+
+def test_json_and_sqlite_store_the_same_journal(journal_dir, monkeypatch):
+    persisted = {}
+    for name in ("json", "sqlite"):
+        # Separate directories: SQLite would import the JSON journal
+        (journal_dir / name).mkdir()
+        monkeypatch.chdir(journal_dir / name)
+        monkeypatch.setattr(storage, "STORAGE_BACKEND", name)
+        data, _ = open_session()
+        storage.save_data(data)
+        _apply_session(data)
+        storage.close_storage()
+        reloaded, _ = open_session()
+        persisted[name] = to_persisted(reloaded)
+        assert persisted[name] == to_persisted(data)
+        storage.close_storage()
+
+    for state in persisted.values():
+        state.pop("schema_version")
+    assert persisted["json"] == persisted["sqlite"]
+
+
+def test_reload_keeps_indexes_consistent(journal_dir, backend_name, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", backend_name)
+    data, _ = open_session()
+    storage.save_data(data)
+    _apply_session(data)
+    reloaded, _ = open_session()
+
+    tasks = reloaded["tasks"]
+    for notebook in reloaded["notebooks"]:
+        members = [t for t in tasks if notebook in t.notebooks]
+        assert tasks.stats(notebook) == (len(members), sum(t.done for t in members))
+    assert tasks.completed() == sum(t.done for t in tasks)
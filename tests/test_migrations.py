@@ -0,0 +1,74 @@
+import json
+from datetime import date
+
+from conftest import open_session
+from core.constants import DATA_FILE
+from core.migrations import SCHEMA_VERSION
+
+# A journal as written by the original (Portuguese) release: schema v0
+LEGACY = {
+    "cadernos": ["Hoje", "Trabalho"],
+    "caderno_ativo": "Hoje",
+    "tarefas": [
+        {"id": 1, "texto": "Beber água", "status": "X", "caderno": "Hoje"},
+        {
+            "id": 2,
+            "texto": "Relatório",
+            "status": "•",
+            "caderno": "Trabalho",
+            "prioridade": 1,
+        },
+    ],
+    "metas": {
+        "semanais": [{"texto": "Semana 1", "progresso": 10, "tipo": "semana_atual"}],
+        "mensais": [{"texto": "March - 31 days", "progresso": 5, "dias_total": 31}],
+        "anuais": [{"texto": "Ler 12 livros", "progresso": 50}],
+    },
+    "notas": {"Hoje": "nota"},
+    "atividades_diarias": {
+        "2024-01-02": {"atividades": {"Leitura": 2}, "nivel": 2},
+    },
+    "proximo_id": 3,
+}
+
+
+def test_v0_journal_is_upgraded_to_the_current_schema(journal_dir):
+    with open(DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(LEGACY, f)
+
+    data, _ = open_session()
+
+    assert data["schema_version"] == SCHEMA_VERSION
+    assert data["notebooks"] == ["Hoje", "Trabalho"]
+    assert data["active_notebook"] == "Hoje"
+    assert data["next_id"] == 3
+    report = data["tasks"].get(2)
+    assert (report.text, report.notebooks, report.priority) == (
+        "Relatório",
+        ("Trabalho",),
+        1,
+    )
+    assert data["tasks"].get(1).done
+    weekly = data["goals"]["weekly"][0]
+    assert (weekly.text, weekly.progress, weekly.type) == (
+        "Semana 1",
+        10,
+        "current_week",
+    )
+    monthly = data["goals"]["monthly"][0]
+    assert (monthly.year, monthly.month) == (date.today().year, 3)
+    assert monthly.extra == {"total_days": 31}
+    assert data["notes"]["Hoje"] == "nota"
+    assert data["calendar"] == {}
+    assert data["daily_activities"].get("2024-01-02").activities == {"Leitura": 2}
+
+
+def test_upgraded_journal_is_rewritten_once(journal_dir):
+    with open(DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(LEGACY, f)
+    open_session()
+
+    with open(DATA_FILE, encoding="utf-8") as f:
+        assert json.load(f)["schema_version"] == SCHEMA_VERSION
+    reloaded, _ = open_session()
+    assert [t.text for t in reloaded["tasks"]] == ["Beber água", "Relatório"]
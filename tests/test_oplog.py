@@ -0,0 +1,63 @@
+import pytest
+
+from conftest import add_task, open_session
+from core import json_backend, storage
+from core.constants import LOG_FILE
+from core.oplog import read_log
+from core.records import to_persisted
+
+
+def test_replay_restores_logged_operations(journal_dir):
+    data, _ = open_session()
+    storage.save_data(data)
+    task_id = add_task(data, "Write tests")
+    storage.commit(data, "task_set", id=task_id, field="status", value="X")
+    storage.commit(data, "note_set", notebook="Today", text="remember")
+    storage.commit(data, "goal_delete", kind="yearly", index=0)
+
+    assert len(read_log(LOG_FILE)) == 4
+    reloaded, _ = open_session()
+    assert to_persisted(reloaded) == to_persisted(data)
+
+
+def test_compaction_folds_the_log_into_the_snapshot(journal_dir, monkeypatch):
+    monkeypatch.setattr(json_backend, "LOG_COMPACT_THRESHOLD", 5)
+    data, _ = open_session()
+    storage.save_data(data)
+    for i in range(12):
+        add_task(data, f"task {i}")
+
+    assert len(read_log(LOG_FILE)) < 5
+    reloaded, _ = open_session()
+    assert to_persisted(reloaded) == to_persisted(data)
+    assert [t.text for t in reloaded["tasks"].in_notebook("Today")][-12:] == [
+        f"task {i}" for i in range(12)
+    ]
+
+
+def test_torn_last_line_is_dropped(journal_dir):
+    data, _ = open_session()
+    storage.save_data(data)
+    add_task(data, "kept")
+    with open(LOG_FILE, "ab") as f:
+        f.write(b'{"op": "task_add", "ta')  # a crash mid-append
+
+    reloaded, _ = open_session()
+    assert to_persisted(reloaded) == to_persisted(data)
+    add_task(reloaded, "after the crash")
+    assert len(read_log(LOG_FILE)) == 2
+
+
+def test_damaged_line_before_the_end_is_unreadable(journal_dir):
+    data, _ = open_session()
+    storage.save_data(data)
+    add_task(data, "first")
+    add_task(data, "second")
+    with open(LOG_FILE, "rb") as f:
+        lines = f.readlines()
+    with open(LOG_FILE, "wb") as f:
+        f.writelines([b"not json\n", *lines[1:]])
+
+    storage._backend = None
+    with pytest.raises(storage.JournalUnreadable):
+        storage.load_data()
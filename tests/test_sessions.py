@@ -0,0 +1,114 @@
+"""Two sessions sharing a journal, each with its own backend (as two processes)."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from conftest import add_task, open_session
+from core import storage
+from core.records import to_persisted
+
+
+@pytest.fixture
+def sessions(journal_dir, backend_name, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", backend_name)
+    data, _ = open_session()
+    storage.save_data(data)
+    storage.close_storage()
+    a, b = open_session(), open_session()
+    yield a, b
+    for _, backend in (a, b):
+        backend.close()
+    storage._backend = None
+
+
+@contextmanager
+def acting(session):
+    storage._backend = session[1]
+    yield session[0]
+
+
+def test_interleaved_adds_get_unique_ids(sessions):
+    a, b = sessions
+    for i in range(3):
+        with acting(a) as data:
+            add_task(data, f"A{i}")
+        with acting(b) as data:
+            add_task(data, f"B{i}")
+    with acting(a) as data:
+        storage.sync_data(data)
+
+    ids = [t.id for t in a[0]["tasks"]]
+    assert len(ids) == len(set(ids))
+    assert {t.text for t in a[0]["tasks"]} >= {"A0", "A1", "A2", "B0", "B1", "B2"}
+    assert to_persisted(a[0]) == to_persisted(open_session()[0])
+
+
+def test_goal_edit_follows_its_goal(sessions):
+    a, b = sessions
+    target = b[0]["goals"]["yearly"][1]
+    with acting(a) as data:
+        storage.commit(data, "goal_delete", kind="yearly", index=0)
+    with acting(b) as data:
+        storage.commit(
+            data, "goal_set", kind="yearly", index=1, field="progress", value=99
+        )
+
+    goals = open_session()[0]["goals"]["yearly"]
+    assert [(g.text, g.progress) for g in goals][0] == (target.text, 99)
+
+
+def test_edit_of_a_goal_deleted_elsewhere_is_discarded(sessions):
+    a, b = sessions
+    with acting(a) as data:
+        storage.commit(data, "goal_delete", kind="yearly", index=1)
+    with acting(b) as data:
+        with pytest.raises(storage.EditDiscarded):
+            storage.commit(
+                data, "goal_set", kind="yearly", index=1, field="text", value="x"
+            )
+
+
+def test_edit_of_a_task_deleted_elsewhere_is_discarded(sessions):
+    a, b = sessions
+    with acting(a) as data:
+        storage.commit(data, "task_delete", id=1)
+    with acting(b) as data:
+        with pytest.raises(storage.EditDiscarded):
+            storage.commit(data, "task_set", id=1, field="text", value="edited")
+
+    assert 1 not in open_session()[0]["tasks"]
+
+
+def test_task_added_to_a_removed_notebook_is_discarded(sessions):
+    a, b = sessions
+    with acting(a) as data:
+        storage.commit(data, "notebook_remove", name="Work")
+    with acting(b) as data:
+        with pytest.raises(storage.EditDiscarded):
+            add_task(data, "lost", notebooks=("Work",))
+        add_task(data, "kept", notebooks=("Work", "Today"))
+
+    kept = [t for t in open_session()[0]["tasks"] if t.text == "kept"]
+    assert [t.notebooks for t in kept] == [("Today",)]
+
+
+def test_write_behind_sessions_lose_nothing(journal_dir, backend_name, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", backend_name)
+    monkeypatch.setattr(storage, "WRITE_BEHIND", True)
+    monkeypatch.setattr(storage, "WRITE_BEHIND_MS", 10)
+    data, backend = open_session()
+    with backend.lock():
+        storage.save_data(data)
+    backend.close()
+    a, b = open_session(), open_session()
+    for i in range(5):
+        for name, session in (("A", a), ("B", b)):
+            with acting(session) as data:
+                add_task(data, f"{name}{i}")
+    for _, backend in (a, b):
+        backend.close()
+
+    tasks = list(open_session()[0]["tasks"])
+    assert len({t.id for t in tasks}) == len(tasks)
+    assert {f"{n}{i}" for n in "AB" for i in range(5)} <= {t.text for t in tasks}
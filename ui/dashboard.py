@@ -5,65 +5,71 @@ Main screen (dashboard): tasks + goals + heatmap.
 from datetime import datetime, timedelta
 
 from core.colors import Color
-from core.constants import TERMINAL_WIDTH
+from core.task_store import TaskStore
+from ui.layout import Layout, layout
+from ui.renderer import frame
 from ui.utils import (
-    clear_screen,
     date_header,
     create_progress_bar,
+    rule,
     get_priority_emoji,
     calculate_stats,
+    heat_legend,
+    HEAT_LEVELS,
     visual_len,
     truncate_text,
 )
 
+# Task pane rows per page
+PAGE_SIZE = 12
+
+_task_offsets: dict[str, int] = {}  # notebook → first task position shown
+
 
 def show_interface(data: dict) -> None:
-    clear_screen()
-    WIDTH = TERMINAL_WIDTH
+    lay = layout()
+    WIDTH = lay.width
     active_notebook = data["active_notebook"]
     tasks = data["tasks"]
     goals = data.get("goals", {"weekly": [], "monthly": [], "yearly": []})
 
-    print(date_header())
-    print(f"{Color.CYAN_B}{'━' * WIDTH}{Color.RESET}\n")
+    with frame():
+        print(date_header(WIDTH))
+        print(rule("━", Color.CYAN_B, WIDTH), end="\n\n")
 
-    _render_columns(tasks, goals, active_notebook)
-    _render_heatmap(data)
+        _render_columns(tasks, goals, active_notebook, lay)
+        _render_heatmap(data, WIDTH)
 
-    print(f"{Color.CYAN_B}{'━' * WIDTH}{Color.RESET}")
-    print(
-        f"{Color.BOLD}COMMANDS{Color.RESET} -> {Color.BOLD}C{Color.RESET} Notebooks menu  {Color.BOLD}Q{Color.RESET} Quit"
-    )
-    print(f"{Color.CYAN_B}{'━' * WIDTH}{Color.RESET}\n")
+        print(rule("━", Color.CYAN_B, WIDTH))
+        print(
+            f"{Color.BOLD}COMMANDS{Color.RESET} -> {Color.BOLD}C{Color.RESET} Notebooks menu  {Color.BOLD}Q{Color.RESET} Quit"
+        )
+        print(rule("━", Color.CYAN_B, WIDTH), end="\n\n")
 
 
-def _render_columns(tasks: list, goals: dict, active_notebook: str) -> None:
-    LEFT_WIDTH = 55
-    RIGHT_WIDTH = 43
+def _render_columns(
+    tasks: TaskStore, goals: dict, active_notebook: str, lay: Layout
+) -> None:
+    LEFT_WIDTH = lay.left
+    RIGHT_WIDTH = lay.right
 
     total, completed, progress = calculate_stats(tasks, active_notebook)
-    filtered_tasks = sorted(
-        [t for t in tasks if active_notebook in t.get("notebooks", [t["notebook"]])],
-        key=lambda x: (x["status"] == "X", -x.get("priority", 2)),
-    )
-    pending = [t for t in filtered_tasks if t["status"] != "X"]
-    completed_list = [t for t in filtered_tasks if t["status"] == "X"]
     weekly_goals = goals.get("weekly", [])
 
     # Headers
     print(
-        f"{Color.BOLD}✓ TASKS • {active_notebook.upper():<40}{Color.RESET}  {Color.BOLD}🎯 WEEKLY GOALS{Color.RESET}"
+        f"{Color.BOLD}✓ TASKS • {active_notebook.upper():<{LEFT_WIDTH - 15}}{Color.RESET}  {Color.BOLD}🎯 WEEKLY GOALS{Color.RESET}"
     )
     print(f"{Color.DIM}{'─' * LEFT_WIDTH}  {'─' * RIGHT_WIDTH}{Color.RESET}")
 
     # Progress bars
-    tasks_bar = create_progress_bar(progress, 35)
+    tasks_bar = create_progress_bar(progress, lay.task_bar)
     left_progress = f"  {tasks_bar} {Color.BOLD}{progress}%{Color.RESET} {Color.DIM}({completed}/{total}){Color.RESET}"
 
     if weekly_goals:
-        avg = int(sum(g.get("progress", 0) for g in weekly_goals) / len(weekly_goals))
+        avg = int(sum(g.progress for g in weekly_goals) / len(weekly_goals))
         right_progress = (
-            f"{create_progress_bar(avg, 25)} {Color.BOLD}{avg}%{Color.RESET}"
+            f"{create_progress_bar(avg, lay.goal_bar)} {Color.BOLD}{avg}%{Color.RESET}"
         )
     else:
         right_progress = f"{Color.DIM}No goals defined{Color.RESET}"
@@ -72,8 +78,8 @@ def _render_columns(tasks: list, goals: dict, active_notebook: str) -> None:
     print(f"{left_progress}{' ' * spaces}  {right_progress}\n")
 
     # Build lines
-    left_lines = _task_lines(pending, completed_list, active_notebook)
-    right_lines = _goal_lines(weekly_goals)
+    left_lines = _task_lines(tasks, active_notebook, total, completed, lay.task_text)
+    right_lines = _goal_lines(weekly_goals, lay)
 
     for i in range(max(len(left_lines), len(right_lines))):
         left = left_lines[i] if i < len(left_lines) else ""
@@ -85,77 +91,98 @@ def _render_columns(tasks: list, goals: dict, active_notebook: str) -> None:
     print(
         f"{Color.DIM}[+] Add  [X] Complete  [E] Edit  [D] Delete  [P] Priority  [M] Goals{Color.RESET}"
     )
-    print(f"{Color.BLUE}{'─' * TERMINAL_WIDTH}{Color.RESET}\n")
+    print(rule("─", Color.BLUE, lay.width), end="\n\n")
 
 
-def _task_lines(pending: list, completed_list: list, active_notebook: str) -> list:
-    lines = []
-    if not pending and not completed_list:
+def _task_lines(
+    tasks: TaskStore, active_notebook: str, total: int, completed: int, limit: int
+) -> list:
+    """One page of the notebook's tasks, pending first; only that page is built."""
+    if not total:
         return [
             f"{Color.DIM}No tasks yet{Color.RESET}",
             f"{Color.DIM}Use [+] to add one!{Color.RESET}",
         ]
 
-    if pending:
-        lines.append(f"{Color.YELLOW_B}⚡ PENDING{Color.RESET}")
-        for t in pending[:8]:
-            emoji, color = get_priority_emoji(t.get("priority", 2))
-            id_str = f"{color}#{t['id']:02d}{Color.RESET}"
-            text = truncate_text(t["text"], 35)
-            extras = [nb for nb in t.get("notebooks", []) if nb != active_notebook]
-            indicator = (
-                f" {Color.DIM}+{len(extras) if len(extras) > 1 else ''}{Color.RESET}"
-                if extras
-                else ""
-            )
-            lines.append(f"  {id_str} {emoji} {text}{indicator}")
-        if len(pending) > 8:
-            lines.append(
-                f"  {Color.DIM}... and {len(pending) - 8} more tasks{Color.RESET}"
-            )
-        lines.append("")
-
-    if completed_list:
-        lines.append(f"{Color.GREEN_B}✓ COMPLETED ({len(completed_list)}){Color.RESET}")
-        for t in completed_list[:3]:
-            emoji, color = get_priority_emoji(t.get("priority", 2))
-            id_str = f"{color}#{t['id']:02d}{Color.RESET}"
-            text = truncate_text(t["text"], 35)
+    start = _page_start(active_notebook, total)
+    window = tasks.ordered(active_notebook, start, start + PAGE_SIZE)
+    pending = total - completed
+    lines = []
+    for position, t in enumerate(window, start):
+        if position == start and position < pending:
+            lines.append(f"{Color.YELLOW_B}⚡ PENDING ({pending}){Color.RESET}")
+        if position == pending:
+            if lines:
+                lines.append("")
+            lines.append(f"{Color.GREEN_B}✓ COMPLETED ({completed}){Color.RESET}")
+
+        emoji, color = get_priority_emoji(t.priority)
+        id_str = f"{color}#{t.id:02d}{Color.RESET}"
+        text = truncate_text(t.text, limit)
+        if t.done:
             lines.append(f"  {id_str} {Color.DIM}✓ {text}{Color.RESET}")
-        if len(completed_list) > 3:
-            lines.append(
-                f"  {Color.DIM}... and {len(completed_list) - 3} more{Color.RESET}"
-            )
+            continue
+        extras = [nb for nb in t.notebooks if nb != active_notebook]
+        indicator = (
+            f" {Color.DIM}+{len(extras) if len(extras) > 1 else ''}{Color.RESET}"
+            if extras
+            else ""
+        )
+        lines.append(f"  {id_str} {emoji} {text}{indicator}")
 
+    if total > PAGE_SIZE:
+        lines.append("")
+        lines.append(
+            f"  {Color.DIM}{start + 1}-{start + len(window)} of {total}  "
+            f"[ ] Page{Color.RESET}"
+        )
     return lines
 
 
-def _goal_lines(weekly_goals: list) -> list:
+def _page_start(notebook: str, total: int) -> int:
+    """First position shown for a notebook, kept within its task count."""
+    last_page = (total - 1) // PAGE_SIZE * PAGE_SIZE
+    _task_offsets[notebook] = min(_task_offsets.get(notebook, 0), last_page)
+    return _task_offsets[notebook]
+
+
+def next_task_page(data: dict) -> None:
+    notebook = data["active_notebook"]
+    _task_offsets[notebook] = _task_offsets.get(notebook, 0) + PAGE_SIZE
+
+
+def previous_task_page(data: dict) -> None:
+    notebook = data["active_notebook"]
+    _task_offsets[notebook] = max(_task_offsets.get(notebook, 0) - PAGE_SIZE, 0)
+
+
+def _goal_lines(weekly_goals: list, lay: Layout) -> list:
     if not weekly_goals:
         return [f"{Color.DIM}Use [M] to create goals!{Color.RESET}"]
 
     lines = []
     for idx, goal in enumerate(weekly_goals[:6], 1):
-        prog = goal.get("progress", 0)
-        text = truncate_text(goal.get("text", ""), 35)
-        if goal.get("type") == "current_week":
+        prog = goal.progress
+        text = truncate_text(goal.text, lay.goal_text)
+        if goal.type == "current_week":
             text = f"{Color.CYAN_B}⭐ {text}{Color.RESET}"
         lines.append(f"{Color.BOLD}{idx}.{Color.RESET} {text}")
         lines.append(
-            f"   {create_progress_bar(prog, 25)} {Color.BOLD}{prog}%{Color.RESET}"
+            f"   {create_progress_bar(prog, lay.goal_bar)} {Color.BOLD}{prog}%{Color.RESET}"
         )
         lines.append("")
 
     return lines
 
 
-def _render_heatmap(data: dict) -> None:
+def _render_heatmap(data: dict, width: int) -> None:
     print(f"{Color.BOLD}🔥 ACTIVITY HEATMAP • CURRENT WEEK{Color.RESET}")
-    print(f"{Color.DIM}{'─' * TERMINAL_WIDTH}{Color.RESET}")
+    print(rule(width=width))
 
-    activities = data.get("daily_activities", {})
+    activities = data["daily_activities"]
     today = datetime.now()
     week_start = today - timedelta(days=today.weekday())
+    levels = activities.levels(week_start.date(), week_start.date() + timedelta(days=6))
     day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
     # Day names row
@@ -163,35 +190,21 @@ def _render_heatmap(data: dict) -> None:
     print(names_row)
 
     # Colored blocks row
-    LEVEL_CONFIG = [
-        (Color.DIM, "░"),
-        (Color.GREEN, "▓"),
-        (Color.GREEN_B, "▓"),
-        (Color.YELLOW_B, "▓"),
-        (Color.CYAN_B, "█"),
-    ]
     heat_row = "  "
     for i in range(7):
         day = week_start + timedelta(days=i)
-        key = day.strftime("%Y-%m-%d")
-        level = activities.get(key, {}).get("level", 0)
-        color, char = LEVEL_CONFIG[min(level, 4)]
+        color, char = HEAT_LEVELS[min(levels[i], 4)]
         if day.date() == today.date():
             heat_row += f"{Color.BG_BLUE}{Color.WHITE} {char * 3} {Color.RESET} "
         else:
             heat_row += f"{color}{char * 5}{Color.RESET} "
     print(heat_row)
 
-    print(
-        f"\n  {Color.DIM}░░{Color.RESET} None  "
-        f"{Color.GREEN}▓▓{Color.RESET} Low  "
-        f"{Color.GREEN_B}▓▓{Color.RESET} Medium  "
-        f"{Color.YELLOW_B}▓▓{Color.RESET} High  "
-        f"{Color.CYAN_B}██{Color.RESET} Excellent"
-    )
+    print(f"\n  {heat_legend()}")
 
     today_key = today.strftime("%Y-%m-%d")
-    today_total = sum(activities.get(today_key, {}).get("activities", {}).values())
+    today_record = activities.get(today_key)
+    today_total = today_record.total if today_record else 0
     if today_total > 0:
         print(
             f"\n  {Color.CYAN_B}📊 Today: {today_total} activity/activities logged{Color.RESET}"
@@ -200,5 +213,7 @@ def _render_heatmap(data: dict) -> None:
         print(f"\n  {Color.DIM}💭 No activities logged today yet{Color.RESET}")
 
     print()
-    print(f"{Color.DIM}[H] Heatmap  [S] Statistics  [A] Notes{Color.RESET}")
-    print(f"{Color.BLUE}{'─' * TERMINAL_WIDTH}{Color.RESET}\n")
+    print(
+        f"{Color.DIM}[H] Heatmap  [Y] Yearly heatmap  [S] Statistics  [A] Notes  [/] Search{Color.RESET}"
+    )
+    print(rule("─", Color.BLUE, width), end="\n\n")
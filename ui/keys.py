@@ -0,0 +1,145 @@
+"""
+Single-keystroke input.
+Menus read one key at a time with the terminal in cbreak mode (no Enter, no
+echo), entered only while a key is awaited so line prompts keep working.
+Keys are read one at a time, so anything typed ahead stays queued for the
+next reader. Without a terminal (pipes, Windows, tests) keys are read as
+lines with input(), as before.
+"""
+
+import codecs
+import os
+import selectors
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+from core.colors import Color
+from ui.layout import resized
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = tty = None
+
+PROMPT = f"{Color.CYAN}❯{Color.RESET} "
+ESCAPE_WAIT = 0.05  # seconds to wait for the rest of an escape sequence
+IDLE_POLL = 0.25  # seconds between clock, resize and journal checks while idle
+
+# Escape sequences of the keys menus use, mapped to the names they accept
+_SEQUENCES = {
+    "\033[A": "↑",
+    "\033[B": "↓",
+    "\033[C": "→",
+    "\033[D": "←",
+    "\033OC": "→",
+    "\033OD": "←",
+}
+
+
+def interactive() -> bool:
+    """True when keys can be read one at a time."""
+    return termios is not None and sys.stdin.isatty()
+
+
+@contextmanager
+def cbreak():
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    # TCSANOW: switching with the default TCSAFLUSH would drop typed-ahead keys
+    tty.setcbreak(fd, termios.TCSANOW)
+    try:
+        yield fd
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, saved)
+
+
+def key_pending() -> bool:
+    """True if a key has been typed and not read yet."""
+    return interactive() and _wait(sys.stdin.fileno(), 0)
+
+
+def read_key(timeout: float | None = None) -> str | None:
+    """
+    Next key, lowercased: a character, an arrow ("←", "→", "↑", "↓") or ""
+    for Enter. None if `timeout` seconds pass without one.
+    """
+    if not interactive():
+        return input().lower().strip()
+    with cbreak() as fd:
+        if not _wait(fd, timeout):
+            return None
+        key = _read_char(fd)
+        if key == "\033":
+            while len(key) < 3 and _wait(fd, ESCAPE_WAIT):
+                key += _read_char(fd)
+            return _SEQUENCES.get(key, "\033")
+    if key == "\x04":
+        raise EOFError
+    return "" if key in ("\r", "\n") else key.lower()
+
+
+def prompt_key(prompt: str = PROMPT, on_idle=None, changed=None) -> str:
+    """
+    Shows `prompt` and returns the key pressed (echoed). While waiting,
+    on_idle() runs when the minute changes (e.g. to redraw a clock), the
+    terminal is resized or changed() returns True; it usually redraws the
+    screen, so the prompt is shown again after it.
+    """
+    if not interactive():
+        return input(prompt).lower().strip()
+    minute = datetime.now().minute
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while True:
+        key = read_key(IDLE_POLL if on_idle else None)
+        if key is not None:
+            sys.stdout.write(f"{key}\n")
+            return key
+        if (
+            resized()
+            or datetime.now().minute != minute
+            or (changed is not None and changed())
+        ):
+            minute = datetime.now().minute
+            on_idle()
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+
+
+def pause(message: str = "Press any key...") -> None:
+    """Waits for any key (Enter without a terminal)."""
+    if not interactive():
+        input(f"{Color.DIM}{message}{Color.RESET}")
+        return
+    prompt_key(f"{Color.DIM}{message}{Color.RESET}")
+
+
+def complete_number(first: str, limit: int, label: str) -> int:
+    """
+    A number up to `limit` whose first digit was read as a key: when more
+    digits could follow, the rest is read as a line after `label`.
+    """
+    if not interactive() or int(first) * 10 > limit:
+        return int(first)
+    rest = input(f"{label} {first}").strip()
+    return int(first + rest) if rest.isdigit() else int(first)
+
+
+def _wait(fd: int, timeout: float | None) -> bool:
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        return bool(selector.select(timeout))
+
+
+def _read_char(fd: int) -> str:
+    """One character, reading as many bytes as its UTF-8 encoding takes."""
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    while True:
+        byte = os.read(fd, 1)
+        if not byte:
+            return "\x04"  # end of input
+        char = decoder.decode(byte)
+        if char:
+            return char
@@ -0,0 +1,99 @@
+"""
+Screen layout derived from the terminal size.
+Column widths, card counts and text limits are computed once per terminal
+size and cached; SIGWINCH marks the cache stale, so between resizes a
+render reads the layout without querying the terminal. Without a terminal
+the layout is the one for TERMINAL_WIDTH columns.
+"""
+
+import shutil
+import signal
+from typing import NamedTuple
+
+from core.constants import TERMINAL_WIDTH
+
+MIN_WIDTH = 60
+MAX_WIDTH = 160  # wider terminals get margins rather than longer lines
+NARROW_WIDTH = 80  # single-column screens (notes, heatmaps, search)
+CARD_WIDTH = 26  # inside a notebook card's borders
+CARD_GAP = 4
+GUTTER = 2  # between the dashboard columns
+
+
+class Layout(NamedTuple):
+    width: int  # full-width rules and headers
+    narrow: int
+    left: int  # dashboard task column
+    right: int  # dashboard goals column
+    task_bar: int  # dashboard progress bars
+    goal_bar: int
+    task_text: int  # dashboard text truncation
+    goal_text: int
+    cards_per_row: int
+    card_width: int
+    stats_bar: int
+
+
+_layout: Layout | None = None
+_columns = 0
+_stale = True
+_hooks: list = []
+
+
+def layout() -> Layout:
+    """The layout for the current terminal size, recomputed only after a resize."""
+    global _layout, _columns, _stale
+    if _stale or _layout is None:
+        _stale = not _watching
+        columns = shutil.get_terminal_size((TERMINAL_WIDTH, 24)).columns
+        if columns != _columns or _layout is None:
+            changed = _layout is not None
+            _layout, _columns = compute_layout(columns), columns
+            if changed:
+                for hook in _hooks:
+                    hook()
+    return _layout
+
+
+def resized() -> bool:
+    """True if the terminal was resized since the layout was last computed."""
+    if _watching:
+        return _stale
+    return shutil.get_terminal_size((TERMINAL_WIDTH, 24)).columns != _columns
+
+
+def on_change(hook) -> None:
+    """Registers a callable run when the layout is recomputed for a new size."""
+    _hooks.append(hook)
+
+
+def compute_layout(columns: int) -> Layout:
+    width = min(max(columns, MIN_WIDTH), MAX_WIDTH)
+    right = round(width * 0.43)
+    left = width - GUTTER - right
+    cards = max(1, (width - 2 + CARD_GAP) // (CARD_WIDTH + 2 + CARD_GAP))
+    return Layout(
+        width=width,
+        narrow=min(width, NARROW_WIDTH),
+        left=left,
+        right=right,
+        task_bar=max(left - 20, 10),
+        goal_bar=max(right - 18, 8),
+        task_text=max(left - 20, 10),
+        goal_text=right - 8,
+        cards_per_row=cards,
+        card_width=min(CARD_WIDTH, width - 4),
+        stats_bar=max(min(40, width - 60), 10),
+    )
+
+
+def _on_winch(signum, frame) -> None:
+    global _stale
+    _stale = True
+
+
+try:
+    signal.signal(signal.SIGWINCH, _on_winch)
+    _watching = True
+except (AttributeError, ValueError):  # no SIGWINCH (Windows) or not the main thread
+    _watching = False
@@ -3,45 +3,58 @@ Notebook selection screen with card layout.
 """
 
 from core.colors import Color
-from core.constants import TERMINAL_WIDTH, NOTEBOOK_EMOJIS, NOTEBOOK_COLORS
+from core.constants import NOTEBOOK_EMOJIS, NOTEBOOK_COLORS
+from core.task_store import TaskStore
+from ui.layout import CARD_WIDTH, layout
+from ui.renderer import frame
 from ui.utils import (
-    clear_screen,
     date_header,
     create_progress_bar,
+    fragment,
+    rule,
     calculate_stats,
     visual_len,
 )
 
 
 def show_notebook_selection(data: dict) -> None:
-    clear_screen()
-    WIDTH = TERMINAL_WIDTH
+    lay = layout()
+    WIDTH = lay.width
 
-    print(date_header())
-    print(f"{Color.CYAN_B}{'━' * WIDTH}{Color.RESET}\n")
-    print(f"{Color.BOLD}📚 CHOOSE YOUR NOTEBOOK{Color.RESET}")
-    print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}\n")
+    with frame():
+        print(date_header(WIDTH))
+        print(rule("━", Color.CYAN_B, WIDTH), end="\n\n")
+        print(f"{Color.BOLD}📚 CHOOSE YOUR NOTEBOOK{Color.RESET}")
+        print(rule(width=WIDTH), end="\n\n")
 
-    _render_cards(data["notebooks"], data["tasks"])
+        _render_cards(
+            data["notebooks"], data["tasks"], lay.cards_per_row, lay.card_width
+        )
 
-    print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}")
-    print(f"{Color.BOLD}COMMANDS:{Color.RESET}")
-    print(f"  {Color.BOLD}1-{len(data['notebooks'])}{Color.RESET} Select notebook")
-    print(
-        f"  {Color.BOLD}[N]{Color.RESET} New notebook  {Color.BOLD}[R]{Color.RESET} Remove notebook  {Color.BOLD}[Q]{Color.RESET} Quit"
-    )
-    print(f"{Color.DIM}{'─' * WIDTH}{Color.RESET}\n")
+        print(rule(width=WIDTH))
+        print(f"{Color.BOLD}COMMANDS:{Color.RESET}")
+        print(f"  {Color.BOLD}1-{len(data['notebooks'])}{Color.RESET} Select notebook")
+        print(
+            f"  {Color.BOLD}[N]{Color.RESET} New notebook  {Color.BOLD}[R]{Color.RESET} Remove notebook  {Color.BOLD}[Q]{Color.RESET} Quit"
+        )
+        print(rule(width=WIDTH), end="\n\n")
 
 
-def _render_cards(notebooks: list, tasks: list, cards_per_row: int = 3) -> None:
+def _render_cards(
+    notebooks: list,
+    tasks: TaskStore,
+    cards_per_row: int = 3,
+    inner_width: int = CARD_WIDTH,
+) -> None:
     for i in range(0, len(notebooks), cards_per_row):
         row = notebooks[i : i + cards_per_row]
-        _card_row(row, i, tasks)
+        _card_row(row, i, tasks, inner_width)
         print()
 
 
-def _card_row(notebooks_row: list, offset: int, tasks: list) -> None:
-    inner_width = 26  # Adjusted for best fit in 3 columns
+def _card_row(
+    notebooks_row: list, offset: int, tasks: TaskStore, inner_width: int
+) -> None:
     reset = Color.RESET
 
     cards_data = []
@@ -70,29 +83,19 @@ def _card_row(notebooks_row: list, offset: int, tasks: list) -> None:
         print("  " + "    ".join(content_list))
 
     # 1. Top with rounded corners
-    print_row([f"{c['color']}╭{'─' * inner_width}╮{reset}" for c in cards_data])
+    print_row([_card_edge(c["color"], "╭", "╮", inner_width) for c in cards_data])
 
     # 2. Title (highlighted ID + Name)
     titles = []
     for c in cards_data:
         id_str = f"{Color.BOLD}{c['color']}{c['id']}.{reset}"
         text = f" {id_str} {c['emoji']} {Color.BOLD}{c['name']}{reset}"
-        spaces = (
-            inner_width
-            - (
-                visual_len(c["id"])
-                + 2
-                + visual_len(c["emoji"])
-                + 1
-                + visual_len(c["name"])
-            )
-            - 2
-        )
+        spaces = inner_width - visual_len(text)
         titles.append(f"{c['color']}│{reset}{text}{' ' * spaces}{c['color']}│{reset}")
     print_row(titles)
 
     # 3. Subtle separator
-    print_row([f"{c['color']}├{'─' * inner_width}┤{reset}" for c in cards_data])
+    print_row([_card_edge(c["color"], "├", "┤", inner_width) for c in cards_data])
 
     # 4. Task info (compact and clean)
     stats_row = []
@@ -108,11 +111,16 @@ def _card_row(notebooks_row: list, offset: int, tasks: list) -> None:
     bars = []
     for c in cards_data:
         prog = c["stats"][2]
-        bar_str = create_progress_bar(prog, 14)
+        bar_str = create_progress_bar(prog, inner_width - 12)
         txt_prog = f"  {bar_str} {c['prog_color']}{prog:>3}%{reset} "
         pad = inner_width - visual_len(f"  {bar_str} {prog:>3}% ")
         bars.append(f"{c['color']}│{reset}{txt_prog}{' ' * pad}{c['color']}│{reset}")
     print_row(bars)
 
     # 6. Footer
-    print_row([f"{c['color']}╰{'─' * inner_width}╯{reset}" for c in cards_data])
+    print_row([_card_edge(c["color"], "╰", "╯", inner_width) for c in cards_data])
+
+
+@fragment
+def _card_edge(color: str, left: str, right: str, inner_width: int) -> str:
+    return f"{color}{left}{'─' * inner_width}{right}{Color.RESET}"
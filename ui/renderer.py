@@ -0,0 +1,88 @@
+"""
+Differential terminal renderer.
+Screens print into an in-memory frame; only the lines that changed since the
+previous frame are emitted, with cursor positioning, in a single write.
+Below a frame, a scroll region holds what is printed after it (prompts,
+feedback), so however much that is, the frame's rows never scroll.
+"""
+
+import atexit
+import io
+import shutil
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+# Also resets the scroll region (which homes the cursor)
+CLEAR = "\033[r\033[H\033[2J\033[3J"
+
+
+class FrameRenderer:
+    def __init__(self):
+        self._previous: list[str] = []
+        self._size = (0, 0)  # terminal size of the previous frame
+        self._region = False  # a scroll region is set below the frame
+
+    def invalidate(self) -> None:
+        """Forces the next frame to be drawn from scratch."""
+        self._previous = []
+
+    def render(self, text: str) -> None:
+        stream = sys.stdout
+        if not stream.isatty():
+            stream.write(text)
+            stream.flush()
+            return
+
+        lines = text.split("\n")
+        size = shutil.get_terminal_size()
+        if size != self._size:
+            # The terminal rewraps what is on screen; start from a clean one
+            self._previous = []
+            self._size = size
+        rows = size.lines
+        if len(lines) >= rows:
+            # Taller than the screen: it scrolls by itself, so no row stays put
+            stream.write(CLEAR + text)
+            stream.flush()
+            self._previous, self._region = [], False
+            return
+
+        if not self._previous:
+            out = CLEAR + "".join(f"{line}\n" for line in lines[:-1])
+        else:
+            out = "".join(
+                f"\033[{row};1H{line}\033[K"
+                for row, line in enumerate(lines[:-1], 1)
+                if row > len(self._previous) or self._previous[row - 1] != line
+            )
+        # Scroll only the rows from the frame's last line down, then park the
+        # cursor there and wipe whatever was printed below the frame.
+        out += f"\033[{len(lines)};{rows}r\033[{len(lines)};1H{lines[-1]}\033[J"
+
+        stream.write(out)
+        stream.flush()
+        self._previous, self._region = lines, True
+
+    def reset(self) -> None:
+        """Gives the whole screen back to scrolling, leaving the cursor where it is."""
+        if self._region:
+            sys.stdout.write("\0337\033[r\0338")
+            sys.stdout.flush()
+            self._region = False
+
+
+_renderer = FrameRenderer()
+atexit.register(_renderer.reset)
+
+
+@contextmanager
+def frame():
+    """Captures everything printed inside the block as one screen frame."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        yield
+    _renderer.render(buffer.getvalue())
+
+
+def invalidate() -> None:
+    _renderer.invalidate()
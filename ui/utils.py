@@ -2,50 +2,80 @@
 UI utilities: reusable rendering functions.
 """
 
-import os
 import re
+import sys
+import unicodedata
 from datetime import datetime
+from functools import lru_cache
 
 from core.colors import Color
 from core.constants import DAYS_EN, TERMINAL_WIDTH
-
+from core.task_store import TaskStore
+from ui.keys import pause
+from ui.layout import on_change
+from ui.renderer import CLEAR, invalidate
 
 # ─── Visual helpers ──────────────────────────────────────────────────────────
 
 
+_ANSI = re.compile(r"\033\[[0-9;]*m")
+# Runs of characters known to take one column (Latin, punctuation, arrows,
+# box drawing, blocks, shapes, ✓ ✗); only what is left is measured one by one
+_NARROW = re.compile(
+    "[\x20-\x7e\xa0-\xac\xae-\u02ff\u2010-\u2027\u2030-\u205e"
+    "\u2190-\u21ff\u2500-\u25fc\u2713\u2717]+"
+)
+_ZWJ = "\u200d"  # joins emoji into one glyph
+_EMOJI_STYLE = "\ufe0f"  # widens the narrow symbol before it (❤️)
+
+
+@lru_cache(maxsize=4096)
 def visual_len(text: str) -> int:
-    """Text length ignoring ANSI escape codes."""
-    return len(re.sub(r"\033\[[0-9;]+m", "", text))
+    """
+    Terminal columns taken by text, ignoring ANSI escape codes. Wide (East
+    Asian and emoji) characters take two columns; combining marks and
+    characters joined by a zero-width joiner take none. Bars, headers and
+    task lines repeat across frames, so results are cached.
+    """
+    if "\033" in text:
+        text = _ANSI.sub("", text)
+    if text.isascii():
+        return len(text)
+    if _EMOJI_STYLE not in text:
+        rest = _NARROW.sub("", text)
+        return len(text) - len(rest) + _measure(rest)
+    return _measure(text)
+
+
+def _measure(text: str) -> int:
+    width, previous = 0, ""
+    for char in text:
+        if char == _EMOJI_STYLE and previous and _char_width(previous) == 1:
+            width += 1
+        elif previous != _ZWJ:
+            width += _char_width(char)
+        previous = char
+    return width
+
+
+@lru_cache(maxsize=1024)
+def _char_width(char: str) -> int:
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0  # combining marks, variation selectors, joiners
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
 
 
 def clear_screen() -> None:
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clears the terminal with an escape sequence (no shell spawn)."""
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
+    invalidate()
 
 
 def date_header(width: int = TERMINAL_WIDTH) -> str:
     """Returns formatted date/time line for the header."""
     now = datetime.now()
-    weekday = DAYS_EN.get(now.strftime("%A"), now.strftime("%A"))
-    date = now.strftime("%m/%d/%Y")
-    time = now.strftime("%H:%M")
-    return f"{Color.DIM}{f'{weekday} • {date} • {time}'.center(width)}{Color.RESET}"
-
-
-def create_progress_bar(progress: int, width: int = 20) -> str:
-    """Creates a colored progress bar with Unicode blocks."""
-    num_blocks = int(progress / 100 * width)
-
-    if progress >= 80:
-        color = Color.GREEN_B
-    elif progress >= 50:
-        color = Color.YELLOW_B
-    elif progress > 0:
-        color = Color.RED_B
-    else:
-        color = Color.DIM
-
-    bar = f"{color}{'█' * num_blocks}{Color.RESET}{Color.DIM}{'░' * (width - num_blocks)}{Color.RESET}"
-    return bar
+    return _date_line(now.strftime("%A|%m/%d/%Y|%H:%M"), width)
 
 
 def get_priority_emoji(priority: int) -> tuple[str, str]:
@@ -72,25 +102,113 @@ def show_feedback(message: str, feedback_type: str = "success") -> None:
     icon = icons.get(feedback_type, "•")
 
     print(f"\n{color}{icon} {message}{Color.RESET}")
-    input(f"{Color.DIM}Press ENTER...{Color.RESET}")
+    pause()
+
+
+# ─── Fragment cache ──────────────────────────────────────────────────────────
+# Bars, rules and headers are the same from one render to the next; they are
+# built once per argument set and shared. Caches are dropped when the
+# layout changes with the terminal size (see ui.layout).
+
+_fragments: list = []
+
+
+def fragment(fn):
+    """Memoizes a function returning a rendered fragment (cleared on resize)."""
+    cached = lru_cache(maxsize=1024)(fn)
+    _fragments.append(cached)
+    return cached
+
+
+def clear_fragments() -> None:
+    for cached in _fragments:
+        cached.cache_clear()
+
+
+on_change(clear_fragments)
+
+
+@fragment
+def create_progress_bar(progress: int, width: int = 20) -> str:
+    """Creates a colored progress bar with Unicode blocks."""
+    num_blocks = int(progress / 100 * width)
+
+    if progress >= 80:
+        color = Color.GREEN_B
+    elif progress >= 50:
+        color = Color.YELLOW_B
+    elif progress > 0:
+        color = Color.RED_B
+    else:
+        color = Color.DIM
+
+    bar = f"{color}{'█' * num_blocks}{Color.RESET}{Color.DIM}{'░' * (width - num_blocks)}{Color.RESET}"
+    return bar
+
+
+@fragment
+def rule(char: str = "─", color: str = Color.DIM, width: int = TERMINAL_WIDTH) -> str:
+    """A colored horizontal line."""
+    return f"{color}{char * width}{Color.RESET}"
+
+
+@fragment
+def banner(text: str, color: str, width: int = TERMINAL_WIDTH) -> str:
+    """Bold colored title centered between two rules of `color`."""
+    return (
+        f"{rule('━', color, width)}\n"
+        f"{Color.BOLD}{color}{text.center(width)}{Color.RESET}\n"
+        f"{rule('━', color, width)}"
+    )
+
+
+@fragment
+def _date_line(stamp: str, width: int) -> str:
+    weekday, date, time = stamp.split("|")
+    weekday = DAYS_EN.get(weekday, weekday)
+    return f"{Color.DIM}{f'{weekday} • {date} • {time}'.center(width)}{Color.RESET}"
+
+
+# Heatmap cell (color, block) by activity level
+HEAT_LEVELS = [
+    (Color.DIM, "░"),
+    (Color.GREEN, "▓"),
+    (Color.GREEN_B, "▓"),
+    (Color.YELLOW_B, "▓"),
+    (Color.CYAN_B, "█"),
+]
+
+
+@fragment
+def heat_legend() -> str:
+    return (
+        f"{Color.DIM}░░{Color.RESET} None  "
+        f"{Color.GREEN}▓▓{Color.RESET} Low  "
+        f"{Color.GREEN_B}▓▓{Color.RESET} Medium  "
+        f"{Color.YELLOW_B}▓▓{Color.RESET} High  "
+        f"{Color.CYAN_B}██{Color.RESET} Excellent"
+    )
 
 
 # ─── Task helpers ────────────────────────────────────────────────────────────
 
 
-def calculate_stats(tasks: list, notebook: str) -> tuple[int, int, int]:
+def calculate_stats(tasks: TaskStore, notebook: str) -> tuple[int, int, int]:
     """Returns (total, completed, progress%) for tasks in a notebook."""
-    notebook_tasks = [
-        t for t in tasks if notebook in t.get("notebooks", [t["notebook"]])
-    ]
-    total = len(notebook_tasks)
-    completed = sum(1 for t in notebook_tasks if t["status"] == "X")
+    total, completed = tasks.stats(notebook)
     progress = int(completed / total * 100) if total > 0 else 0
     return total, completed, progress
 
 
 def truncate_text(text: str, limit: int) -> str:
     """Truncates text to visual limit, adding '...' if needed."""
-    if visual_len(text) > limit:
+    if visual_len(text) <= limit:
+        return text
+    if text.isascii():
         return text[: limit - 3] + "..."
-    return text
+    width, end = 0, 0
+    for end, char in enumerate(text):
+        width += _char_width(char)
+        if width > limit - 3:
+            break
+    return text[:end] + "..."